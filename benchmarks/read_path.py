@@ -0,0 +1,99 @@
+"""
+Benchmark of the list read paths of BaseCRUD at 10k rows.
+
+Compares loading Book entities through the ORM with reading the BookPublic
+columns as Core rows (BaseCRUD.read_rows), both alone and followed by the
+JSON encoding of GET /book/.
+
+Run with:
+
+    PYTHONPATH=src:. python benchmarks/read_path.py [rows]
+"""
+
+import asyncio
+import sys
+from time import perf_counter
+
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from maddr_api.models.account import table_registry
+from maddr_api.models.author import Author
+from maddr_api.models.book import Book
+from maddr_api.schemas.book import BookPublic
+from maddr_api.services.book import BookService
+from maddr_api.utils.serialization import encode_list, encode_rows
+
+
+async def measure(function, repeat: int = 5) -> float:
+    """
+    Best wall time of repeat runs, in milliseconds.
+    """
+
+    timings = []
+
+    for _ in range(repeat):
+        started = perf_counter()
+        await function()
+        timings.append((perf_counter() - started) * 1000)
+
+    return min(timings)
+
+
+async def main(rows: int = 10_000) -> None:
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:", poolclass=StaticPool
+    )
+
+    async with engine.begin() as conn:
+        await conn.run_sync(table_registry.metadata.create_all)
+        await conn.execute(insert(Author), [{"name": "author"}])
+        await conn.execute(
+            insert(Book),
+            [
+                {
+                    "author_id": 1,
+                    "title": f"book number {index}",
+                    "publish_year": 1900 + index % 120,
+                }
+                for index in range(rows)
+            ],
+        )
+
+    fields = list(BookPublic.model_fields)
+
+    async def orm_rows():
+        async with AsyncSession(engine) as session:
+            return (await session.scalars(select(Book))).all()
+
+    async def core_rows():
+        async with AsyncSession(engine) as session:
+            service = BookService(session)
+
+            return await service.read_rows(service.select_fields(fields))
+
+    async def orm_response():
+        return encode_list(await orm_rows(), BookPublic)
+
+    async def core_response():
+        return encode_rows(await core_rows(), fields)
+
+    print(f"{rows} books, best of 5 runs")
+
+    for name, orm, core in (
+        ("fetch", orm_rows, core_rows),
+        ("fetch + encode", orm_response, core_response),
+    ):
+        orm_ms = await measure(orm)
+        core_ms = await measure(core)
+        print(
+            f"{name:15} ORM {orm_ms:8.1f} ms   Core rows {core_ms:8.1f} ms"
+            f"   {orm_ms / core_ms:5.2f}x"
+        )
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000))
@@ -0,0 +1,85 @@
+"""
+Micro-benchmark of the JSON serialization of a page of books.
+
+Compares FastAPI's response_model path (validate the ORM objects, dump
+them to Python and encode with the default JSONResponse) with the cached
+TypeAdapter and the direct row encoding used by GET /book/.
+
+Run with:
+
+    PYTHONPATH=src:. python benchmarks/serialization.py [rows]
+"""
+
+import asyncio
+import sys
+import timeit
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute, serialize_response
+
+from maddr_api.app import app
+from maddr_api.models.book import Book
+from maddr_api.schemas.book import BookPublic
+from maddr_api.utils.serialization import encode_list, encode_rows
+
+
+def build_books(rows: int) -> list[Book]:
+    books = []
+
+    for index in range(rows):
+        book = Book(
+            author_id=index % 50 + 1,
+            title=f"book number {index}",
+            publish_year=1900 + index % 120,
+        )
+        book.id = index + 1
+        books.append(book)
+
+    return books
+
+
+def main(rows: int = 500, number: int = 200) -> None:
+    books = build_books(rows)
+    route = next(
+        route
+        for route in app.routes
+        if isinstance(route, APIRoute)
+        and route.path == "/book/"
+        and "GET" in route.methods
+    )
+
+    loop = asyncio.new_event_loop()
+
+    def response_model_path() -> bytes:
+        content = loop.run_until_complete(
+            serialize_response(
+                field=route.response_field, response_content=books
+            )
+        )
+
+        return JSONResponse(content).body
+
+    candidates = {
+        "response_model + JSONResponse": response_model_path,
+        "cached TypeAdapter (encode_list)": lambda: encode_list(
+            books, BookPublic
+        ),
+        "direct rows (encode_rows)": lambda: encode_rows(
+            books, BookPublic.model_fields
+        ),
+    }
+
+    baseline = None
+    print(f"{rows} books, best of 5 x {number} runs")
+
+    for name, function in candidates.items():
+        seconds = min(timeit.repeat(function, number=number, repeat=5))
+        per_call = seconds / number * 1000
+        baseline = baseline or per_call
+        print(f"{name:34} {per_call:8.3f} ms  {baseline / per_call:5.2f}x")
+
+    loop.close()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500)
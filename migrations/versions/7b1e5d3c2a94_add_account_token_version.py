@@ -0,0 +1,38 @@
+"""add account token version
+
+Revision ID: 7b1e5d3c2a94
+Revises: 4d2f7c9a1e03
+Create Date: 2026-10-18 10:02:11.530927
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "7b1e5d3c2a94"
+down_revision: Union[str, Sequence[str], None] = "4d2f7c9a1e03"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table("account", schema=None) as batch_op:
+        batch_op.add_column(
+            sa.Column(
+                "token_version",
+                sa.Integer(),
+                server_default="0",
+                nullable=False,
+            )
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table("account", schema=None) as batch_op:
+        batch_op.drop_column("token_version")
@@ -0,0 +1,38 @@
+"""add refresh token version
+
+Revision ID: a6d3f8c1e2b7
+Revises: f2c7a9b3d8e1
+Create Date: 2026-10-18 18:12:40.215384
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a6d3f8c1e2b7"
+down_revision: Union[str, Sequence[str], None] = "f2c7a9b3d8e1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table("refresh_token", schema=None) as batch_op:
+        batch_op.add_column(
+            sa.Column(
+                "token_version",
+                sa.Integer(),
+                server_default="0",
+                nullable=False,
+            )
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table("refresh_token", schema=None) as batch_op:
+        batch_op.drop_column("token_version")
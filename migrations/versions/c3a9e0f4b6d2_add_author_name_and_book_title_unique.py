@@ -0,0 +1,36 @@
+"""add author name and book title unique constraints
+
+Revision ID: c3a9e0f4b6d2
+Revises: 7b1e5d3c2a94
+Create Date: 2026-10-18 11:20:47.604318
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c3a9e0f4b6d2"
+down_revision: Union[str, Sequence[str], None] = "7b1e5d3c2a94"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table("author", schema=None) as batch_op:
+        batch_op.create_unique_constraint("uq_author_name", ["name"])
+
+    with op.batch_alter_table("book", schema=None) as batch_op:
+        batch_op.create_unique_constraint("uq_book_title", ["title"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table("book", schema=None) as batch_op:
+        batch_op.drop_constraint("uq_book_title", type_="unique")
+
+    with op.batch_alter_table("author", schema=None) as batch_op:
+        batch_op.drop_constraint("uq_author_name", type_="unique")
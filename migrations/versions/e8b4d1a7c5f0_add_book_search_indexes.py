@@ -0,0 +1,37 @@
+"""add book author_id and publish_year indexes
+
+Revision ID: e8b4d1a7c5f0
+Revises: c3a9e0f4b6d2
+Create Date: 2026-10-18 12:05:13.218904
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e8b4d1a7c5f0"
+down_revision: Union[str, Sequence[str], None] = "c3a9e0f4b6d2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        op.f("ix_book_author_id"), "book", ["author_id"], unique=False
+    )
+    op.create_index(
+        "ix_book_publish_year_id",
+        "book",
+        ["publish_year", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_book_publish_year_id", table_name="book")
+    op.drop_index(op.f("ix_book_author_id"), table_name="book")
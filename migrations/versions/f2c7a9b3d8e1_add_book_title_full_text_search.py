@@ -0,0 +1,76 @@
+"""add book title full-text search
+
+Revision ID: f2c7a9b3d8e1
+Revises: e8b4d1a7c5f0
+Create Date: 2026-10-18 12:48:36.571022
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f2c7a9b3d8e1"
+down_revision: Union[str, Sequence[str], None] = "e8b4d1a7c5f0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+SQLITE_UPGRADE = [
+    "CREATE VIRTUAL TABLE book_fts USING fts5(title, content='')",
+    "INSERT INTO book_fts(rowid, title) SELECT id, title FROM book",
+    "CREATE TRIGGER book_fts_insert AFTER INSERT ON book BEGIN "
+    "INSERT INTO book_fts(rowid, title) VALUES (new.id, new.title); "
+    "END",
+    "CREATE TRIGGER book_fts_delete AFTER DELETE ON book BEGIN "
+    "INSERT INTO book_fts(book_fts, rowid, title) "
+    "VALUES ('delete', old.id, old.title); "
+    "END",
+    "CREATE TRIGGER book_fts_update AFTER UPDATE OF title ON book BEGIN "
+    "INSERT INTO book_fts(book_fts, rowid, title) "
+    "VALUES ('delete', old.id, old.title); "
+    "INSERT INTO book_fts(rowid, title) VALUES (new.id, new.title); "
+    "END",
+]
+
+SQLITE_DOWNGRADE = [
+    "DROP TRIGGER IF EXISTS book_fts_update",
+    "DROP TRIGGER IF EXISTS book_fts_delete",
+    "DROP TRIGGER IF EXISTS book_fts_insert",
+    "DROP TABLE IF EXISTS book_fts",
+]
+
+POSTGRESQL_UPGRADE = [
+    "ALTER TABLE book ADD COLUMN title_tsv tsvector GENERATED ALWAYS AS "
+    "(to_tsvector('simple', title)) STORED",
+    "CREATE INDEX ix_book_title_tsv ON book USING GIN (title_tsv)",
+]
+
+POSTGRESQL_DOWNGRADE = [
+    "DROP INDEX IF EXISTS ix_book_title_tsv",
+    "ALTER TABLE book DROP COLUMN IF EXISTS title_tsv",
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    statements = {
+        "sqlite": SQLITE_UPGRADE,
+        "postgresql": POSTGRESQL_UPGRADE,
+    }
+
+    for statement in statements.get(op.get_bind().dialect.name, []):
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    statements = {
+        "sqlite": SQLITE_DOWNGRADE,
+        "postgresql": POSTGRESQL_DOWNGRADE,
+    }
+
+    for statement in statements.get(op.get_bind().dialect.name, []):
+        op.execute(statement)
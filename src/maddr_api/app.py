@@ -1,12 +1,41 @@
 from fastapi import FastAPI
-from maddr_api.routers import account, token, book, author
+from fastapi.responses import ORJSONResponse
+from maddr_api.config.settings import Settings
+from maddr_api.middleware.compression import CompressionMiddleware
+from maddr_api.middleware.query_count import QueryCountMiddleware
+from maddr_api.middleware.read_your_writes import ReadYourWritesMiddleware
+from maddr_api.middleware.timing import ServerTimingMiddleware
+from maddr_api.routers import account, token, book, author, metrics
+from maddr_api.services.cache import response_cache
 
-app = FastAPI()
+settings = Settings()
+
+app = FastAPI(default_response_class=ORJSONResponse)
+
+if settings.COMPRESSION_ENABLED:
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+        media_types=settings.COMPRESSION_MEDIA_TYPES,
+        gzip_level=settings.COMPRESSION_GZIP_LEVEL,
+        brotli_quality=settings.COMPRESSION_BROTLI_QUALITY,
+        cache=response_cache,
+    )
+
+app.add_middleware(
+    ReadYourWritesMiddleware,
+    window_seconds=settings.READ_YOUR_WRITES_SECONDS,
+)
+app.add_middleware(QueryCountMiddleware)
+
+if settings.REQUEST_TIMING_ENABLED:
+    app.add_middleware(ServerTimingMiddleware)
 
 app.include_router(token.router)
 app.include_router(account.router)
 app.include_router(author.router)
 app.include_router(book.router)
+app.include_router(metrics.router)
 
 
 @app.get("/")
@@ -1,13 +1,35 @@
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from itertools import count
+from time import time
+
+from fastapi import Request
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    create_async_engine,
+)
+from maddr_api.config.pool import engine_options
 from maddr_api.config.settings import Settings
 
+settings = Settings()
+
+READ_YOUR_WRITES_COOKIE = "read_your_writes"
+READ_YOUR_WRITES_HEADER = "X-Read-Your-Writes"
+READ_REPLICA_KEY = "read_replica"
+
 
 class DatabaseSession:
     """
     Base service class for database operations.
     """
 
-    engine = create_async_engine(Settings().DATABASE_URL)
+    engine = create_async_engine(
+        settings.DATABASE_URL, **engine_options(settings)
+    )
+    replica_engines: list[AsyncEngine] = [
+        create_async_engine(url, **engine_options(settings, url))
+        for url in settings.DATABASE_REPLICA_URLS
+    ]
+    _replica_counter = count()
 
     @staticmethod
     async def get_session():
@@ -20,5 +42,84 @@ class DatabaseSession:
         ) as session:
             yield session
 
+    @staticmethod
+    async def get_read_session(request: Request):
+        """
+        Provide a database session for read-only handlers.
+        Use as dependency: Depends(DatabaseSession.get_read_session)
+
+        Sessions are bound to a replica, round-robin, unless no replica is
+        configured or the client wrote recently (see read_your_writes).
+        """
+        engine = DatabaseSession.read_engine(request)
+
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            session.info[READ_REPLICA_KEY] = engine is not (
+                DatabaseSession.engine
+            )
+            yield session
+
+    @staticmethod
+    def engines() -> dict[str, AsyncEngine]:
+        """
+        The primary and replica engines, labelled for reporting.
+        """
+
+        return {
+            "primary": DatabaseSession.engine,
+            **{
+                f"replica_{index}": engine
+                for index, engine in enumerate(
+                    DatabaseSession.replica_engines, start=1
+                )
+            },
+        }
+
+    @staticmethod
+    def read_engine(request: Request) -> AsyncEngine:
+        """
+        Choose the engine that serves a read-only request.
+        """
+
+        replicas = DatabaseSession.replica_engines
+
+        if not replicas or DatabaseSession.read_your_writes(request):
+            return DatabaseSession.engine
+
+        return replicas[next(DatabaseSession._replica_counter) % len(replicas)]
+
+    @staticmethod
+    def reads_replica(session: AsyncSession) -> bool:
+        """
+        Whether a session reads from a replica, which may lag behind the
+        primary.
+        """
+
+        return session.info.get(READ_REPLICA_KEY, False)
+
+    @staticmethod
+    def read_your_writes(request: Request) -> bool:
+        """
+        Whether the request is inside the read-your-writes window.
+
+        After a write the client receives the end of the window as a cookie
+        and header; echoing either one pins its reads to the primary until
+        then, so it never reads data older than its own writes. Values
+        further ahead than READ_YOUR_WRITES_SECONDS were not issued by a
+        write and are ignored, so a client cannot pin itself to the primary.
+        """
+
+        window_end = request.headers.get(
+            READ_YOUR_WRITES_HEADER
+        ) or request.cookies.get(READ_YOUR_WRITES_COOKIE)
+        now = time()
+
+        try:
+            window_end = float(window_end)
+        except (TypeError, ValueError):
+            return False
+
+        return now < window_end <= now + settings.READ_YOUR_WRITES_SECONDS
+
     def __init__(self, session: AsyncSession):
         self.session = session
@@ -0,0 +1,133 @@
+from time import perf_counter
+from typing import Any, Optional
+
+from sqlalchemy import exc
+from sqlalchemy.engine import make_url
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool
+
+from maddr_api.config.settings import Settings
+
+
+class PoolMetrics:
+    """
+    Counters for connection checkouts from the database pool.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Reset every counter.
+        """
+
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    def record_checkout(self, wait_seconds: float) -> None:
+        """
+        Record how long a checkout waited for a connection.
+        """
+
+        self.checkouts += 1
+        self.total_wait_seconds += wait_seconds
+        self.max_wait_seconds = max(self.max_wait_seconds, wait_seconds)
+
+    def stats(self, pool: Pool) -> dict[str, Any]:
+        """
+        Return the checkout counters together with the pool occupancy.
+        """
+
+        return {
+            "pool": type(pool).__name__,
+            "size": getattr(pool, "size", lambda: None)(),
+            "checked_in": getattr(pool, "checkedin", lambda: None)(),
+            "in_use": getattr(pool, "checkedout", lambda: None)(),
+            "overflow": getattr(pool, "overflow", lambda: None)(),
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+            "avg_wait_ms": (
+                self.total_wait_seconds / self.checkouts * 1000
+                if self.checkouts
+                else 0.0
+            ),
+            "max_wait_ms": self.max_wait_seconds * 1000,
+        }
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """
+    Async queue pool that records checkout latency and timeouts.
+
+    Every pool keeps its own PoolMetrics, so the primary and each replica
+    are reported apart. The metrics carry over when the engine recreates
+    its pool.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def recreate(self) -> "InstrumentedQueuePool":
+        pool = super().recreate()
+        pool.metrics = self.metrics
+
+        return pool
+
+    def connect(self):
+        started = perf_counter()
+
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            self.metrics.timeouts += 1
+            raise
+
+        self.metrics.record_checkout(perf_counter() - started)
+
+        return connection
+
+
+def pool_stats(pool: Pool) -> dict[str, Any]:
+    """
+    Return the checkout counters and occupancy of a pool. Pools that are not
+    instrumented report no checkouts.
+    """
+
+    return getattr(pool, "metrics", PoolMetrics()).stats(pool)
+
+
+def engine_options(
+    settings: Settings, database_url: Optional[str] = None
+) -> dict[str, Any]:
+    """
+    Build the create_async_engine pool options from the settings.
+
+    The options are built for database_url when given, e.g. a replica, and
+    for DATABASE_URL otherwise.
+
+    In-memory SQLite keeps SQLAlchemy's default single-connection pool,
+    since a queue pool would give every connection its own empty database.
+    """
+
+    options: dict[str, Any] = {
+        "pool_pre_ping": settings.DATABASE_POOL_PRE_PING,
+        "pool_recycle": settings.DATABASE_POOL_RECYCLE,
+    }
+    url = make_url(database_url or settings.DATABASE_URL)
+
+    if url.get_backend_name() == "sqlite" and url.database in (
+        None,
+        "",
+        ":memory:",
+    ):
+        return options
+
+    return options | {
+        "poolclass": InstrumentedQueuePool,
+        "pool_size": settings.DATABASE_POOL_SIZE,
+        "max_overflow": settings.DATABASE_MAX_OVERFLOW,
+        "pool_timeout": settings.DATABASE_POOL_TIMEOUT,
+    }
@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -7,6 +9,41 @@ class Settings(BaseSettings):
     )
 
     DATABASE_URL: str
+    DATABASE_POOL_SIZE: int = 5
+    DATABASE_MAX_OVERFLOW: int = 10
+    DATABASE_POOL_TIMEOUT: float = 30
+    DATABASE_POOL_PRE_PING: bool = False
+    DATABASE_POOL_RECYCLE: int = -1
+    DATABASE_REPLICA_URLS: list[str] = []
+    READ_YOUR_WRITES_SECONDS: int = 5
     SECRET_KEY: str
     ALGORITHM: str
     ACCESS_TOKEN_EXPIRE_MINUTES: int
+    REFRESH_TOKEN_EXPIRE_DAYS: int = 30
+    ACCOUNT_CACHE_MAX_SIZE: int = 1024
+    ACCOUNT_CACHE_TTL_SECONDS: int = 60
+    PASSWORD_HASH_EXECUTOR: Literal["thread", "process"] = "thread"
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_MAX_PENDING: int = 32
+    BULK_CHUNK_SIZE: int = 500
+    EXPORT_CHUNK_SIZE: int = 1000
+    BATCH_MAX_IDS: int = 500
+    IMPORT_BATCH_SIZE: int = 2000
+    IMPORT_MAX_REPORTED_ERRORS: int = 100
+    RESPONSE_CACHE_MAX_SIZE: int = 4096
+    RESPONSE_CACHE_TTL_SECONDS: int = 300
+    RESPONSE_CACHE_BACKEND: Literal["memory", "redis"] = "memory"
+    RESPONSE_CACHE_URL: str = "redis://localhost:6379/0"
+    RESPONSE_CACHE_PREFIX: str = "maddr"
+    COMPRESSION_ENABLED: bool = True
+    COMPRESSION_MINIMUM_SIZE: int = 1024
+    COMPRESSION_MEDIA_TYPES: list[str] = [
+        "application/json",
+        "application/x-ndjson",
+        "text/csv",
+        "text/plain",
+    ]
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 4
+    REQUEST_TIMING_ENABLED: bool = True
+    METRICS_TOKEN: str = ""
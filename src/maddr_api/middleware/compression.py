@@ -0,0 +1,212 @@
+from hashlib import blake2b
+from http import HTTPStatus
+from typing import Iterable, Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from maddr_api.services.cache import ResponseCache
+from maddr_api.utils.compression import (
+    BROTLI,
+    StreamCompressor,
+    compress,
+    negotiate_encoding,
+)
+
+
+class CompressionMiddleware:
+    """
+    Compress responses with gzip, or brotli when it is installed, according
+    to the Accept-Encoding of the request.
+
+    Only responses whose media type is allowed are compressed, and whole
+    bodies smaller than minimum_size are sent as they are. Streamed bodies
+    are compressed chunk by chunk. With a response cache, compressed bodies
+    of responses carrying a strong ETag are stored per encoding under a
+    hash of the uncompressed body, so hot responses are not compressed
+    again on every hit.
+
+    Compressed responses carry a weak ETag. A 304 answering a request that
+    sent that weak ETag carries it too, so it confirms the same validator
+    as the compressed 200.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        media_types: Iterable[str] = ("application/json",),
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+        cache: Optional[ResponseCache] = None,
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.media_types = frozenset(media_types)
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.cache = cache
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        encoding = negotiate_encoding(headers.get("accept-encoding"))
+
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = CompressionResponder(
+            self, encoding, send, headers.get("if-none-match", "")
+        )
+
+        await self.app(scope, receive, responder.send)
+
+    def level(self, encoding: str) -> int:
+        return self.brotli_quality if encoding == BROTLI else self.gzip_level
+
+    def allows(self, message: Message) -> bool:
+        """
+        Whether a response start message describes a compressible response.
+        """
+
+        headers = Headers(raw=message.get("headers", []))
+        media_type = headers.get("content-type", "").split(";")[0].strip()
+
+        return (
+            200 <= message["status"] < 300
+            and message["status"] != 204
+            and "content-encoding" not in headers
+            and media_type in self.media_types
+        )
+
+
+class CompressionResponder:
+    """
+    Compress the response of a single request.
+
+    The start message is held back until the first body message shows
+    whether the body comes whole or streamed.
+    """
+
+    def __init__(
+        self,
+        middleware: CompressionMiddleware,
+        encoding: str,
+        send: Send,
+        if_none_match: str = "",
+    ):
+        self.middleware = middleware
+        self.encoding = encoding
+        self.if_none_match = if_none_match
+        self.level = middleware.level(encoding)
+        self.send_message = send
+        self.start_message: Optional[Message] = None
+        self.compressor: Optional[StreamCompressor] = None
+
+    async def send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            self.start_message = message
+            return
+
+        if message["type"] != "http.response.body":
+            await self.send_message(message)
+            return
+
+        if self.start_message is not None:
+            start, self.start_message = self.start_message, None
+            await self.send_first(start, message)
+            return
+
+        if self.compressor is None:
+            await self.send_message(message)
+            return
+
+        body = self.compressor.compress(message.get("body", b""))
+
+        if not message.get("more_body", False):
+            body += self.compressor.finish()
+
+        await self.send_message({**message, "body": body})
+
+    async def send_first(self, start: Message, message: Message) -> None:
+        body = message.get("body", b"")
+        streamed = message.get("more_body", False)
+
+        if start["status"] == HTTPStatus.NOT_MODIFIED:
+            self.match_validator(MutableHeaders(scope=start))
+
+        if not self.middleware.allows(start):
+            await self.send_message(start)
+            await self.send_message(message)
+            return
+
+        headers = MutableHeaders(scope=start)
+        headers.add_vary_header("Accept-Encoding")
+
+        if not streamed and len(body) < self.middleware.minimum_size:
+            await self.send_message(start)
+            await self.send_message(message)
+            return
+
+        etag = headers.get("etag")
+        headers["Content-Encoding"] = self.encoding
+
+        if etag and not etag.startswith("W/"):
+            # The compressed bytes differ from the identity representation,
+            # so its strong validator only holds weakly here.
+            headers["ETag"] = f"W/{etag}"
+
+        if streamed:
+            del headers["Content-Length"]
+            self.compressor = StreamCompressor(self.encoding, self.level)
+            body = self.compressor.compress(body)
+
+            await self.send_message(start)
+            await self.send_message({**message, "body": body})
+            return
+
+        body = await self.compress_whole(body, etag)
+        headers["Content-Length"] = str(len(body))
+
+        await self.send_message(start)
+        await self.send_message({**message, "body": body})
+
+    def match_validator(self, headers: MutableHeaders) -> None:
+        """
+        Give a 304 the weak ETag of the compressed 200 when that is the
+        validator the client sent back.
+        """
+
+        headers.add_vary_header("Accept-Encoding")
+        etag = headers.get("etag")
+
+        if etag and f"W/{etag}" in self.if_none_match:
+            headers["ETag"] = f"W/{etag}"
+
+    async def compress_whole(self, body: bytes, etag: Optional[str]) -> bytes:
+        """
+        Compress a whole body, going through the response cache for
+        responses with a strong ETag.
+
+        Cached bodies are keyed by a hash of the uncompressed bytes rather
+        than by the ETag, so a new schema or serializer never gets the
+        compressed body of an older one.
+        """
+
+        cache = self.middleware.cache
+
+        if cache is None or not etag or etag.startswith("W/"):
+            return compress(body, self.encoding, self.level)
+
+        digest = blake2b(body, digest_size=16).hexdigest()
+        compressed = await cache.get_encoded(digest, self.encoding)
+
+        if compressed is None:
+            compressed = compress(body, self.encoding, self.level)
+            await cache.set_encoded(digest, self.encoding, compressed)
+
+        return compressed
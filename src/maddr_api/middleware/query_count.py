@@ -0,0 +1,40 @@
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from maddr_api.utils.query_count import counting_queries
+
+QUERY_COUNT_HEADER = "X-Query-Count"
+
+
+class QueryCountMiddleware:
+    """
+    Count the SQL statements each request runs and report them in the
+    X-Query-Count response header.
+
+    Statements are counted until the response starts, which covers the
+    handler and its dependencies. The counter is shared with
+    ServerTimingMiddleware, whichever of the two runs first.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with counting_queries() as counter:
+
+            async def send_with_count(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    message["headers"] = [
+                        *message.get("headers", []),
+                        (
+                            QUERY_COUNT_HEADER.lower().encode(),
+                            str(counter.count).encode(),
+                        ),
+                    ]
+
+                await send(message)
+
+            await self.app(scope, receive, send_with_count)
@@ -0,0 +1,65 @@
+from http.cookies import SimpleCookie
+from time import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from maddr_api.config.database import (
+    READ_YOUR_WRITES_COOKIE,
+    READ_YOUR_WRITES_HEADER,
+    DatabaseSession,
+)
+
+SAFE_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+
+class ReadYourWritesMiddleware:
+    """
+    Open a read-your-writes window after every successful write.
+
+    The end of the window is returned both as a cookie and as the
+    X-Read-Your-Writes header, for clients that do not keep cookies. Nothing
+    is added when no replica is configured.
+    """
+
+    def __init__(self, app: ASGIApp, window_seconds: float):
+        self.app = app
+        self.window_seconds = window_seconds
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if (
+            scope["type"] != "http"
+            or scope["method"] in SAFE_METHODS
+            or not DatabaseSession.replica_engines
+            or self.window_seconds <= 0
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_window(message: Message) -> None:
+            if (
+                message["type"] == "http.response.start"
+                and message["status"] < 400
+            ):
+                window_end = f"{time() + self.window_seconds:.3f}"
+                cookie = SimpleCookie()
+                cookie[READ_YOUR_WRITES_COOKIE] = window_end
+                cookie[READ_YOUR_WRITES_COOKIE]["max-age"] = (
+                    int(self.window_seconds) or 1
+                )
+                cookie[READ_YOUR_WRITES_COOKIE]["path"] = "/"
+                cookie[READ_YOUR_WRITES_COOKIE]["httponly"] = True
+                message["headers"] = [
+                    *message.get("headers", []),
+                    (
+                        b"set-cookie",
+                        cookie.output(header="").strip().encode(),
+                    ),
+                    (
+                        READ_YOUR_WRITES_HEADER.lower().encode(),
+                        window_end.encode(),
+                    ),
+                ]
+
+            await send(message)
+
+        await self.app(scope, receive, send_with_window)
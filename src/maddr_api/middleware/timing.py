@@ -0,0 +1,68 @@
+import json
+import logging
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from maddr_api.utils.query_count import counting_queries
+from maddr_api.utils.timing import RequestTimings, request_timings
+
+SERVER_TIMING_HEADER = "Server-Timing"
+
+access_logger = logging.getLogger("maddr_api.access")
+access_logger.addHandler(logging.NullHandler())
+
+
+class ServerTimingMiddleware:
+    """
+    Record where each request spends its time: SQL statements and database
+    time, authentication, password hashing and serialization.
+
+    The breakdown up to the start of the response goes out in the
+    Server-Timing header. Once the body has been sent, the full breakdown
+    is written as a JSON line at INFO to the maddr_api.access logger;
+    where it goes is left to the server's logging configuration.
+
+    SQL statements and database time come from the same counter as the
+    X-Query-Count header.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with counting_queries() as queries:
+            timings = RequestTimings(queries)
+            token = request_timings.set(timings)
+            status = None
+
+            async def send_with_timing(message: Message) -> None:
+                nonlocal status
+
+                if message["type"] == "http.response.start":
+                    status = message["status"]
+                    message["headers"] = [
+                        *message.get("headers", []),
+                        (
+                            SERVER_TIMING_HEADER.lower().encode(),
+                            timings.server_timing().encode(),
+                        ),
+                    ]
+
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_timing)
+            finally:
+                request_timings.reset(token)
+                access_logger.info(
+                    json.dumps({
+                        "method": scope["method"],
+                        "path": scope["path"],
+                        "status": status,
+                        **timings.to_dict(),
+                    })
+                )
@@ -1,3 +1,4 @@
 from .account import Account as Account, table_registry as table_registry
 from .book import Book as Book
 from .author import Author as Author
+from .refresh_token import RefreshToken as RefreshToken
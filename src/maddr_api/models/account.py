@@ -3,6 +3,8 @@ from datetime import datetime
 from sqlalchemy import func
 from sqlalchemy.orm import Mapped, mapped_column, registry
 
+from .functions import utcnow
+
 
 table_registry = registry()
 
@@ -21,6 +23,9 @@ class Account:
     username: Mapped[str] = mapped_column(unique=True, nullable=False)
     email: Mapped[str] = mapped_column(unique=True, nullable=False)
     password: Mapped[str] = mapped_column(nullable=False)
+    token_version: Mapped[int] = mapped_column(
+        init=False, nullable=False, default=0, server_default="0"
+    )
     created_at: Mapped[datetime] = mapped_column(
         init=False, nullable=False, server_default=func.now()
     )
@@ -28,5 +33,5 @@ class Account:
         init=False,
         nullable=False,
         server_default=func.now(),
-        onupdate=func.now(),
+        onupdate=utcnow(),
     )
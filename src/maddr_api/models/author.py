@@ -2,9 +2,10 @@ from __future__ import annotations
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import func
+from sqlalchemy import UniqueConstraint, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from .account import table_registry
+from .functions import utcnow
 
 
 if TYPE_CHECKING:
@@ -18,6 +19,7 @@ class Author:
     """
 
     __tablename__ = "author"
+    __table_args__ = (UniqueConstraint("name", name="uq_author_name"),)
 
     id: Mapped[int] = mapped_column(
         init=False, primary_key=True, autoincrement=True
@@ -30,7 +32,7 @@ class Author:
         init=False,
         nullable=False,
         server_default=func.now(),
-        onupdate=func.now(),
+        onupdate=utcnow(),
     )
 
     books: Mapped[list["Book"]] = relationship(
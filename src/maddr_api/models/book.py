@@ -2,9 +2,19 @@ from __future__ import annotations
 from datetime import datetime
 
 from typing import TYPE_CHECKING
-from sqlalchemy import ForeignKey, func
+from sqlalchemy import (
+    DDL,
+    ForeignKey,
+    Index,
+    UniqueConstraint,
+    column,
+    event,
+    func,
+    table,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from .account import table_registry
+from .functions import utcnow
 
 
 if TYPE_CHECKING:
@@ -18,12 +28,16 @@ class Book:
     """
 
     __tablename__ = "book"
+    __table_args__ = (
+        UniqueConstraint("title", name="uq_book_title"),
+        Index("ix_book_publish_year_id", "publish_year", "id"),
+    )
 
     id: Mapped[int] = mapped_column(
         init=False, primary_key=True, autoincrement=True
     )
     author_id: Mapped[int] = mapped_column(
-        ForeignKey("author.id"), nullable=False
+        ForeignKey("author.id"), nullable=False, index=True
     )
     title: Mapped[str] = mapped_column(nullable=False)
     publish_year: Mapped[int] = mapped_column(nullable=False)
@@ -34,9 +48,53 @@ class Book:
         init=False,
         nullable=False,
         server_default=func.now(),
-        onupdate=func.now(),
+        onupdate=utcnow(),
     )
 
     author: Mapped["Author"] = relationship(
         "Author", back_populates="books", init=False
     )
+
+
+# Full-text index over book titles, kept in sync by the database itself so
+# every write path (ORM, bulk and set-based statements) updates it. SQLite
+# uses a contentless FTS5 table maintained by triggers; PostgreSQL uses a
+# generated tsvector column with a GIN index.
+book_fts = table("book_fts", column("rowid"), column("rank"))
+
+BOOK_FTS_DDL = {
+    "sqlite": [
+        "CREATE VIRTUAL TABLE book_fts USING fts5(title, content='')",
+        "CREATE TRIGGER book_fts_insert AFTER INSERT ON book BEGIN "
+        "INSERT INTO book_fts(rowid, title) VALUES (new.id, new.title); "
+        "END",
+        "CREATE TRIGGER book_fts_delete AFTER DELETE ON book BEGIN "
+        "INSERT INTO book_fts(book_fts, rowid, title) "
+        "VALUES ('delete', old.id, old.title); "
+        "END",
+        "CREATE TRIGGER book_fts_update AFTER UPDATE OF title ON book BEGIN "
+        "INSERT INTO book_fts(book_fts, rowid, title) "
+        "VALUES ('delete', old.id, old.title); "
+        "INSERT INTO book_fts(rowid, title) VALUES (new.id, new.title); "
+        "END",
+    ],
+    "postgresql": [
+        "ALTER TABLE book ADD COLUMN title_tsv tsvector GENERATED ALWAYS AS "
+        "(to_tsvector('simple', title)) STORED",
+        "CREATE INDEX ix_book_title_tsv ON book USING GIN (title_tsv)",
+    ],
+}
+
+for dialect, statements in BOOK_FTS_DDL.items():
+    for statement in statements:
+        event.listen(
+            Book.__table__,
+            "after_create",
+            DDL(statement).execute_if(dialect=dialect),
+        )
+
+event.listen(
+    Book.__table__,
+    "after_drop",
+    DDL("DROP TABLE IF EXISTS book_fts").execute_if(dialect="sqlite"),
+)
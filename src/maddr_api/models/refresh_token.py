@@ -0,0 +1,31 @@
+from datetime import datetime
+
+from sqlalchemy import ForeignKey, func
+from sqlalchemy.orm import Mapped, mapped_column
+from .account import table_registry
+
+
+@table_registry.mapped_as_dataclass
+class RefreshToken:
+    """
+    Database model for a refresh token issued to an account.
+    """
+
+    __tablename__ = "refresh_token"
+
+    id: Mapped[int] = mapped_column(
+        init=False, primary_key=True, autoincrement=True
+    )
+    account_id: Mapped[int] = mapped_column(
+        ForeignKey("account.id", ondelete="CASCADE"), nullable=False
+    )
+    token_hash: Mapped[str] = mapped_column(unique=True, nullable=False)
+    family_id: Mapped[str] = mapped_column(index=True, nullable=False)
+    expires_at: Mapped[datetime] = mapped_column(nullable=False)
+    token_version: Mapped[int] = mapped_column(
+        nullable=False, server_default="0"
+    )
+    revoked: Mapped[bool] = mapped_column(default=False, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        init=False, nullable=False, server_default=func.now()
+    )
@@ -9,6 +9,9 @@ from maddr_api.schemas.account import (
 from maddr_api.models.account import Account
 from maddr_api.security.get_current_user import get_current_user
 from maddr_api.services.account import AccountService
+from maddr_api.utils.conditional import ConditionalRequest
+from maddr_api.utils.fields import parse_fields
+from maddr_api.utils.responses import entity_response
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Annotated
 
@@ -34,16 +37,29 @@ async def create_account(
 @router.get(
     "/{account_id}",
     summary="Read an account",
-    description="Retrieve an account by its ID.",
+    description=(
+        "Retrieve an account by its ID. fields (e.g. id,username) returns "
+        "only those fields."
+    ),
     status_code=HTTPStatus.OK,
     response_model=AccountPublic,
 )
 async def read_account(
     account_id: int,
+    conditions: Annotated[ConditionalRequest, Depends()],
+    fields: str | None = None,
     session: DatabaseSession = Depends(DatabaseSession.get_session),
 ) -> AccountPublic:
-    return await AccountService(session).read_account(
-        search_field="id", value=account_id
+    account_service = AccountService(session)
+
+    return await entity_response(
+        account_service,
+        resource="account",
+        id=account_id,
+        schema=AccountPublic,
+        read=lambda id: account_service.read_account("id", id),
+        conditions=conditions,
+        fields=parse_fields(fields, AccountPublic),
     )
 
 
@@ -1,18 +1,42 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import StreamingResponse
 from maddr_api.config.database import DatabaseSession
 from http import HTTPStatus
 from maddr_api.models.account import Account
 from maddr_api.schemas.author import (
+    AuthorBatchResponse,
+    AuthorBulkCreate,
+    AuthorBulkResponse,
     AuthorCreate,
+    AuthorExpand,
+    AuthorExpandPage,
     AuthorMessageResponse,
     AuthorPublic,
 )
-from maddr_api.security.get_current_user import get_current_user
+from maddr_api.schemas.expand import AuthorWithBooks
+from maddr_api.schemas.export import FileFormat
+from maddr_api.schemas.imports import ImportSummary
+from maddr_api.schemas.token import TokenPrincipal
+from maddr_api.security.get_current_user import (
+    get_current_principal,
+    get_current_user,
+)
 from maddr_api.services.author import AuthorService
+from maddr_api.services.cache import response_cache
+from maddr_api.utils.export import export_response
+from maddr_api.utils.fields import parse_fields
+from maddr_api.utils.ids import parse_ids
+from maddr_api.utils.importer import iter_records
+from maddr_api.utils.conditional import ConditionalRequest, Validators
+from maddr_api.utils.responses import entity_response, representation_response
+from maddr_api.utils.serialization import encode_model
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Annotated
 
 Session = Annotated[AsyncSession, Depends(DatabaseSession.get_session)]
+ReadSession = Annotated[
+    AsyncSession, Depends(DatabaseSession.get_read_session)
+]
 
 router = APIRouter(prefix="/author", tags=["author"])
 
@@ -32,19 +56,159 @@ async def create_author(
     return await AuthorService(session).create_author(author_data)
 
 
+@router.post(
+    "/bulk",
+    summary="Create many authors",
+    description=(
+        "Create many authors in one request and return the outcome of each "
+        "item. Duplicates are reported per item instead of failing the batch."
+    ),
+    status_code=HTTPStatus.OK,
+    response_model=AuthorBulkResponse,
+)
+async def create_authors(
+    bulk_data: AuthorBulkCreate,
+    session: Session,
+    current_user: Account = Depends(get_current_user),
+) -> AuthorBulkResponse:
+    return await AuthorService(session).create_authors(bulk_data)
+
+
+@router.post(
+    "/import",
+    summary="Import authors",
+    description=(
+        "Import authors from a CSV or NDJSON request body, parsed as it "
+        "arrives and inserted in batches of IMPORT_BATCH_SIZE rows. Rows "
+        "carry a name."
+    ),
+    status_code=HTTPStatus.OK,
+    response_model=ImportSummary,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "text/csv": {"schema": {"type": "string"}},
+                "application/x-ndjson": {"schema": {"type": "string"}},
+            },
+        }
+    },
+)
+async def import_authors(
+    request: Request,
+    session: Session,
+    format: FileFormat = FileFormat.NDJSON,
+    current_user: Account = Depends(get_current_user),
+) -> ImportSummary:
+    return await AuthorService(session).import_authors(
+        iter_records(request.stream(), format)
+    )
+
+
+@router.get(
+    "/batch",
+    summary="Get many authors by ID",
+    description=(
+        "Retrieve many authors with one query. Authors come back in the "
+        "order of the ids and ids that do not exist are listed in missing."
+    ),
+    status_code=HTTPStatus.OK,
+    response_model=AuthorBatchResponse,
+)
+async def read_authors_batch(
+    session: ReadSession,
+    author_ids: Annotated[list[int], Depends(parse_ids)],
+    principal: TokenPrincipal = Depends(get_current_principal),
+) -> AuthorBatchResponse:
+    return await AuthorService(session).read_authors(author_ids)
+
+
+@router.get(
+    "/export",
+    summary="Export authors",
+    description=(
+        "Stream every author as NDJSON or CSV, ordered by id, with constant "
+        "memory on the server."
+    ),
+    status_code=HTTPStatus.OK,
+    response_class=StreamingResponse,
+)
+async def export_authors(
+    session: ReadSession,
+    format: FileFormat = FileFormat.NDJSON,
+    principal: TokenPrincipal = Depends(get_current_principal),
+) -> StreamingResponse:
+    return export_response(
+        AuthorService(session).export_authors(),
+        fields=list(AuthorPublic.model_fields),
+        format=format,
+        filename="authors",
+    )
+
+
 @router.get(
     "/{author_id}",
     summary="Get author by ID",
-    description="Retrieve author details by their ID.",
+    description=(
+        "Retrieve author details by their ID. expand=books embeds a page "
+        "of the author's books, paged with books_skip and books_limit; "
+        "fields (e.g. id) returns only those fields."
+    ),
     status_code=HTTPStatus.OK,
-    response_model=AuthorPublic,
+    response_model=AuthorPublic | AuthorWithBooks,
 )
 async def read_author(
     author_id: int,
-    session: Session,
-    current_user: Account = Depends(get_current_user),
-) -> AuthorPublic:
-    return await AuthorService(session).read_author(author_id)
+    session: ReadSession,
+    conditions: Annotated[ConditionalRequest, Depends()],
+    expand_page: Annotated[AuthorExpandPage, Query()],
+    principal: TokenPrincipal = Depends(get_current_principal),
+) -> AuthorPublic | AuthorWithBooks:
+    author_service = AuthorService(session)
+    fields = parse_fields(expand_page.fields, AuthorPublic, expand_page.expand)
+
+    if expand_page.expand == AuthorExpand.BOOKS:
+        # Like expanded books, these bodies are not kept in the response
+        # cache.
+        author, books, next_skip = await author_service.read_author_books(
+            author_id, expand_page.books_skip, expand_page.books_limit
+        )
+        validators = Validators.for_page(
+            "author",
+            [
+                (author.id, author.updated_at),
+                *((f"book:{book.id}", book.updated_at) for book in books),
+            ],
+            expand_page.expand.value,
+            expand_page.books_skip,
+            expand_page.books_limit,
+            next_skip,
+        )
+
+        return representation_response(
+            validators,
+            conditions,
+            lambda: encode_model(
+                {
+                    "id": author.id,
+                    "name": author.name,
+                    "books": books,
+                    "books_next_skip": next_skip,
+                },
+                AuthorWithBooks,
+            ),
+        )
+
+    return await entity_response(
+        author_service,
+        resource="author",
+        id=author_id,
+        schema=AuthorPublic,
+        read=author_service.read_author,
+        conditions=conditions,
+        cache=response_cache,
+        fields=fields,
+    )
 
 
 @router.patch(
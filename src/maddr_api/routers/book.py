@@ -1,14 +1,47 @@
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import StreamingResponse
 from maddr_api.config.database import DatabaseSession
 from http import HTTPStatus
 from maddr_api.models.account import Account
-from maddr_api.schemas.book import BookCreate, BookPublic, FilterPage
-from maddr_api.security.get_current_user import get_current_user
+from maddr_api.schemas.export import FileFormat
+from maddr_api.schemas.book import (
+    BookBatchResponse,
+    BookBulkCreate,
+    BookBulkResponse,
+    BookCreate,
+    BookExpand,
+    BookExportFilter,
+    BookMessageResponse,
+    BookPublic,
+    FilterPage,
+)
+from maddr_api.schemas.expand import BookWithAuthor
+from maddr_api.schemas.imports import ImportSummary
+from maddr_api.schemas.token import TokenPrincipal
+from maddr_api.security.get_current_user import (
+    get_current_principal,
+    get_current_user,
+)
 from maddr_api.services.book import BookService
+from maddr_api.services.cache import response_cache
+from maddr_api.utils.export import export_response
+from maddr_api.utils.fields import parse_fields
+from maddr_api.utils.ids import parse_ids
+from maddr_api.utils.importer import iter_records
+from maddr_api.utils.conditional import ConditionalRequest, Validators
+from maddr_api.utils.responses import entity_response, representation_response
+from maddr_api.utils.serialization import (
+    encode_list,
+    encode_model,
+    encode_rows,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import Annotated
+from typing import Annotated, Any, Sequence
 
 Session = Annotated[AsyncSession, Depends(DatabaseSession.get_session)]
+ReadSession = Annotated[
+    AsyncSession, Depends(DatabaseSession.get_read_session)
+]
 
 router = APIRouter(prefix="/book", tags=["book"])
 
@@ -28,36 +61,276 @@ async def create_book(
     return await BookService(session).create_book(book_data)
 
 
+@router.post(
+    "/bulk",
+    summary="Create many books",
+    description=(
+        "Create many books in one request and return the outcome of each "
+        "item. Duplicates are reported per item instead of failing the batch."
+    ),
+    status_code=HTTPStatus.OK,
+    response_model=BookBulkResponse,
+)
+async def create_books(
+    bulk_data: BookBulkCreate,
+    session: Session,
+    current_user: Account = Depends(get_current_user),
+) -> BookBulkResponse:
+    return await BookService(session).create_books(bulk_data)
+
+
+@router.put(
+    "/bulk",
+    summary="Create or update many books",
+    description=(
+        "Create many books in one request, updating the author and publish "
+        "year of the titles that already exist. Books come back in request "
+        "order."
+    ),
+    status_code=HTTPStatus.OK,
+    response_model=list[BookPublic],
+)
+async def upsert_books(
+    bulk_data: BookBulkCreate,
+    session: Session,
+    current_user: Account = Depends(get_current_user),
+) -> list[BookPublic]:
+    return await BookService(session).upsert_books(bulk_data)
+
+
+@router.post(
+    "/import",
+    summary="Import books",
+    description=(
+        "Import books from a CSV or NDJSON request body, parsed as it "
+        "arrives and inserted in batches of IMPORT_BATCH_SIZE rows. "
+        "Rows carry title, publish_year and author_id or author_name."
+    ),
+    status_code=HTTPStatus.OK,
+    response_model=ImportSummary,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "text/csv": {"schema": {"type": "string"}},
+                "application/x-ndjson": {"schema": {"type": "string"}},
+            },
+        }
+    },
+)
+async def import_books(
+    request: Request,
+    session: Session,
+    format: FileFormat = FileFormat.NDJSON,
+    current_user: Account = Depends(get_current_user),
+) -> ImportSummary:
+    return await BookService(session).import_books(
+        iter_records(request.stream(), format)
+    )
+
+
+@router.get(
+    "/batch",
+    summary="Get many books by ID",
+    description=(
+        "Retrieve many books with one query. Books come back in the "
+        "order of the ids and ids that do not exist are listed in missing."
+    ),
+    status_code=HTTPStatus.OK,
+    response_model=BookBatchResponse,
+)
+async def read_books_batch(
+    session: ReadSession,
+    book_ids: Annotated[list[int], Depends(parse_ids)],
+    principal: TokenPrincipal = Depends(get_current_principal),
+) -> BookBatchResponse:
+    return await BookService(session).read_books(book_ids)
+
+
+@router.get(
+    "/export",
+    summary="Export books",
+    description=(
+        "Stream every book matching the filters as NDJSON or CSV, ordered by "
+        "id, with constant memory on the server."
+    ),
+    status_code=HTTPStatus.OK,
+    response_class=StreamingResponse,
+)
+async def export_books(
+    session: ReadSession,
+    export_filter: Annotated[BookExportFilter, Query()],
+    principal: TokenPrincipal = Depends(get_current_principal),
+) -> StreamingResponse:
+    return export_response(
+        BookService(session).export_books(
+            title=export_filter.title,
+            publish_year=export_filter.publish_year,
+            title_mode=export_filter.title_mode,
+        ),
+        fields=list(BookPublic.model_fields),
+        format=export_filter.format,
+        filename="books",
+    )
+
+
 @router.get(
     "/{book_id}",
     summary="Get book by ID",
-    description="Retrieve a book by its ID.",
+    description=(
+        "Retrieve a book by its ID. expand=author embeds the author in the "
+        "same query; fields (e.g. id,title) returns only those fields."
+    ),
     status_code=HTTPStatus.OK,
-    response_model=BookPublic,
+    response_model=BookPublic | BookWithAuthor,
 )
 async def read_book(
     book_id: int,
+    session: ReadSession,
+    conditions: Annotated[ConditionalRequest, Depends()],
+    expand: BookExpand | None = None,
+    fields: str | None = None,
+    principal: TokenPrincipal = Depends(get_current_principal),
+) -> BookPublic | BookWithAuthor:
+    book_service = BookService(session)
+    parsed_fields = parse_fields(fields, BookPublic, expand)
+
+    if expand == BookExpand.AUTHOR:
+        # Not cached, since author updates would have to invalidate every
+        # book of the author.
+        book = await book_service.read_book_with_author(book_id)
+
+        return representation_response(
+            page_validators([book], None, expand),
+            conditions,
+            lambda: encode_model(book, BookWithAuthor),
+        )
+
+    return await entity_response(
+        book_service,
+        resource="book",
+        id=book_id,
+        schema=BookPublic,
+        read=book_service.read_book,
+        conditions=conditions,
+        cache=response_cache,
+        fields=parsed_fields,
+    )
+
+
+@router.patch(
+    "/{book_id}",
+    summary="Update book by ID",
+    description="Update a book's details by its ID.",
+    status_code=HTTPStatus.OK,
+    response_model=BookPublic,
+)
+async def update_book(
+    book_id: int,
+    book_data: BookCreate,
     session: Session,
     current_user: Account = Depends(get_current_user),
 ) -> BookPublic:
-    return await BookService(session).read_book(book_id)
+    return await BookService(session).update_book(book_id, book_data)
+
+
+@router.delete(
+    "/{book_id}",
+    summary="Delete book by ID",
+    description="Delete a book by its ID.",
+    status_code=HTTPStatus.OK,
+    response_model=BookMessageResponse,
+)
+async def delete_book(
+    book_id: int,
+    session: Session,
+    current_user: Account = Depends(get_current_user),
+) -> BookMessageResponse:
+    return await BookService(session).delete_book(book_id)
 
 
 @router.get(
     "/",
     summary="Get all books with optional filtering by title and publish year",
-    description="Retrieve a list of all books.",
+    description=(
+        "Retrieve a list of all books. When more books are available, the "
+        "X-Next-Cursor header holds the cursor of the next page. "
+        "expand=author embeds each book's author as BookWithAuthor, loaded "
+        "in the same query; fields (e.g. id,title) selects and returns only "
+        "those fields."
+    ),
     status_code=HTTPStatus.OK,
     response_model=list[BookPublic],
 )
 async def read_all_books(
-    session: Session,
+    session: ReadSession,
+    conditions: Annotated[ConditionalRequest, Depends()],
     filter_books: Annotated[FilterPage, Query()],
-    current_user: Account = Depends(get_current_user),
+    principal: TokenPrincipal = Depends(get_current_principal),
 ) -> list[BookPublic]:
-    return await BookService(session).read_all_books(
+    fields = parse_fields(filter_books.fields, BookPublic, filter_books.expand)
+    book_service = BookService(session)
+    books, next_cursor = await book_service.read_all_books(
         title=filter_books.title,
         publish_year=filter_books.publish_year,
         skip=filter_books.skip,
         limit=filter_books.limit,
+        cursor=filter_books.cursor,
+        sort=filter_books.sort,
+        title_mode=filter_books.title_mode,
+        expand=filter_books.expand,
+        fields=fields,
     )
+
+    headers = {"X-Next-Cursor": next_cursor} if next_cursor else {}
+
+    return representation_response(
+        page_validators(books, next_cursor, filter_books.expand, fields),
+        conditions,
+        lambda: encode_books(books, filter_books.expand, fields),
+        headers,
+    )
+
+
+def page_validators(
+    books: list[Any],
+    next_cursor: str | None,
+    expand: BookExpand | None = None,
+    fields: Sequence[str] | None = None,
+) -> Validators:
+    """
+    Validators of a page of books. Expanded pages also depend on the
+    updated_at of the embedded authors.
+    """
+
+    rows = [(book.id, book.updated_at) for book in books]
+    extra: list[Any] = [next_cursor]
+
+    if fields:
+        extra.append(",".join(fields))
+
+    if expand == BookExpand.AUTHOR:
+        rows.extend(
+            (f"author:{book.author.id}", book.author.updated_at)
+            for book in books
+            if book.author
+        )
+        extra.append(expand.value)
+
+    return Validators.for_page("book", rows, *extra)
+
+
+def encode_books(
+    books: list[Any],
+    expand: BookExpand | None = None,
+    fields: Sequence[str] | None = None,
+) -> bytes:
+    """
+    Serialize a page of books as a JSON list of BookPublic, of
+    BookWithAuthor for expand=author, or of the requested fields only.
+    """
+
+    if expand == BookExpand.AUTHOR:
+        return encode_list(books, BookWithAuthor)
+
+    return encode_rows(books, fields or BookPublic.model_fields)
@@ -0,0 +1,36 @@
+from fastapi import APIRouter, Depends
+from http import HTTPStatus
+from maddr_api.config.database import DatabaseSession
+from maddr_api.config.pool import pool_stats
+from maddr_api.schemas.metrics import MetricsResponse
+from maddr_api.security.get_current_user import account_cache
+from maddr_api.security.hash_password import password_hash_pool
+from maddr_api.security.metrics_token import require_metrics_token
+from maddr_api.services.cache import response_cache
+
+router = APIRouter(prefix="/metrics", tags=["metrics"])
+
+
+@router.get(
+    "/",
+    summary="Get runtime metrics",
+    description=(
+        "Report database pool checkouts, waits and timeouts of the primary "
+        "and of each replica together with the account cache, password "
+        "hashing pool and response cache counters. Requires the "
+        "METRICS_TOKEN setting in the X-Metrics-Token header."
+    ),
+    status_code=HTTPStatus.OK,
+    response_model=MetricsResponse,
+    dependencies=[Depends(require_metrics_token)],
+)
+async def read_metrics() -> MetricsResponse:
+    return MetricsResponse(
+        database_pools={
+            label: pool_stats(engine.sync_engine.pool)
+            for label, engine in DatabaseSession.engines().items()
+        },
+        account_cache=account_cache.stats(),
+        password_hash_pool=password_hash_pool.stats(),
+        response_cache=response_cache.stats(),
+    )
@@ -1,7 +1,11 @@
 from fastapi import APIRouter, Depends
 from fastapi.security import OAuth2PasswordRequestForm
 from http import HTTPStatus
-from maddr_api.schemas.token import Token
+from maddr_api.schemas.token import (
+    RefreshTokenRequest,
+    Token,
+    TokenMessageResponse,
+)
 from maddr_api.config.database import DatabaseSession
 from maddr_api.services.token import TokenService
 from typing import Annotated
@@ -29,12 +33,33 @@ async def generate_token(
 @router.post(
     "/refresh-token",
     summary="Refresh access token",
-    description="Refresh the access token for a user.",
+    description=(
+        "Exchange a refresh token for a new access token. The refresh token "
+        "is rotated: the one sent is revoked and a new one is returned."
+    ),
     status_code=HTTPStatus.OK,
     response_model=Token,
 )
 async def refresh_token(
-    form_data: OAuth2PasswordRequestForm = Depends(),
+    token_data: RefreshTokenRequest,
     session: DatabaseSession = Depends(DatabaseSession.get_session),
 ) -> Token:
-    return await TokenService(session).refresh_access_token(form_data)
+    return await TokenService(session).refresh_access_token(
+        token_data.refresh_token
+    )
+
+
+@router.post(
+    "/revoke",
+    summary="Revoke refresh token",
+    description="Revoke a refresh token and every token rotated from it.",
+    status_code=HTTPStatus.OK,
+    response_model=TokenMessageResponse,
+)
+async def revoke_token(
+    token_data: RefreshTokenRequest,
+    session: DatabaseSession = Depends(DatabaseSession.get_session),
+) -> TokenMessageResponse:
+    return await TokenService(session).revoke_refresh_token(
+        token_data.refresh_token
+    )
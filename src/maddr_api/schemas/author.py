@@ -1,4 +1,8 @@
-from pydantic import BaseModel
+from enum import Enum
+
+from pydantic import BaseModel, Field
+
+from maddr_api.schemas.bulk import BulkStatus
 
 
 class AuthorCreate(BaseModel):
@@ -17,9 +21,66 @@ class AuthorPublic(AuthorCreate):
     id: int
 
 
+class AuthorBatchResponse(BaseModel):
+    """
+    Schema for a batch read of authors, in request order.
+    """
+
+    authors: list[AuthorPublic]
+    missing: list[int]
+
+
 class AuthorMessageResponse(BaseModel):
     """
     Schema for a message response related to authors.
     """
 
     message: str
+
+
+class AuthorBulkCreate(BaseModel):
+    """
+    Schema for creating many authors in a single request.
+    """
+
+    authors: list[AuthorCreate] = Field(min_length=1)
+
+
+class AuthorBulkItem(BaseModel):
+    """
+    Result of a single author in a bulk creation, aligned with the input index.
+    """
+
+    index: int
+    status: BulkStatus
+    author: AuthorPublic | None = None
+    detail: str | None = None
+
+
+class AuthorBulkResponse(BaseModel):
+    """
+    Schema for the per-item results of a bulk author creation.
+    """
+
+    created: int
+    duplicates: int
+    invalid: int
+    items: list[AuthorBulkItem]
+
+
+class AuthorExpand(str, Enum):
+    BOOKS = "books"
+
+
+class AuthorExpandPage(BaseModel):
+    """
+    Schema for expanding an author with a page of their books.
+
+    fields is a comma separated subset of the AuthorPublic fields to return
+    instead.
+    """
+
+    expand: AuthorExpand | None = None
+    books_limit: int = Field(20, ge=1)
+    books_skip: int = Field(0, ge=0)
+    fields: str | None = None
@@ -1,5 +1,10 @@
+from enum import Enum
+
 from pydantic import BaseModel, Field
 
+from maddr_api.schemas.bulk import BulkStatus
+from maddr_api.schemas.export import FileFormat
+
 
 class BookBase(BaseModel):
     """
@@ -27,6 +32,15 @@ class BookPublic(BookBase):
     id: int
 
 
+class BookBatchResponse(BaseModel):
+    """
+    Schema for a batch read of books, in request order.
+    """
+
+    books: list[BookPublic]
+    missing: list[int]
+
+
 class BookMessageResponse(BaseModel):
     """
     Schema for a message response related to books.
@@ -35,12 +49,83 @@ class BookMessageResponse(BaseModel):
     message: str
 
 
-class FilterPage(BaseModel):
+class BookBulkCreate(BaseModel):
     """
-    Schema for pagination and filtering of books.
+    Schema for creating many books in a single request.
+    """
+
+    books: list[BookCreate] = Field(min_length=1)
+
+
+class BookBulkItem(BaseModel):
+    """
+    Result of a single book in a bulk creation, aligned with the input index.
+    """
+
+    index: int
+    status: BulkStatus
+    book: BookPublic | None = None
+    detail: str | None = None
+
+
+class BookBulkResponse(BaseModel):
+    """
+    Schema for the per-item results of a bulk book creation.
+    """
+
+    created: int
+    duplicates: int
+    invalid: int
+    items: list[BookBulkItem]
+
+
+class BookSortField(str, Enum):
+    ID = "id"
+    TITLE = "title"
+    PUBLISH_YEAR = "publish_year"
+
+
+class BookExpand(str, Enum):
+    AUTHOR = "author"
+
+
+class TitleSearchMode(str, Enum):
+    FULLTEXT = "fulltext"
+    SUBSTRING = "substring"
+
+
+class BookFilter(BaseModel):
+    """
+    Schema for filtering books.
     """
 
     publish_year: int | None = None
     title: str | None = None
+    title_mode: TitleSearchMode = TitleSearchMode.FULLTEXT
+
+
+class BookExportFilter(BookFilter):
+    """
+    Schema for filtering a book export.
+    """
+
+    format: FileFormat = FileFormat.NDJSON
+
+
+class FilterPage(BookFilter):
+    """
+    Schema for pagination and filtering of books.
+
+    When a cursor is given, skip is ignored and the page starts right after
+    the row the cursor points to. Full-text title searches without an
+    explicit sort are ranked by relevance and paged with skip/limit.
+    expand=author embeds the author of every book, and fields is a comma
+    separated subset of the BookPublic fields to return.
+    """
+
     limit: int = Field(20, ge=1)
     skip: int = Field(0, ge=0)
+    cursor: str | None = None
+    sort: BookSortField | None = None
+    expand: BookExpand | None = None
+    fields: str | None = None
@@ -0,0 +1,11 @@
+from enum import Enum
+
+
+class BulkStatus(str, Enum):
+    """
+    Outcome of a single item in a bulk operation.
+    """
+
+    CREATED = "created"
+    DUPLICATE = "duplicate"
+    INVALID = "invalid"
@@ -0,0 +1,22 @@
+from maddr_api.schemas.author import AuthorPublic
+from maddr_api.schemas.book import BookPublic
+
+
+class BookWithAuthor(BookPublic):
+    """
+    Public representation of a book with its author embedded.
+    """
+
+    author: AuthorPublic | None
+
+
+class AuthorWithBooks(AuthorPublic):
+    """
+    Public representation of an author with a page of their books embedded.
+
+    books_next_skip is the books_skip of the next page, or None on the last
+    one.
+    """
+
+    books: list[BookPublic]
+    books_next_skip: int | None
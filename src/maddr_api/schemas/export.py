@@ -0,0 +1,10 @@
+from enum import Enum
+
+
+class FileFormat(str, Enum):
+    """
+    File formats of the streaming exports and imports.
+    """
+
+    NDJSON = "ndjson"
+    CSV = "csv"
@@ -0,0 +1,38 @@
+from pydantic import BaseModel
+
+
+class ImportRowError(BaseModel):
+    """
+    A row of an import that could not be used.
+    """
+
+    row: int
+    detail: str
+
+
+class ImportBatchResult(BaseModel):
+    """
+    Outcome of one batch of an import, committed in its own transaction.
+    """
+
+    batch: int
+    first_row: int
+    rows: int
+    created: int = 0
+    duplicates: int = 0
+    invalid: int = 0
+    error: str | None = None
+
+
+class ImportSummary(BaseModel):
+    """
+    Schema for the summary of a streaming import.
+
+    Only the first IMPORT_MAX_REPORTED_ERRORS invalid rows are listed.
+    """
+
+    created: int = 0
+    duplicates: int = 0
+    invalid: int = 0
+    batches: list[ImportBatchResult] = []
+    errors: list[ImportRowError] = []
@@ -0,0 +1,14 @@
+from typing import Any
+
+from pydantic import BaseModel
+
+
+class MetricsResponse(BaseModel):
+    """
+    Schema for the internal runtime metrics.
+    """
+
+    database_pools: dict[str, dict[str, Any]]
+    account_cache: dict[str, Any]
+    password_hash_pool: dict[str, Any]
+    response_cache: dict[str, Any]
@@ -4,8 +4,35 @@ from pydantic import BaseModel
 class Token(BaseModel):
     access_token: str
     token_type: str
+    refresh_token: str
 
 
 class TokenRequest(BaseModel):
     email: str
     password: str
+
+
+class RefreshTokenRequest(BaseModel):
+    """
+    Schema for exchanging or revoking a refresh token.
+    """
+
+    refresh_token: str
+
+
+class TokenMessageResponse(BaseModel):
+    """
+    Schema for a message response related to tokens.
+    """
+
+    message: str
+
+
+class TokenPrincipal(BaseModel):
+    """
+    Authenticated caller as described by the access token claims.
+    """
+
+    id: int
+    username: str
+    token_version: int
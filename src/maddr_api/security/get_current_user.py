@@ -1,50 +1,93 @@
 from http import HTTPStatus
 from fastapi import Depends, HTTPException
 from fastapi.security import OAuth2PasswordBearer
-from jwt import DecodeError, decode
-from sqlalchemy import select
+from jwt import InvalidTokenError, decode
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from maddr_api.config.database import DatabaseSession
 from maddr_api.config.settings import Settings
 from maddr_api.models.account import Account
+from maddr_api.schemas.token import TokenPrincipal
+from maddr_api.utils.cache import LRUCache
+from maddr_api.utils.timing import timed
 
 settings = Settings()
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
 
+account_cache: LRUCache[Account] = LRUCache(
+    max_size=settings.ACCOUNT_CACHE_MAX_SIZE,
+    ttl_seconds=settings.ACCOUNT_CACHE_TTL_SECONDS,
+)
 
-async def get_current_user(
-    session: AsyncSession = Depends(DatabaseSession.get_session),
-    token: str = Depends(oauth2_scheme),
-) -> Account:
-    """
-    Retrieve the current authenticated user based on the provided JWT token.
-    """
-    credentials_exception = HTTPException(
+
+def credentials_exception() -> HTTPException:
+    return HTTPException(
         status_code=HTTPStatus.UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
 
+
+async def get_current_principal(
+    token: str = Depends(oauth2_scheme),
+) -> TokenPrincipal:
+    """
+    Build the authenticated principal from the signed token claims only.
+
+    Use it in routes that just need an authenticated caller; it never
+    touches the database.
+    """
+
     try:
         payload = decode(
             jwt=token,
             key=settings.SECRET_KEY,
             algorithms=[settings.ALGORITHM],
         )
-        subject_username = payload.get("sub")
+    except InvalidTokenError:
+        raise credentials_exception()
 
-        if not subject_username:
-            raise credentials_exception
+    subject_username = payload.get("sub")
+    account_id = payload.get("uid")
+    token_version = payload.get("ver")
 
-    except DecodeError:
-        raise credentials_exception
+    if not subject_username or account_id is None or token_version is None:
+        raise credentials_exception()
 
-    account = await session.scalar(
-        select(Account).where(Account.username == subject_username)
+    return TokenPrincipal(
+        id=account_id,
+        username=subject_username,
+        token_version=token_version,
     )
 
+
+async def get_current_user(
+    session: AsyncSession = Depends(DatabaseSession.get_session),
+    principal: TokenPrincipal = Depends(get_current_principal),
+) -> Account:
+    """
+    Retrieve the current authenticated user by the account id in the JWT
+    token, rejecting tokens whose username or version no longer match.
+    """
+
+    account = account_cache.get(principal.id)
+
     if not account:
-        raise credentials_exception
+        with timed("auth"):
+            account = await session.get(Account, principal.id)
+
+        if not account:
+            raise credentials_exception()
+
+        # Detach the row so a later rollback in this session cannot expire
+        # the instance that is shared with other requests through the cache.
+        session.expunge(account)
+        account_cache.set(principal.id, account)
+
+    if (
+        account.username != principal.username
+        or account.token_version != principal.token_version
+    ):
+        raise credentials_exception()
 
     return account
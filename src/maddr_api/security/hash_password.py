@@ -1,7 +1,23 @@
+import asyncio
+from concurrent.futures import (
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from http import HTTPStatus
+from typing import Any, Callable, Optional, TypeVar
+
+from fastapi import HTTPException
 from pwdlib import PasswordHash
 
+from maddr_api.config.settings import Settings
+from maddr_api.utils.timing import timed
+
+settings = Settings()
 pwd_context = PasswordHash.recommended()
 
+ResultType = TypeVar("ResultType")
+
 
 def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
@@ -9,3 +25,124 @@ def get_password_hash(password: str) -> str:
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
+
+
+class PasswordHashPool:
+    """
+    Bounded worker pool that runs argon2 hashing off the event loop.
+
+    At most max_pending jobs are admitted at once, counting the running ones;
+    further calls are rejected with 503 instead of queueing without limit.
+    """
+
+    def __init__(self, executor_type: str, max_workers: int, max_pending: int):
+        self.executor_type = executor_type
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.in_flight = 0
+        self.max_queue_depth = 0
+        self.completed = 0
+        self.rejected = 0
+        self._executor: Optional[Executor] = None
+        self._slots = asyncio.Semaphore(max_pending)
+
+    @property
+    def executor(self) -> Executor:
+        """
+        Create the underlying executor on first use.
+        """
+
+        if self._executor is None:
+            if self.executor_type == "process":
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers
+                )
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="password-hash",
+                )
+
+        return self._executor
+
+    @property
+    def queue_depth(self) -> int:
+        """
+        Number of submitted jobs waiting for a free worker.
+        """
+
+        return max(self.in_flight - self.max_workers, 0)
+
+    async def run(
+        self, func: Callable[..., ResultType], *args: Any
+    ) -> ResultType:
+        """
+        Run a hashing function in the pool and await its result.
+        """
+
+        if self._slots.locked():
+            self.rejected += 1
+            raise HTTPException(
+                status_code=HTTPStatus.SERVICE_UNAVAILABLE,
+                detail="Too many password hashing requests, try again later.",
+            )
+
+        loop = asyncio.get_running_loop()
+
+        # The semaphore is never contended here, so acquiring it cannot
+        # block and it stays usable across event loops.
+        await self._slots.acquire()
+        self.in_flight += 1
+        self.max_queue_depth = max(self.max_queue_depth, self.queue_depth)
+
+        try:
+            with timed("hash"):
+                return await loop.run_in_executor(self.executor, func, *args)
+        finally:
+            self.in_flight -= 1
+            self.completed += 1
+            self._slots.release()
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Return the pool configuration and queue-depth counters.
+        """
+
+        return {
+            "executor": self.executor_type,
+            "max_workers": self.max_workers,
+            "max_pending": self.max_pending,
+            "in_flight": self.in_flight,
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+            "completed": self.completed,
+            "rejected": self.rejected,
+        }
+
+    def shutdown(self) -> None:
+        """
+        Stop the workers; a new executor is created on the next call.
+        """
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+
+password_hash_pool = PasswordHashPool(
+    executor_type=settings.PASSWORD_HASH_EXECUTOR,
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    max_pending=settings.PASSWORD_HASH_MAX_PENDING,
+)
+
+
+async def get_password_hash_async(password: str) -> str:
+    return await password_hash_pool.run(get_password_hash, password)
+
+
+async def verify_password_async(
+    plain_password: str, hashed_password: str
+) -> bool:
+    return await password_hash_pool.run(
+        verify_password, plain_password, hashed_password
+    )
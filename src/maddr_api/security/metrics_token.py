@@ -0,0 +1,31 @@
+from http import HTTPStatus
+from secrets import compare_digest
+from typing import Annotated, Optional
+
+from fastapi import Header, HTTPException
+
+from maddr_api.config.settings import Settings
+
+settings = Settings()
+
+
+async def require_metrics_token(
+    x_metrics_token: Annotated[Optional[str], Header()] = None,
+) -> None:
+    """
+    Only let through callers that send the METRICS_TOKEN setting in the
+    X-Metrics-Token header. Without the setting the metrics stay hidden.
+    """
+
+    if not settings.METRICS_TOKEN:
+        raise HTTPException(
+            status_code=HTTPStatus.NOT_FOUND, detail="Not Found"
+        )
+
+    if x_metrics_token is None or not compare_digest(
+        x_metrics_token.encode(), settings.METRICS_TOKEN.encode()
+    ):
+        raise HTTPException(
+            status_code=HTTPStatus.FORBIDDEN,
+            detail="Invalid metrics token.",
+        )
@@ -0,0 +1,25 @@
+import secrets
+from datetime import datetime, timedelta
+from hashlib import sha256
+from zoneinfo import ZoneInfo
+
+from maddr_api.config.settings import Settings
+
+settings = Settings()
+
+
+def hash_refresh_token(token: str) -> str:
+    return sha256(token.encode()).hexdigest()
+
+
+def create_refresh_token() -> tuple[str, str, datetime]:
+    """
+    Generate an opaque refresh token, its stored hash and its expiry.
+    """
+
+    token = secrets.token_urlsafe(32)
+    expires_at = datetime.now(tz=ZoneInfo("UTC")).replace(
+        tzinfo=None
+    ) + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
+
+    return token, hash_refresh_token(token), expires_at
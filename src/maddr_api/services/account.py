@@ -1,11 +1,17 @@
 from http import HTTPStatus
 from typing import Any
 from fastapi import HTTPException
-from maddr_api.schemas.account import AccountCreate, AccountMessageResponse
+from maddr_api.schemas.account import (
+    AccountCreate,
+    AccountMessageResponse,
+)
 from maddr_api.models.account import Account
+from maddr_api.models.refresh_token import RefreshToken
 from maddr_api.services.main import AccountSearchField
 from maddr_api.services.main import BaseCRUD
-from maddr_api.security.hash_password import get_password_hash
+from maddr_api.security.get_current_user import account_cache
+from maddr_api.security.hash_password import get_password_hash_async
+from sqlalchemy import delete, update
 from sqlalchemy.ext.asyncio import AsyncSession as Session
 
 
@@ -14,17 +20,23 @@ class AccountService(BaseCRUD[Account, AccountCreate]):
     Service layer for account operations.
     """
 
+    unique_fields = {
+        AccountSearchField.USERNAME.value: "Username already exists.",
+        AccountSearchField.EMAIL.value: "Email already exists.",
+    }
+
     def __init__(self, session: Session):
         super().__init__(model=Account, session=session)
 
     async def create_account(self, account_data: AccountCreate) -> Account:
         """
-        Create a new account after checking for existing username and email.
+        Create a new account; duplicate usernames and emails are rejected by
+        the unique constraints.
         """
 
-        await self.validate_account_uniqueness(account_data)
-
-        account_data.password = get_password_hash(account_data.password)
+        account_data.password = await get_password_hash_async(
+            account_data.password
+        )
 
         return await self.create(account_data)
 
@@ -45,22 +57,41 @@ class AccountService(BaseCRUD[Account, AccountCreate]):
     ) -> Account:
         """
         Update an existing account by its ID.
-        """
 
-        await self.validate_account_exists(account_id=account_id)
+        The new password bumps token_version and revokes every refresh token
+        of the account in the same transaction, so sessions opened with the
+        old password cannot be renewed.
+        """
 
-        await self.validate_account_uniqueness(account_data)
+        if current_user.id != account_id:
+            await self.validate_account_exists(account_id=account_id)
 
         await self.validate_account_access(account_id, current_user)
 
-        account_data.password = get_password_hash(account_data.password)
+        account_data.password = await get_password_hash_async(
+            account_data.password
+        )
 
+        await self.session.execute(
+            update(RefreshToken)
+            .where(RefreshToken.account_id == account_id)
+            .values(revoked=True)
+        )
         account = await self.update(
             id_column="id",
             value=account_id,
             update_data=account_data,
+            extra_values={"token_version": Account.token_version + 1},
         )
 
+        if not account:
+            raise HTTPException(
+                status_code=HTTPStatus.NOT_FOUND,
+                detail="Account not found.",
+            )
+
+        account_cache.invalidate(current_user.id)
+
         return account
 
     async def delete_account(
@@ -68,13 +99,28 @@ class AccountService(BaseCRUD[Account, AccountCreate]):
     ) -> AccountMessageResponse:
         """
         Delete an account by its ID.
+
+        Its refresh tokens are deleted in the same transaction, so they
+        cannot be exchanged once another account reuses the id.
         """
 
-        await self.validate_account_exists(account_id)
+        if current_user.id != account_id:
+            await self.validate_account_exists(account_id)
 
         await self.validate_account_access(account_id, current_user)
 
-        await self.delete(id_column="id", value=account_id)
+        await self.session.execute(
+            delete(RefreshToken).where(RefreshToken.account_id == account_id)
+        )
+        deleted = await self.delete(id_column="id", value=account_id)
+
+        if not deleted:
+            raise HTTPException(
+                status_code=HTTPStatus.NOT_FOUND,
+                detail="Account not found.",
+            )
+
+        account_cache.invalidate(current_user.id)
 
         return AccountMessageResponse(message="Account deleted successfully.")
 
@@ -103,23 +149,3 @@ class AccountService(BaseCRUD[Account, AccountCreate]):
                 status_code=HTTPStatus.FORBIDDEN,
                 detail="Not authorized to modify this account.",
             )
-
-    async def validate_account_uniqueness(
-        self, account_data: AccountCreate
-    ) -> None:
-        """
-        Validate if the username or email already exists.
-        """
-
-        for field, message in [
-            (AccountSearchField.USERNAME, "Username already exists."),
-            (AccountSearchField.EMAIL, "Email already exists."),
-        ]:
-            existing_account = await self.read(
-                field.value, getattr(account_data, field.value)
-            )
-            if existing_account:
-                raise HTTPException(
-                    status_code=HTTPStatus.CONFLICT,
-                    detail=message,
-                )
@@ -1,17 +1,43 @@
 from fastapi import HTTPException
-from maddr_api.schemas.author import AuthorCreate, AuthorMessageResponse
+from pydantic import ValidationError
+from maddr_api.schemas.author import (
+    AuthorBatchResponse,
+    AuthorBulkCreate,
+    AuthorBulkItem,
+    AuthorBulkResponse,
+    AuthorCreate,
+    AuthorMessageResponse,
+    AuthorPublic,
+)
+from maddr_api.schemas.bulk import BulkStatus
+from maddr_api.schemas.imports import ImportRowError, ImportSummary
 from maddr_api.models.author import Author
+from maddr_api.models.book import Book
+from maddr_api.services.cache import response_cache
+from maddr_api.services.imports import import_records
 from maddr_api.services.main import BaseCRUD
+from sqlalchemy import exists, select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession as Session
 from http import HTTPStatus
+from typing import Any, AsyncIterator, Optional, Sequence
+from maddr_api.utils.importer import ImportRecord, validation_detail
 from maddr_api.utils.sanitization import sanitization_string
 
+BULK_DETAILS = {
+    BulkStatus.DUPLICATE: "An author with this name already exists.",
+    BulkStatus.INVALID: "Author name is empty after sanitization.",
+}
+AUTHOR_HAS_BOOKS = "Author still has books and cannot be deleted."
+
 
 class AuthorService(BaseCRUD[Author, AuthorCreate]):
     """
     Service layer for author operations.
     """
 
+    unique_fields = {"name": "An author with this name already exists."}
+
     def __init__(self, session: Session):
         super().__init__(model=Author, session=session)
 
@@ -22,17 +48,96 @@ class AuthorService(BaseCRUD[Author, AuthorCreate]):
 
         author_data.name = sanitization_string(author_data.name)
 
-        existing_author = await self.read(
-            search_field="name", value=author_data.name
-        )
+        author = await self.create(author_data)
+        await response_cache.invalidate("author", author.id)
 
-        if existing_author:
-            raise HTTPException(
-                status_code=HTTPStatus.CONFLICT,
-                detail="An author with this name already exists.",
+        return author
+
+    async def create_authors(
+        self, bulk_data: AuthorBulkCreate
+    ) -> AuthorBulkResponse:
+        """
+        Create many authors at once, reporting the outcome of each one.
+
+        Names already stored or repeated within the request are reported as
+        duplicates instead of failing the whole batch.
+        """
+
+        for author_data in bulk_data.authors:
+            author_data.name = sanitization_string(author_data.name)
+
+        results = await self.create_many_unique(bulk_data.authors, "name")
+
+        items = [
+            AuthorBulkItem(
+                index=index,
+                status=status,
+                author=AuthorPublic.model_validate(
+                    author, from_attributes=True
+                )
+                if author
+                else None,
+                detail=BULK_DETAILS.get(status),
             )
+            for index, (status, author) in enumerate(results)
+        ]
+        statuses = [item.status for item in items]
+
+        return AuthorBulkResponse(
+            created=statuses.count(BulkStatus.CREATED),
+            duplicates=statuses.count(BulkStatus.DUPLICATE),
+            invalid=statuses.count(BulkStatus.INVALID),
+            items=items,
+        )
+
+    async def import_authors(
+        self, records: AsyncIterator[ImportRecord]
+    ) -> ImportSummary:
+        """
+        Import authors from parsed CSV/NDJSON records with a name each.
+        """
+
+        return await import_records(
+            self, records, self.build_import_batch, unique_field="name"
+        )
+
+    async def build_import_batch(
+        self, batch: list[ImportRecord]
+    ) -> tuple[list[tuple[int, AuthorCreate]], list[ImportRowError]]:
+        """
+        Validate and sanitize a batch of author records.
+        """
+
+        authors, errors = [], []
 
-        return await self.create(author_data)
+        for row, record, error in batch:
+            if error:
+                errors.append(ImportRowError(row=row, detail=error))
+                continue
+
+            try:
+                author = AuthorCreate.model_validate(record)
+            except ValidationError as validation_error:
+                errors.append(
+                    ImportRowError(
+                        row=row, detail=validation_detail(validation_error)
+                    )
+                )
+                continue
+
+            author.name = sanitization_string(author.name)
+            authors.append((row, author))
+
+        return authors, errors
+
+    def export_authors(self) -> AsyncIterator[Sequence[Any]]:
+        """
+        Stream every author, ordered by id, in batches of AuthorPublic rows.
+        """
+
+        return self.stream_rows(
+            select(*self.public_columns(AuthorPublic)).order_by(self.model.id)
+        )
 
     async def read_author(self, author_id: int) -> Author:
         """
@@ -49,6 +154,52 @@ class AuthorService(BaseCRUD[Author, AuthorCreate]):
 
         return author
 
+    async def read_authors(self, author_ids: list[int]) -> AuthorBatchResponse:
+        """
+        Read many authors by id with a single query, keeping the order of
+        the ids and listing the ones that do not exist.
+        """
+
+        authors = await self.read_many(search_field="id", values=author_ids)
+
+        return AuthorBatchResponse(
+            authors=[
+                AuthorPublic.model_validate(authors[id], from_attributes=True)
+                for id in author_ids
+                if id in authors
+            ],
+            missing=[id for id in author_ids if id not in authors],
+        )
+
+    async def read_author_books(
+        self, author_id: int, skip: int, limit: int
+    ) -> tuple[Author, list[Book], Optional[int]]:
+        """
+        Read an author by its ID together with a page of their books.
+
+        The page is read with one query on book.author_id ordered by id, so
+        any page costs two queries. Returns the skip of the next page as
+        well, or None on the last one.
+        """
+
+        author = await self.read_author(author_id)
+        books = list(
+            await self.session.scalars(
+                select(Book)
+                .where(Book.author_id == author_id)
+                .order_by(Book.id)
+                .offset(skip)
+                .limit(limit + 1)
+            )
+        )
+        next_skip = None
+
+        if len(books) > limit:
+            books = books[:limit]
+            next_skip = skip + limit
+
+        return author, books, next_skip
+
     async def update_author(
         self, author_id: int, author_data: AuthorCreate
     ) -> Author:
@@ -56,45 +207,51 @@ class AuthorService(BaseCRUD[Author, AuthorCreate]):
         Update an author by its ID.
         """
 
-        check_author = await self.read(search_field="id", value=author_id)
-
-        if not check_author:
-            raise HTTPException(
-                status_code=HTTPStatus.NOT_FOUND,
-                detail="Author not found.",
-            )
-
         author_data.name = sanitization_string(author_data.name)
 
-        existing_author = await self.read(
-            search_field="name", value=author_data.name
+        author = await self.update(
+            id_column="id",
+            value=author_id,
+            update_data=author_data,
         )
 
-        if existing_author and existing_author.id != author_id:
+        if not author:
             raise HTTPException(
-                status_code=HTTPStatus.CONFLICT,
-                detail="An author with this name already exists.",
+                status_code=HTTPStatus.NOT_FOUND,
+                detail="Author not found.",
             )
 
-        return await self.update(
-            id_column="id",
-            value=author_id,
-            update_data=author_data,
-        )
+        await response_cache.invalidate("author", author_id)
+
+        return author
 
     async def delete_author(self, author_id: int) -> AuthorMessageResponse:
         """
         Delete an author by its ID.
+
+        Authors who still have books are kept and reported as a conflict.
+        The check is part of the DELETE itself, so the existence of the
+        author is only read when nothing was deleted.
         """
 
-        author = await self.read(search_field="id", value=author_id)
+        has_books = exists().where(Book.author_id == Author.id)
 
-        if not author:
+        try:
+            deleted = await self.delete("id", author_id, ~has_books)
+        except IntegrityError as error:
             raise HTTPException(
-                status_code=HTTPStatus.NOT_FOUND,
-                detail="Author not found.",
+                status_code=HTTPStatus.CONFLICT,
+                detail=AUTHOR_HAS_BOOKS,
+            ) from error
+
+        if not deleted:
+            await self.read_author(author_id)
+
+            raise HTTPException(
+                status_code=HTTPStatus.CONFLICT,
+                detail=AUTHOR_HAS_BOOKS,
             )
 
-        await self.delete(id_column="id", value=author_id)
+        await response_cache.invalidate("author", author_id)
 
         return AuthorMessageResponse(message="Author deleted successfully.")
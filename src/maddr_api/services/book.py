@@ -1,18 +1,52 @@
 from fastapi import HTTPException
-from maddr_api.schemas.book import BookCreate, BookPublic
-from maddr_api.models.book import Book
+from pydantic import ValidationError
+from maddr_api.schemas.book import (
+    BookBatchResponse,
+    BookBulkCreate,
+    BookBulkItem,
+    BookBulkResponse,
+    BookCreate,
+    BookExpand,
+    BookMessageResponse,
+    BookPublic,
+    BookSortField,
+    TitleSearchMode,
+)
+from maddr_api.schemas.bulk import BulkStatus
+from maddr_api.schemas.imports import ImportRowError, ImportSummary
+from maddr_api.models.book import Book, book_fts
+from maddr_api.services.author import AuthorService
+from maddr_api.services.cache import response_cache
+from maddr_api.services.imports import import_records
 from maddr_api.services.main import BaseCRUD
-from sqlalchemy import select
+from sqlalchemy import and_, false, func, literal_column, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession as Session
+from sqlalchemy.orm import joinedload
 from http import HTTPStatus
+from typing import Any, AsyncIterator, Sequence
+from maddr_api.utils.importer import ImportRecord, validation_detail
+from maddr_api.utils.pagination import decode_cursor, encode_cursor
 from maddr_api.utils.sanitization import sanitization_string
 
+CURSOR_VALUE_TYPES = {
+    BookSortField.ID: int,
+    BookSortField.TITLE: str,
+    BookSortField.PUBLISH_YEAR: int,
+}
+
+BULK_DETAILS = {
+    BulkStatus.DUPLICATE: "A book with this title already exists.",
+    BulkStatus.INVALID: "Book title is empty after sanitization.",
+}
+
 
 class BookService(BaseCRUD[Book, BookCreate]):
     """
     Service layer for book operations.
     """
 
+    unique_fields = {"title": "A book with this title already exists."}
+
     def __init__(self, session: Session):
         super().__init__(model=Book, session=session)
 
@@ -23,17 +57,122 @@ class BookService(BaseCRUD[Book, BookCreate]):
 
         book_data.title = sanitization_string(book_data.title)
 
-        existing_book = await self.read(
-            search_field="title", value=book_data.title
-        )
+        book = await self.create(book_data)
+        await response_cache.invalidate("book", book.id)
 
-        if existing_book:
-            raise HTTPException(
-                status_code=HTTPStatus.CONFLICT,
-                detail="A book with this title already exists.",
+        return book
+
+    async def create_books(
+        self, bulk_data: BookBulkCreate
+    ) -> BookBulkResponse:
+        """
+        Create many books at once, reporting the outcome of each one.
+
+        Titles already stored or repeated within the request are reported as
+        duplicates instead of failing the whole batch.
+        """
+
+        for book_data in bulk_data.books:
+            book_data.title = sanitization_string(book_data.title)
+
+        results = await self.create_many_unique(bulk_data.books, "title")
+
+        items = [
+            BookBulkItem(
+                index=index,
+                status=status,
+                book=BookPublic.model_validate(book, from_attributes=True)
+                if book
+                else None,
+                detail=BULK_DETAILS.get(status),
             )
+            for index, (status, book) in enumerate(results)
+        ]
+        statuses = [item.status for item in items]
+
+        return BookBulkResponse(
+            created=statuses.count(BulkStatus.CREATED),
+            duplicates=statuses.count(BulkStatus.DUPLICATE),
+            invalid=statuses.count(BulkStatus.INVALID),
+            items=items,
+        )
+
+    async def upsert_books(self, bulk_data: BookBulkCreate) -> list[Book]:
+        """
+        Create many books at once, updating the author and publish year of
+        the titles already stored.
+        """
+
+        for book_data in bulk_data.books:
+            book_data.title = sanitization_string(book_data.title)
+
+        return await self.upsert_many(bulk_data.books, ["title"])
+
+    async def import_books(
+        self, records: AsyncIterator[ImportRecord]
+    ) -> ImportSummary:
+        """
+        Import books from parsed CSV/NDJSON records.
+
+        Each record has a title, a publish_year and either an author_id or
+        an author_name; author names are resolved with one query per batch.
+        """
+
+        return await import_records(
+            self, records, self.build_import_batch, unique_field="title"
+        )
+
+    async def build_import_batch(
+        self, batch: list[ImportRecord]
+    ) -> tuple[list[tuple[int, BookCreate]], list[ImportRowError]]:
+        """
+        Validate and sanitize a batch of book records.
+        """
+
+        author_names = {
+            sanitization_string(str(record["author_name"]))
+            for _, record, _ in batch
+            if record
+            and record.get("author_name")
+            and not record.get("author_id")
+        }
+        author_ids = await AuthorService(self.session).read_id_map(
+            "name", author_names
+        )
+        books, errors = [], []
+
+        for row, record, error in batch:
+            if error:
+                errors.append(ImportRowError(row=row, detail=error))
+                continue
+
+            author_name = record.pop("author_name", None)
 
-        return await self.create(book_data)
+            if not record.get("author_id") and author_name:
+                record["author_id"] = author_ids.get(
+                    sanitization_string(str(author_name))
+                )
+
+                if record["author_id"] is None:
+                    errors.append(
+                        ImportRowError(row=row, detail="Unknown author.")
+                    )
+                    continue
+
+            try:
+                book = BookCreate.model_validate(record)
+            except ValidationError as validation_error:
+                errors.append(
+                    ImportRowError(
+                        row=row, detail=validation_detail(validation_error)
+                    )
+                )
+                continue
+
+            book.title = sanitization_string(book.title)
+            books.append((row, book))
+
+        return books, errors
 
     async def read_book(self, book_id: int) -> Book:
         """
@@ -50,34 +189,270 @@ class BookService(BaseCRUD[Book, BookCreate]):
 
         return book
 
+    async def read_books(self, book_ids: list[int]) -> BookBatchResponse:
+        """
+        Read many books by id with a single query, keeping the order of
+        the ids and listing the ones that do not exist.
+        """
+
+        books = await self.read_many(search_field="id", values=book_ids)
+
+        return BookBatchResponse(
+            books=[
+                BookPublic.model_validate(books[id], from_attributes=True)
+                for id in book_ids
+                if id in books
+            ],
+            missing=[id for id in book_ids if id not in books],
+        )
+
+    async def read_book_with_author(self, book_id: int) -> Book:
+        """
+        Read a book by its ID together with its author, in one joined
+        query.
+        """
+
+        book = await self.session.scalar(
+            select(self.model)
+            .options(joinedload(self.model.author))
+            .where(self.model.id == book_id)
+        )
+
+        if not book:
+            raise HTTPException(
+                status_code=HTTPStatus.NOT_FOUND,
+                detail="Book not found.",
+            )
+
+        return book
+
+    async def update_book(self, book_id: int, book_data: BookCreate) -> Book:
+        """
+        Update a book by its ID.
+        """
+
+        book_data.title = sanitization_string(book_data.title)
+
+        book = await self.update(
+            id_column="id",
+            value=book_id,
+            update_data=book_data,
+        )
+
+        if not book:
+            raise HTTPException(
+                status_code=HTTPStatus.NOT_FOUND,
+                detail="Book not found.",
+            )
+
+        await response_cache.invalidate("book", book_id)
+
+        return book
+
+    async def delete_book(self, book_id: int) -> BookMessageResponse:
+        """
+        Delete a book by its ID.
+        """
+
+        deleted = await self.delete(id_column="id", value=book_id)
+
+        if not deleted:
+            raise HTTPException(
+                status_code=HTTPStatus.NOT_FOUND,
+                detail="Book not found.",
+            )
+
+        await response_cache.invalidate("book", book_id)
+
+        return BookMessageResponse(message="Book deleted successfully.")
+
     async def read_all_books(
         self,
         title: str | None,
         publish_year: int | None,
         skip: int,
         limit: int,
-    ) -> dict[str, list[BookPublic]]:
+        cursor: str | None = None,
+        sort: BookSortField | None = None,
+        title_mode: TitleSearchMode = TitleSearchMode.FULLTEXT,
+        expand: BookExpand | None = None,
+        fields: Sequence[str] | None = None,
+    ) -> tuple[list[Any], str | None]:
         """
         Read all books with optional filtering by title and publish year.
+
+        Books are ordered by the sort key and id. Returns the page together
+        with the cursor of the next one, or None on the last page. With a
+        cursor the page is located by keyset instead of OFFSET, so deep
+        pages cost the same as the first one.
+
+        Titles are matched through the full-text index by default and ranked
+        by relevance when no sort is given; title_mode=substring keeps the
+        previous case-insensitive substring match.
+
+        The page holds read-only Core rows with the BookPublic columns, or
+        only the requested fields, plus what paging and validators need.
+        expand=author loads Book entities with their author in the same
+        query instead, so a page costs one query however many books it
+        holds.
         """
 
+        if expand == BookExpand.AUTHOR:
+            query = select(self.model).options(joinedload(self.model.author))
+        else:
+            query = self.select_fields([
+                *(fields or BookPublic.model_fields),
+                "id",
+                (sort or BookSortField.ID).value,
+                "updated_at",
+            ])
+
+        query, rank_order = self.apply_filters(
+            query, title, publish_year, title_mode
+        )
         filter_conditions = []
+        ranked = sort is None and rank_order is not None and not cursor
+        sort = sort or BookSortField.ID
+        sort_column = getattr(self.model, sort.value)
+        order_by = [sort_column, self.model.id]
 
-        if title:
-            filter_conditions.append(self.model.title.ilike(f"%{title}%"))
+        if ranked:
+            order_by = [rank_order, self.model.id]
+        elif sort == BookSortField.ID:
+            order_by = [self.model.id]
 
-        if publish_year:
-            filter_conditions.append(self.model.publish_year == publish_year)
+        if cursor:
+            last_value, last_id = decode_cursor(
+                cursor, sort.value, CURSOR_VALUE_TYPES[sort]
+            )
 
-        query = select(self.model)
+            if sort == BookSortField.ID:
+                filter_conditions.append(self.model.id > last_id)
+            else:
+                filter_conditions.append(
+                    or_(
+                        sort_column > last_value,
+                        and_(
+                            sort_column == last_value,
+                            self.model.id > last_id,
+                        ),
+                    )
+                )
 
         if filter_conditions:
             query = query.where(*filter_conditions)
 
-        query = query.offset(skip).limit(limit)
-        result = await self.session.scalars(query)
+        query = query.order_by(*order_by).limit(limit + 1)
+
+        if not cursor:
+            query = query.offset(skip)
+
+        if expand == BookExpand.AUTHOR:
+            rows = (await self.session.scalars(query)).all()
+        else:
+            rows = await self.read_rows(query)
+
+        books = self.ensure_books_found(list(rows))
+        next_cursor = None
+
+        if len(books) > limit:
+            books = books[:limit]
+            last_book = books[-1]
+
+            if not ranked:
+                next_cursor = encode_cursor(
+                    sort.value, getattr(last_book, sort.value), last_book.id
+                )
+
+        return books, next_cursor
+
+    def export_books(
+        self,
+        title: str | None,
+        publish_year: int | None,
+        title_mode: TitleSearchMode = TitleSearchMode.FULLTEXT,
+    ) -> AsyncIterator[Sequence[Any]]:
+        """
+        Stream every book matching the filters, ordered by id, in batches of
+        BookPublic rows.
+        """
+
+        query, _ = self.apply_filters(
+            select(*self.public_columns(BookPublic)),
+            title,
+            publish_year,
+            title_mode,
+        )
+
+        return self.stream_rows(query.order_by(self.model.id))
+
+    def apply_filters(
+        self,
+        query,
+        title: str | None,
+        publish_year: int | None,
+        title_mode: TitleSearchMode,
+    ):
+        """
+        Restrict a book query to the title and publish year filters.
+
+        Returns the query together with the relevance expression of a
+        full-text title search, or None.
+        """
+
+        rank_order = None
+
+        if title and title_mode == TitleSearchMode.SUBSTRING:
+            query = query.where(self.model.title.ilike(f"%{title}%"))
+        elif title:
+            query, rank_order = self.apply_title_search(query, title)
+
+        if publish_year:
+            query = query.where(self.model.publish_year == publish_year)
 
-        books = result.all()
+        return query, rank_order
+
+    def apply_title_search(self, query, title: str):
+        """
+        Restrict a book query to full-text title matches.
+
+        Returns the query together with an ascending relevance expression.
+        Every search term matches as a word prefix, and all terms must
+        match. Dialects without a full-text backend fall back to a
+        substring match without ranking.
+        """
+
+        terms = sanitization_string(title).split()
+
+        if not terms:
+            return query.where(false()), None
+
+        dialect_name = self.session.get_bind().dialect.name
+
+        if dialect_name == "sqlite":
+            match = " ".join(f'"{term}"*' for term in terms)
+            query = query.join(
+                book_fts, book_fts.c.rowid == self.model.id
+            ).where(literal_column("book_fts").op("MATCH")(match))
+
+            return query, book_fts.c.rank
+
+        if dialect_name == "postgresql":
+            tsquery = func.to_tsquery(
+                "simple", " & ".join(f"{term}:*" for term in terms)
+            )
+            title_tsv = literal_column("book.title_tsv")
+            query = query.where(title_tsv.op("@@")(tsquery))
+
+            return query, func.ts_rank(title_tsv, tsquery).desc()
+
+        return query.where(self.model.title.ilike(f"%{title}%")), None
+
+    @staticmethod
+    def ensure_books_found(books: list[Any]) -> list[Any]:
+        """
+        Raise 404 when a book listing came back empty.
+        """
 
         if not books:
             raise HTTPException(
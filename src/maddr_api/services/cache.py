@@ -0,0 +1,274 @@
+import json
+from abc import ABC, abstractmethod
+from typing import Any, Optional, Protocol
+
+from maddr_api.config.settings import Settings
+from maddr_api.utils.cache import LRUCache
+
+try:
+    from redis import asyncio as redis
+except ImportError:
+    redis = None
+
+settings = Settings()
+
+
+class CacheBackend(ABC):
+    """
+    Storage interface for the response cache.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[bytes]:
+        """
+        Return the value stored for the key, or None.
+        """
+
+    @abstractmethod
+    async def set(self, key: str, value: bytes, ttl_seconds: int) -> None:
+        """
+        Store a value for ttl_seconds.
+        """
+
+    @abstractmethod
+    async def delete(self, *keys: str) -> None:
+        """
+        Remove the given keys.
+        """
+
+    @abstractmethod
+    async def clear(self) -> None:
+        """
+        Remove every value stored by this backend.
+        """
+
+
+class LRUCacheBackend(CacheBackend):
+    """
+    In-process backend, private to each worker.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: int):
+        self.entries: LRUCache[bytes] = LRUCache(
+            max_size=max_size, ttl_seconds=ttl_seconds
+        )
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return self.entries.get(key)
+
+    async def set(self, key: str, value: bytes, ttl_seconds: int) -> None:
+        self.entries.set(key, value)
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self.entries.invalidate(key)
+
+    async def clear(self) -> None:
+        self.entries.clear()
+
+
+class KeyValueClient(Protocol):
+    """
+    Subset of an async key-value client (e.g. redis.asyncio.Redis) used by
+    KeyValueCacheBackend.
+    """
+
+    async def get(self, key: str) -> Optional[bytes]: ...
+
+    async def set(self, key: str, value: bytes, ex: int) -> Any: ...
+
+    async def delete(self, *keys: str) -> Any: ...
+
+    async def incr(self, key: str) -> int: ...
+
+
+class KeyValueCacheBackend(CacheBackend):
+    """
+    Backend for an external key-value store shared by every worker.
+
+    Keys are namespaced with a prefix and a generation kept in the store
+    itself. Clearing the cache increments the generation atomically instead
+    of scanning the store, so every worker stops reading the old keys at
+    once, even after a restart, and they expire on their own.
+    """
+
+    def __init__(self, client: KeyValueClient, prefix: str = "maddr"):
+        self.client = client
+        self.prefix = prefix
+        self.generation_key = f"{prefix}:generation"
+
+    async def store_keys(self, *keys: str) -> list[str]:
+        """
+        Namespace keys with the prefix and the current generation.
+        """
+
+        generation = int(await self.client.get(self.generation_key) or 0)
+
+        return [f"{self.prefix}:{generation}:{key}" for key in keys]
+
+    async def get(self, key: str) -> Optional[bytes]:
+        (store_key,) = await self.store_keys(key)
+
+        return await self.client.get(store_key)
+
+    async def set(self, key: str, value: bytes, ttl_seconds: int) -> None:
+        (store_key,) = await self.store_keys(key)
+
+        await self.client.set(store_key, value, ex=ttl_seconds)
+
+    async def delete(self, *keys: str) -> None:
+        if keys:
+            await self.client.delete(*await self.store_keys(*keys))
+
+    async def clear(self) -> None:
+        await self.client.incr(self.generation_key)
+
+
+class ResponseCache:
+    """
+    Cache of serialized responses keyed by resource and id.
+    """
+
+    def __init__(self, backend: CacheBackend, ttl_seconds: int):
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(resource: str, id: Any) -> str:
+        return f"{resource}:{id}"
+
+    async def get(self, resource: str, id: Any) -> Optional[bytes]:
+        """
+        Return the cached response body for a resource, or None.
+        """
+
+        if self.ttl_seconds <= 0:
+            return None
+
+        value = await self.backend.get(self.key(resource, id))
+
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+
+        return value
+
+    async def set(self, resource: str, id: Any, value: bytes) -> None:
+        """
+        Store the response body of a resource.
+        """
+
+        if self.ttl_seconds > 0:
+            await self.backend.set(
+                self.key(resource, id), value, self.ttl_seconds
+            )
+
+    async def get_encoded(self, digest: str, encoding: str) -> Optional[bytes]:
+        """
+        Return a body compressed with encoding for the uncompressed body with
+        the given digest, or None.
+
+        Compressed bodies are keyed by the digest of the bytes they encode,
+        so they always match the current serialization and need no
+        invalidation of their own.
+        """
+
+        if self.ttl_seconds <= 0:
+            return None
+
+        return await self.backend.get(self.key(f"encoded:{encoding}", digest))
+
+    async def set_encoded(
+        self, digest: str, encoding: str, body: bytes
+    ) -> None:
+        """
+        Store a body compressed with encoding under the digest of the
+        uncompressed body.
+        """
+
+        if self.ttl_seconds > 0:
+            await self.backend.set(
+                self.key(f"encoded:{encoding}", digest),
+                body,
+                self.ttl_seconds,
+            )
+
+    async def invalidate(self, resource: str, *ids: Any) -> None:
+        """
+        Drop the cached responses of the given resource ids.
+        """
+
+        await self.backend.delete(*(self.key(resource, id) for id in ids))
+
+    async def clear(self) -> None:
+        """
+        Drop every cached response and reset the counters.
+        """
+
+        await self.backend.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Return the hit/miss counters of the cache.
+        """
+
+        lookups = self.hits + self.misses
+
+        return {
+            "backend": type(self.backend).__name__,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+        }
+
+
+def encode_entry(metadata: dict[str, Any], body: bytes) -> bytes:
+    """
+    Pack response metadata (e.g. validators) and body into one cache value.
+    """
+
+    return json.dumps(metadata, separators=(",", ":")).encode() + b"\n" + body
+
+
+def decode_entry(entry: bytes) -> tuple[dict[str, Any], bytes]:
+    """
+    Unpack a cache value created by encode_entry.
+    """
+
+    metadata, _, body = entry.partition(b"\n")
+
+    return json.loads(metadata), body
+
+
+def cache_backend(settings: Settings) -> CacheBackend:
+    """
+    Build the response cache backend selected by RESPONSE_CACHE_BACKEND.
+    """
+
+    if settings.RESPONSE_CACHE_BACKEND == "redis":
+        if redis is None:
+            raise RuntimeError(
+                "RESPONSE_CACHE_BACKEND=redis requires the redis extra."
+            )
+
+        return KeyValueCacheBackend(
+            redis.from_url(settings.RESPONSE_CACHE_URL),
+            prefix=settings.RESPONSE_CACHE_PREFIX,
+        )
+
+    return LRUCacheBackend(
+        max_size=settings.RESPONSE_CACHE_MAX_SIZE,
+        ttl_seconds=settings.RESPONSE_CACHE_TTL_SECONDS,
+    )
+
+
+response_cache = ResponseCache(
+    backend=cache_backend(settings),
+    ttl_seconds=settings.RESPONSE_CACHE_TTL_SECONDS,
+)
@@ -0,0 +1,82 @@
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional
+
+from fastapi import HTTPException
+from sqlalchemy.exc import SQLAlchemyError
+
+from maddr_api.config.settings import Settings
+from maddr_api.schemas.bulk import BulkStatus
+from maddr_api.schemas.imports import (
+    ImportBatchResult,
+    ImportRowError,
+    ImportSummary,
+)
+from maddr_api.services.main import BaseCRUD
+from maddr_api.utils.importer import ImportRecord, batched
+
+settings = Settings()
+
+
+async def import_records(
+    crud: BaseCRUD,
+    records: AsyncIterator[ImportRecord],
+    build_batch: Callable[
+        [list[ImportRecord]],
+        Awaitable[tuple[list[tuple[int, Any]], list[ImportRowError]]],
+    ],
+    unique_field: str,
+    batch_size: Optional[int] = None,
+) -> ImportSummary:
+    """
+    Import parsed records through crud in batches of batch_size
+    (IMPORT_BATCH_SIZE by default), one transaction per batch.
+
+    build_batch turns a batch into the schemas to create and the rows it
+    rejected. Each batch then costs one SELECT ... IN for existing values
+    of unique_field and one multi-row INSERT. A batch that fails is rolled
+    back and reported without stopping the import.
+    """
+
+    summary = ImportSummary()
+    size = batch_size or settings.IMPORT_BATCH_SIZE
+    batch_number = 0
+
+    async for batch in batched(records, size):
+        batch_number += 1
+        result = ImportBatchResult(
+            batch=batch_number, first_row=batch[0][0], rows=len(batch)
+        )
+        items, errors = await build_batch(batch)
+
+        try:
+            outcomes = await crud.create_many_unique(
+                [item for _, item in items],
+                unique_field,
+                chunk_size=len(items) or 1,
+            )
+        except (HTTPException, SQLAlchemyError) as error:
+            await crud.session.rollback()
+            result.error = str(
+                getattr(error, "detail", None) or getattr(error, "orig", error)
+            )
+            outcomes = []
+
+        for (row, _), (status, _) in zip(items, outcomes):
+            if status == BulkStatus.CREATED:
+                result.created += 1
+            elif status == BulkStatus.DUPLICATE:
+                result.duplicates += 1
+            else:
+                errors.append(
+                    ImportRowError(row=row, detail="Empty after sanitization.")
+                )
+
+        result.invalid = len(errors)
+        summary.created += result.created
+        summary.duplicates += result.duplicates
+        summary.invalid += result.invalid
+        summary.batches.append(result)
+
+        room = settings.IMPORT_MAX_REPORTED_ERRORS - len(summary.errors)
+        summary.errors.extend(sorted(errors, key=lambda e: e.row)[:room])
+
+    return summary
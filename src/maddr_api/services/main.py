@@ -1,8 +1,48 @@
 from enum import Enum
-from typing import Generic, TypeVar, Type, Optional, Any
-from sqlalchemy import select
+from http import HTTPStatus
+from datetime import datetime
+from typing import (
+    Any,
+    AsyncIterator,
+    Generic,
+    Iterable,
+    NoReturn,
+    Optional,
+    Sequence,
+    Type,
+    TypeVar,
+)
+from fastapi import HTTPException
+from pydantic import BaseModel
+from sqlalchemy import (
+    Row,
+    Select,
+    delete,
+    event,
+    insert,
+    inspect,
+    select,
+    update,
+)
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.ext.asyncio import AsyncSession as Session
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.orm import Session as OrmSession
+
+from maddr_api.config.settings import Settings
+from maddr_api.models.functions import utcnow
+from maddr_api.schemas.bulk import BulkStatus
+from maddr_api.services.cache import response_cache
+
+settings = Settings()
+
+READ_CACHE_KEY = "read_cache"
+
+# INSERT constructs with ON CONFLICT DO UPDATE, per dialect name.
+UPSERT_INSERTS = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
 
 ModelType = TypeVar("ModelType")
 CreateSchemaType = TypeVar("CreateSchemaType")
@@ -12,8 +52,13 @@ UpdateSchemaType = TypeVar("UpdateSchemaType")
 class BaseCRUD(Generic[ModelType, CreateSchemaType]):
     """
     Generic CRUD operations for any model.
+
+    Subclasses map unique columns to the conflict message returned when an
+    insert or update violates their constraint.
     """
 
+    unique_fields: dict[str, str] = {}
+
     def __init__(self, model: Type[ModelType], session: Session):
         self.model = model
         self.session = session
@@ -27,60 +72,494 @@ class BaseCRUD(Generic[ModelType, CreateSchemaType]):
         db_data = self.model(**obj_data)
 
         self.session.add(db_data)
-        await self.session.commit()
+
+        try:
+            await self.session.commit()
+        except IntegrityError as error:
+            await self.raise_conflict(error)
+
         await self.session.refresh(db_data)
 
         return db_data
 
+    async def create_many(
+        self, data: list[CreateSchemaType], chunk_size: Optional[int] = None
+    ) -> list[ModelType]:
+        """
+        Create many records with batched multi-row INSERT ... RETURNING.
+
+        Rows are sent chunk_size at a time (BULK_CHUNK_SIZE by default) and
+        committed together; the records come back in input order.
+        """
+
+        records = []
+
+        try:
+            for chunk in self.chunks(data, chunk_size):
+                records.extend(
+                    await self.insert_rows([
+                        item.model_dump() for item in chunk
+                    ])
+                )
+
+            await self.session.commit()
+        except IntegrityError as error:
+            await self.raise_conflict(error)
+
+        return records
+
+    async def create_many_unique(
+        self,
+        data: list[CreateSchemaType],
+        unique_field: str,
+        chunk_size: Optional[int] = None,
+    ) -> list[tuple[BulkStatus, Optional[ModelType]]]:
+        """
+        Create many records, skipping duplicates of a unique field.
+
+        Each chunk costs one SELECT ... IN for the values already stored and
+        one batched INSERT. Items with an empty unique value are reported as
+        invalid, repeated values within the input as duplicates. Results are
+        aligned with the input order.
+        """
+
+        results: list[tuple[BulkStatus, Optional[ModelType]]] = [
+            (BulkStatus.INVALID, None)
+        ] * len(data)
+        offset = 0
+
+        try:
+            for chunk in self.chunks(data, chunk_size):
+                seen = await self.read_existing_values(
+                    unique_field,
+                    [getattr(item, unique_field) for item in chunk],
+                )
+                pending = []
+
+                for index, item in enumerate(chunk, start=offset):
+                    value = getattr(item, unique_field)
+
+                    if not value:
+                        continue
+
+                    if value in seen:
+                        results[index] = (BulkStatus.DUPLICATE, None)
+                        continue
+
+                    seen.add(value)
+                    pending.append((index, item))
+
+                records = await self.insert_rows([
+                    item.model_dump() for _, item in pending
+                ])
+
+                for (index, _), record in zip(pending, records):
+                    results[index] = (BulkStatus.CREATED, record)
+
+                offset += len(chunk)
+
+            await self.session.commit()
+        except IntegrityError as error:
+            await self.raise_conflict(error)
+
+        return results
+
+    async def upsert_many(
+        self,
+        data: list[CreateSchemaType],
+        conflict_fields: list[str],
+        chunk_size: Optional[int] = None,
+    ) -> list[ModelType]:
+        """
+        Insert many records, updating the existing rows on conflict with
+        conflict_fields.
+
+        Uses the dialect INSERT ... ON CONFLICT DO UPDATE ... RETURNING of
+        SQLite and PostgreSQL, chunk_size rows at a time, and returns the
+        records in input order. The cached responses of every record
+        written are invalidated after the commit.
+        """
+
+        if not data:
+            return []
+
+        dialect_name = self.session.get_bind().dialect.name
+
+        if dialect_name not in UPSERT_INSERTS:
+            raise RuntimeError(
+                f"Bulk upserts are not supported on {dialect_name}; use "
+                "SQLite or PostgreSQL."
+            )
+
+        statement = UPSERT_INSERTS[dialect_name](self.model)
+        update_values = {
+            field: statement.excluded[field]
+            for field in type(data[0]).model_fields
+            if field not in conflict_fields
+        }
+
+        if "updated_at" in self.model.__table__.columns:
+            update_values["updated_at"] = utcnow()
+
+        statement = statement.on_conflict_do_update(
+            index_elements=conflict_fields, set_=update_values
+        ).returning(self.model, sort_by_parameter_order=True)
+
+        records = []
+
+        try:
+            for chunk in self.chunks(data, chunk_size):
+                result = await self.session.scalars(
+                    statement,
+                    [item.model_dump() for item in chunk],
+                    execution_options={"populate_existing": True},
+                )
+                records.extend(result.all())
+
+            await self.session.commit()
+        except IntegrityError as error:
+            await self.raise_conflict(error)
+
+        for record in records:
+            await response_cache.invalidate(
+                self.model.__tablename__, record.id
+            )
+
+        return records
+
+    async def insert_rows(self, rows: list[dict[str, Any]]) -> list[ModelType]:
+        """
+        Insert already serialized rows with INSERT ... RETURNING.
+
+        The rows go as executemany parameters, which SQLAlchemy batches into
+        multi-row statements where the driver allows it, and the records are
+        returned in the order of the parameters.
+        """
+
+        if not rows:
+            return []
+
+        result = await self.session.scalars(
+            insert(self.model).returning(
+                self.model, sort_by_parameter_order=True
+            ),
+            rows,
+        )
+
+        return list(result.all())
+
+    async def read_id_map(
+        self, field: str, values: set[Any]
+    ) -> dict[Any, Any]:
+        """
+        Map the given values of a field to the ids of the records that hold
+        them, with a single query.
+        """
+
+        if not values:
+            return {}
+
+        column = getattr(self.model, field)
+        result = await self.session.execute(
+            select(column, self.model.id).where(column.in_(values))
+        )
+
+        return dict(result.all())
+
+    async def read_existing_values(
+        self, field: str, values: list[Any]
+    ) -> set[Any]:
+        """
+        Return which of the given values are already stored in a field.
+        """
+
+        column = getattr(self.model, field)
+        result = await self.session.scalars(
+            select(column).where(column.in_(set(values)))
+        )
+
+        return set(result.all())
+
+    @staticmethod
+    def chunks(
+        data: list[Any], chunk_size: Optional[int] = None
+    ) -> list[list[Any]]:
+        """
+        Split data into lists of at most chunk_size items.
+        """
+
+        size = chunk_size or settings.BULK_CHUNK_SIZE
+
+        return [
+            data[start : start + size] for start in range(0, len(data), size)
+        ]
+
     async def read(self, search_field: str, value: Any) -> Optional[ModelType]:
         """
         Read a record from the database by a specific field.
+
+        Lookups are cached on the session until the transaction ends, so
+        repeating one within a request costs no extra round trip. Primary
+        key lookups go through the session identity map.
         """
 
-        record = await self.session.scalar(
-            select(self.model).where(
+        read_cache = self.session.info.setdefault(READ_CACHE_KEY, {})
+        cache_key = (self.model, search_field, value)
+
+        if cache_key in read_cache:
+            return read_cache[cache_key]
+
+        primary_keys = [key.name for key in inspect(self.model).primary_key]
+
+        if primary_keys == [search_field]:
+            record = await self.session.get(self.model, value)
+        else:
+            record = await self.session.scalar(
+                select(self.model).where(
+                    getattr(self.model, search_field) == value
+                )
+            )
+
+        read_cache[cache_key] = record
+
+        return record
+
+    async def stream_rows(
+        self, query, chunk_size: Optional[int] = None
+    ) -> AsyncIterator[Sequence[Any]]:
+        """
+        Stream the rows of a query through a server-side cursor, in batches
+        of chunk_size (EXPORT_CHUNK_SIZE by default).
+        """
+
+        size = chunk_size or settings.EXPORT_CHUNK_SIZE
+        result = await self.session.stream(
+            query.execution_options(yield_per=size)
+        )
+
+        async for partition in result.partitions():
+            yield partition
+
+    def public_columns(self, schema: Type[BaseModel]) -> list[Any]:
+        """
+        Columns of the model backing the fields of a public schema.
+        """
+
+        return self.columns(schema.model_fields)
+
+    def columns(self, fields: Iterable[str]) -> list[Any]:
+        """
+        Columns of the model for the given fields, without repeats.
+        """
+
+        return [getattr(self.model, field) for field in dict.fromkeys(fields)]
+
+    def select_fields(self, fields: Iterable[str]) -> Select:
+        """
+        SELECT of the given columns only, for read-only queries whose rows
+        go straight into a response.
+        """
+
+        return select(*self.columns(fields))
+
+    async def read_rows(self, query: Select) -> Sequence[Row]:
+        """
+        Run a read-only column query and return its Core rows.
+
+        Rows skip identity map registration, instance state and attribute
+        instrumentation, so they cost a fraction of mapped instances. Load
+        the model instead when the records are going to be modified.
+        """
+
+        result = await self.session.execute(query)
+
+        return result.all()
+
+    async def read_many(
+        self, search_field: str, values: list[Any]
+    ) -> dict[Any, ModelType]:
+        """
+        Read every record whose field is in values with a single
+        WHERE ... IN query, keyed by that field.
+
+        The records also warm the read cache used by read.
+        """
+
+        if not values:
+            return {}
+
+        column = getattr(self.model, search_field)
+        result = await self.session.scalars(
+            select(self.model).where(column.in_(set(values)))
+        )
+        records = {getattr(record, search_field): record for record in result}
+
+        read_cache = self.session.info.setdefault(READ_CACHE_KEY, {})
+
+        for value, record in records.items():
+            read_cache[(self.model, search_field, value)] = record
+
+        return records
+
+    async def read_updated_at(
+        self, search_field: str, value: Any
+    ) -> Optional[datetime]:
+        """
+        Read only the updated_at of a record, e.g. to validate a client copy.
+        """
+
+        return await self.session.scalar(
+            select(self.model.updated_at).where(
                 getattr(self.model, search_field) == value
             )
         )
 
-        return record
+    async def read_fields(
+        self, search_field: str, value: Any, fields: Iterable[str]
+    ) -> Optional[Row]:
+        """
+        Read only the given fields of a record by a specific field, as a
+        Core row, or None when no record matched.
+        """
+
+        rows = await self.read_rows(
+            self.select_fields(fields).where(
+                getattr(self.model, search_field) == value
+            )
+        )
+
+        return rows[0] if rows else None
 
     async def update(
-        self, id_column: str, value: Any, update_data: UpdateSchemaType
+        self,
+        id_column: str,
+        value: Any,
+        update_data: UpdateSchemaType,
+        extra_values: Optional[dict[str, Any]] = None,
     ) -> Optional[ModelType]:
         """
         Update a record in the database by a specific id field.
-        """
 
-        record = await self.read(search_field=id_column, value=value)
+        Sends a single UPDATE ... RETURNING when the dialect supports it and
+        falls back to UPDATE followed by a read otherwise. extra_values sets
+        columns that are not part of the schema, such as server-side
+        counters. Returns None when no row matched.
+        """
 
-        if not record:
-            return False
+        statement = (
+            update(self.model)
+            .where(getattr(self.model, id_column) == value)
+            .values(**(update_data.model_dump() | (extra_values or {})))
+        )
 
-        for field, field_value in update_data.model_dump().items():
-            setattr(record, field, field_value)
+        try:
+            if self.session.get_bind().dialect.update_returning:
+                record = await self.session.scalar(
+                    statement.returning(self.model),
+                    execution_options={"populate_existing": True},
+                )
+            else:
+                result = await self.session.execute(statement)
+                record = (
+                    await self.read(search_field=id_column, value=value)
+                    if result.rowcount
+                    else None
+                )
 
-        await self.session.commit()
-        await self.session.refresh(record)
+            await self.session.commit()
+        except IntegrityError as error:
+            await self.raise_conflict(error)
 
         return record
 
-    async def delete(self, id_column: str, value: Any) -> bool:
+    async def delete(self, id_column: str, value: Any, *criteria: Any) -> bool:
         """
         Delete a record from the database by a specific id field.
+
+        Issues a single DELETE and returns False when no row matched the id
+        and the extra criteria.
         """
 
+        deleted = await self.delete_many(id_column, [value], *criteria)
+
+        return bool(deleted)
+
+    async def delete_many(
+        self, id_column: str, values: list[Any], *criteria: Any
+    ) -> list[Any]:
+        """
+        Delete every record whose id field is in values, and that matches
+        the extra criteria, with one statement.
+
+        Returns the ids that were actually deleted. Dialects without
+        DELETE ... RETURNING need an extra SELECT to report them.
+        """
+
+        if not values:
+            return []
+
+        column = getattr(self.model, id_column)
+        statement = delete(self.model).where(column.in_(values), *criteria)
+
         try:
-            record = await self.read(search_field=id_column, value=value)
-            await self.session.delete(record)
+            if self.session.get_bind().dialect.delete_returning:
+                result = await self.session.scalars(
+                    statement.returning(column)
+                )
+                deleted = list(result.all())
+            else:
+                result = await self.session.scalars(
+                    select(column).where(column.in_(values), *criteria)
+                )
+                deleted = list(result.all())
+                await self.session.execute(statement)
+
             await self.session.commit()
-            return True
         except SQLAlchemyError:
             await self.session.rollback()
-            return False
+            raise
+
+        return deleted
+
+    async def raise_conflict(self, error: IntegrityError) -> NoReturn:
+        """
+        Roll back and turn a unique constraint violation into a 409.
+
+        Other integrity errors are re-raised untouched.
+        """
+
+        await self.session.rollback()
+
+        message = str(error.orig)
+        table = self.model.__tablename__
+
+        for field, detail in self.unique_fields.items():
+            patterns = (
+                f"{table}.{field}",
+                f"({field})=",
+                f"{table}_{field}_key",
+                f"uq_{table}_{field}",
+            )
+
+            if any(pattern in message for pattern in patterns):
+                raise HTTPException(
+                    status_code=HTTPStatus.CONFLICT, detail=detail
+                ) from error
+
+        raise error
 
 
 class AccountSearchField(str, Enum):
     USERNAME = "username"
     EMAIL = "email"
     ID = "id"
+
+
+@event.listens_for(OrmSession, "after_commit")
+@event.listens_for(OrmSession, "after_rollback")
+def clear_read_cache(session: OrmSession) -> None:
+    """
+    Drop the read cache of BaseCRUD.read when a transaction ends.
+    """
+
+    session.info.pop(READ_CACHE_KEY, None)
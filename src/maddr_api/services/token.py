@@ -1,13 +1,21 @@
+from datetime import datetime
 from http import HTTPStatus
+from zoneinfo import ZoneInfo
 from fastapi import HTTPException
 from fastapi.security import OAuth2PasswordRequestForm
 
 from maddr_api.models.account import Account
-from maddr_api.schemas.token import Token
+from maddr_api.models.refresh_token import RefreshToken
+from maddr_api.schemas.token import Token, TokenMessageResponse
 from maddr_api.security.access_token import create_access_token
-from maddr_api.security.hash_password import verify_password
+from maddr_api.security.hash_password import verify_password_async
+from maddr_api.security.refresh_token import (
+    create_refresh_token,
+    hash_refresh_token,
+)
 from maddr_api.services.main import BaseCRUD
 
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession as Session
 
 
@@ -28,22 +36,140 @@ class TokenService(BaseCRUD[Account, Token]):
 
         account = await self.validate_user_credentials(form_data)
 
-        access_token = create_access_token(data={"sub": account.username})
+        return await self.issue_tokens(account)
 
-        return Token(access_token=access_token, token_type="bearer")
+    async def refresh_access_token(self, refresh_token: str) -> Token:
+        """
+        Exchange a refresh token for a new access and refresh token pair.
+        """
 
-    async def refresh_access_token(
-        self, form_data: OAuth2PasswordRequestForm
+        stored_token, account = await self.validate_refresh_token(
+            refresh_token
+        )
+
+        # Revoke conditionally so two concurrent exchanges of the same token
+        # cannot both succeed.
+        result = await self.session.execute(
+            update(RefreshToken)
+            .where(
+                RefreshToken.id == stored_token.id,
+                RefreshToken.revoked.is_(False),
+            )
+            .values(revoked=True)
+        )
+
+        if result.rowcount != 1:
+            await self.revoke_token_family(stored_token.family_id)
+            raise HTTPException(
+                status_code=HTTPStatus.UNAUTHORIZED,
+                detail="Invalid refresh token.",
+            )
+
+        return await self.issue_tokens(
+            account, family_id=stored_token.family_id
+        )
+
+    async def revoke_refresh_token(
+        self, refresh_token: str
+    ) -> TokenMessageResponse:
+        """
+        Revoke a refresh token together with every token rotated from it.
+        """
+
+        stored_token, _ = await self.validate_refresh_token(refresh_token)
+
+        await self.revoke_token_family(stored_token.family_id)
+
+        return TokenMessageResponse(message="Refresh token revoked.")
+
+    async def issue_tokens(
+        self, account: Account, family_id: str | None = None
     ) -> Token:
         """
-        Refresh the access token for the given account.
+        Issue an access token and persist a new refresh token for it.
         """
 
-        account = await self.validate_user_credentials(form_data)
+        access_token = create_access_token(
+            data={
+                "sub": account.username,
+                "uid": account.id,
+                "ver": account.token_version,
+            }
+        )
+        refresh_token, token_hash, expires_at = create_refresh_token()
+
+        self.session.add(
+            RefreshToken(
+                account_id=account.id,
+                token_hash=token_hash,
+                family_id=family_id or token_hash,
+                expires_at=expires_at,
+                token_version=account.token_version,
+            )
+        )
+        await self.session.commit()
+
+        return Token(
+            access_token=access_token,
+            token_type="bearer",
+            refresh_token=refresh_token,
+        )
+
+    async def validate_refresh_token(
+        self, refresh_token: str
+    ) -> tuple[RefreshToken, Account]:
+        """
+        Validate a refresh token and return it with its account.
+
+        Presenting a token that was already rotated revokes its whole family,
+        so a stolen token stops working for both parties. Tokens issued
+        before the account's token_version changed are rejected.
+        """
+
+        credentials_exception = HTTPException(
+            status_code=HTTPStatus.UNAUTHORIZED,
+            detail="Invalid refresh token.",
+        )
+
+        result = await self.session.execute(
+            select(RefreshToken, Account)
+            .join(Account, Account.id == RefreshToken.account_id)
+            .where(
+                RefreshToken.token_hash == hash_refresh_token(refresh_token)
+            )
+        )
+        row = result.first()
+
+        if not row:
+            raise credentials_exception
 
-        new_token = create_access_token(data={"sub": account.username})
+        stored_token, account = row
+
+        if stored_token.revoked:
+            await self.revoke_token_family(stored_token.family_id)
+            raise credentials_exception
+
+        now = datetime.now(tz=ZoneInfo("UTC")).replace(tzinfo=None)
+
+        if stored_token.expires_at <= now:
+            raise credentials_exception
+
+        if stored_token.token_version != account.token_version:
+            raise credentials_exception
+
+        return stored_token, account
+
+    async def revoke_token_family(self, family_id: str) -> None:
+        """
+        Revoke every refresh token that belongs to the given family.
+        """
 
-        return Token(access_token=new_token, token_type="bearer")
+        await self.session.execute(
+            update(RefreshToken)
+            .where(RefreshToken.family_id == family_id)
+            .values(revoked=True)
+        )
+        await self.session.commit()
 
     async def validate_user_credentials(
         self, form_data: OAuth2PasswordRequestForm
@@ -60,7 +186,9 @@ class TokenService(BaseCRUD[Account, Token]):
                 detail="Incorrect username or password.",
             )
 
-        if not verify_password(form_data.password, account_data.password):
+        if not await verify_password_async(
+            form_data.password, account_data.password
+        ):
             raise HTTPException(
                 status_code=HTTPStatus.UNAUTHORIZED,
                 detail="Incorrect username or password.",
@@ -0,0 +1,89 @@
+from collections import OrderedDict
+from time import monotonic
+from typing import Any, Generic, Hashable, Optional, TypeVar
+
+ValueType = TypeVar("ValueType")
+
+
+class LRUCache(Generic[ValueType]):
+    """
+    In-process LRU cache with a bounded size and a per-entry time to live.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: float):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, tuple[float, ValueType]] = (
+            OrderedDict()
+        )
+
+    def get(self, key: Hashable) -> Optional[ValueType]:
+        """
+        Return the cached value for the key, or None when absent or expired.
+        """
+
+        entry = self._entries.get(key)
+
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, value = entry
+
+        if expires_at <= monotonic():
+            del self._entries[key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+
+        return value
+
+    def set(self, key: Hashable, value: ValueType) -> None:
+        """
+        Store a value, evicting the least recently used entry when full.
+        """
+
+        if self.max_size <= 0 or self.ttl_seconds <= 0:
+            return
+
+        self._entries[key] = (monotonic() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        """
+        Remove a single entry from the cache.
+        """
+
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """
+        Remove every entry and reset the counters.
+        """
+
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Return the hit/miss counters and the current size of the cache.
+        """
+
+        lookups = self.hits + self.misses
+
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+        }
@@ -0,0 +1,96 @@
+import gzip
+import zlib
+from typing import Optional
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+BROTLI = "br"
+GZIP = "gzip"
+
+
+def available_encodings() -> tuple[str, ...]:
+    """
+    Content codings the server can produce, in order of preference.
+    """
+
+    return (BROTLI, GZIP) if brotli is not None else (GZIP,)
+
+
+def negotiate_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """
+    Pick the content coding for an Accept-Encoding header, or None when
+    the response should not be compressed.
+
+    The highest q-value wins, and ties go to the server's preference.
+    """
+
+    if not accept_encoding:
+        return None
+
+    weights: dict[str, float] = {}
+
+    for item in accept_encoding.split(","):
+        coding, _, params = item.strip().partition(";")
+        weight = 1.0
+
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+
+            if name == "q":
+                try:
+                    weight = float(value)
+                except ValueError:
+                    weight = 0.0
+
+        weights[coding.strip().lower()] = weight
+
+    candidates = [
+        (weights.get(coding, weights.get("*", 0.0)), -index, coding)
+        for index, coding in enumerate(available_encodings())
+    ]
+    weight, _, coding = max(candidates)
+
+    return coding if weight > 0 else None
+
+
+def compress(body: bytes, encoding: str, level: int) -> bytes:
+    """
+    Compress a whole body. level is the gzip level or the brotli quality.
+    """
+
+    if encoding == BROTLI:
+        return brotli.compress(body, quality=level)
+
+    return gzip.compress(body, compresslevel=level, mtime=0)
+
+
+class StreamCompressor:
+    """
+    Incremental compressor for streamed bodies, flushed after every chunk
+    so clients receive data as soon as it is produced.
+    """
+
+    def __init__(self, encoding: str, level: int):
+        self.encoding = encoding
+
+        if encoding == BROTLI:
+            self.compressor = brotli.Compressor(quality=level)
+        else:
+            self.compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, chunk: bytes) -> bytes:
+        if self.encoding == BROTLI:
+            return self.compressor.process(chunk) + self.compressor.flush()
+
+        return self.compressor.compress(chunk) + self.compressor.flush(
+            zlib.Z_SYNC_FLUSH
+        )
+
+    def finish(self) -> bytes:
+        if self.encoding == BROTLI:
+            return self.compressor.finish()
+
+        return self.compressor.flush()
@@ -0,0 +1,156 @@
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Annotated, Any, Iterable, Optional
+
+from fastapi import Header
+
+
+class ConditionalRequest:
+    """
+    The If-None-Match and If-Modified-Since headers of a request.
+    """
+
+    def __init__(
+        self,
+        if_none_match: Annotated[Optional[str], Header()] = None,
+        if_modified_since: Annotated[Optional[str], Header()] = None,
+    ):
+        self.if_none_match = if_none_match
+        self.if_modified_since = if_modified_since
+
+    @property
+    def is_conditional(self) -> bool:
+        return bool(self.if_none_match or self.if_modified_since)
+
+
+class Validators:
+    """
+    ETag and Last-Modified of a representation.
+    """
+
+    def __init__(self, etag: str, last_modified: Optional[datetime]):
+        self.etag = etag
+        self.last_modified = last_modified
+
+    @classmethod
+    def for_entity(
+        cls, resource: str, id: Any, updated_at: datetime, *extra: Any
+    ) -> "Validators":
+        """
+        Validators of a single row, derived from its id and updated_at and
+        anything else that shapes the response, such as a sparse fieldset.
+        """
+
+        parts = [resource, str(id), updated_at.isoformat(), *map(str, extra)]
+
+        return cls(
+            etag=strong_etag(":".join(parts)),
+            last_modified=updated_at,
+        )
+
+    @classmethod
+    def for_page(
+        cls, resource: str, rows: Iterable[tuple[Any, datetime]], *extra: Any
+    ) -> "Validators":
+        """
+        Validators of a list page, derived from the (id, updated_at) of its
+        rows and anything else that shapes the response.
+        """
+
+        rows = list(rows)
+        parts = [resource, *map(str, extra)]
+        parts.extend(
+            f"{id}:{updated_at.isoformat()}" for id, updated_at in rows
+        )
+
+        return cls(
+            etag=strong_etag("|".join(parts)),
+            last_modified=max(
+                (updated_at for _, updated_at in rows), default=None
+            ),
+        )
+
+    def headers(self) -> dict[str, str]:
+        """
+        Response headers carrying the validators.
+        """
+
+        headers = {"ETag": self.etag}
+
+        if self.last_modified is not None:
+            headers["Last-Modified"] = format_datetime(
+                as_utc(self.last_modified), usegmt=True
+            )
+
+        return headers
+
+    def not_modified(self, conditions: Optional[ConditionalRequest]) -> bool:
+        """
+        Whether the client's copy is still current.
+
+        If-None-Match takes precedence over If-Modified-Since, as required by
+        RFC 9110.
+        """
+
+        if conditions is None:
+            return False
+
+        if conditions.if_none_match:
+            candidates = {
+                tag.strip().removeprefix("W/")
+                for tag in conditions.if_none_match.split(",")
+            }
+
+            return "*" in candidates or self.etag in candidates
+
+        if conditions.if_modified_since and self.last_modified is not None:
+            try:
+                since = parsedate_to_datetime(conditions.if_modified_since)
+            except (TypeError, ValueError):
+                return False
+
+            if since.tzinfo is None:
+                since = since.replace(tzinfo=timezone.utc)
+
+            modified = as_utc(self.last_modified).replace(microsecond=0)
+
+            return modified <= since
+
+        return False
+
+    def to_dict(self) -> dict[str, Optional[str]]:
+        return {
+            "etag": self.etag,
+            "last_modified": (
+                self.last_modified.isoformat() if self.last_modified else None
+            ),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Optional[str]]) -> "Validators":
+        last_modified = data.get("last_modified")
+
+        return cls(
+            etag=data["etag"],
+            last_modified=(
+                datetime.fromisoformat(last_modified)
+                if last_modified
+                else None
+            ),
+        )
+
+
+def strong_etag(value: str) -> str:
+    return f'"{hashlib.sha256(value.encode()).hexdigest()[:32]}"'
+
+
+def as_utc(value: datetime) -> datetime:
+    """
+    Treat naive database timestamps as UTC.
+    """
+
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+
+    return value
@@ -0,0 +1,66 @@
+import csv
+import io
+import json
+from typing import Any, AsyncIterator, Sequence
+
+from fastapi.responses import StreamingResponse
+
+from maddr_api.schemas.export import FileFormat
+from maddr_api.utils.timing import timed
+
+EXPORT_MEDIA_TYPES = {
+    FileFormat.NDJSON: "application/x-ndjson",
+    FileFormat.CSV: "text/csv",
+}
+
+
+async def encode_export(
+    partitions: AsyncIterator[Sequence[Sequence[Any]]],
+    fields: list[str],
+    format: FileFormat,
+) -> AsyncIterator[bytes]:
+    """
+    Encode batches of rows as NDJSON lines or CSV records, one chunk per
+    batch, so memory stays bounded by the batch size.
+    """
+
+    if format == FileFormat.CSV:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(fields)
+
+        yield buffer.getvalue().encode()
+
+    async for rows in partitions:
+        with timed("serialize"):
+            if format == FileFormat.CSV:
+                buffer = io.StringIO()
+                csv.writer(buffer).writerows(rows)
+                chunk = buffer.getvalue().encode()
+            else:
+                chunk = "".join(
+                    json.dumps(dict(zip(fields, row))) + "\n" for row in rows
+                ).encode()
+
+        yield chunk
+
+
+def export_response(
+    partitions: AsyncIterator[Sequence[Sequence[Any]]],
+    fields: list[str],
+    format: FileFormat,
+    filename: str,
+) -> StreamingResponse:
+    """
+    Stream an export as an attachment.
+    """
+
+    return StreamingResponse(
+        encode_export(partitions, fields, format),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={
+            "Content-Disposition": (
+                f'attachment; filename="{filename}.{format.value}"'
+            )
+        },
+    )
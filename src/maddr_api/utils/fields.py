@@ -0,0 +1,39 @@
+from enum import Enum
+from http import HTTPStatus
+from typing import Optional, Type
+
+from fastapi import HTTPException
+from pydantic import BaseModel
+
+
+def parse_fields(
+    fields: Optional[str],
+    schema: Type[BaseModel],
+    expand: Optional[Enum] = None,
+) -> Optional[tuple[str, ...]]:
+    """
+    Parse a comma separated sparse fieldset of a public schema.
+
+    Returns the requested fields in schema order, or None when every field
+    is wanted.
+    """
+
+    if not fields or not fields.strip(","):
+        return None
+
+    requested = {field.strip() for field in fields.split(",") if field.strip()}
+    unknown = sorted(requested - schema.model_fields.keys())
+
+    if unknown:
+        raise HTTPException(
+            status_code=HTTPStatus.UNPROCESSABLE_ENTITY,
+            detail=f"Unknown fields: {', '.join(unknown)}.",
+        )
+
+    if expand is not None:
+        raise HTTPException(
+            status_code=HTTPStatus.UNPROCESSABLE_ENTITY,
+            detail="Fields cannot be combined with expand.",
+        )
+
+    return tuple(field for field in schema.model_fields if field in requested)
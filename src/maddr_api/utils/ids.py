@@ -0,0 +1,42 @@
+from http import HTTPStatus
+from typing import Annotated
+
+from fastapi import HTTPException, Query
+
+from maddr_api.config.settings import Settings
+
+settings = Settings()
+
+
+def parse_ids(
+    ids: Annotated[
+        list[str],
+        Query(description="Ids, repeated (ids=1&ids=2) or comma separated."),
+    ],
+) -> list[int]:
+    """
+    Parse the ids of a batch read, keeping their order and dropping repeats.
+    """
+
+    try:
+        values = [
+            int(value)
+            for item in ids
+            for value in item.split(",")
+            if value.strip()
+        ]
+    except ValueError:
+        raise HTTPException(
+            status_code=HTTPStatus.UNPROCESSABLE_ENTITY,
+            detail="Ids must be integers.",
+        )
+
+    values = list(dict.fromkeys(values))
+
+    if not values or len(values) > settings.BATCH_MAX_IDS:
+        raise HTTPException(
+            status_code=HTTPStatus.UNPROCESSABLE_ENTITY,
+            detail=f"Between 1 and {settings.BATCH_MAX_IDS} ids are required.",
+        )
+
+    return values
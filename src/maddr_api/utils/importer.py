@@ -0,0 +1,110 @@
+import codecs
+import csv
+import json
+from typing import Any, AsyncIterator, Optional
+
+from pydantic import ValidationError
+
+from maddr_api.schemas.export import FileFormat
+
+ImportRecord = tuple[int, Optional[dict[str, Any]], Optional[str]]
+
+
+async def iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """
+    Split a stream of UTF-8 bytes into lines without buffering the stream.
+    """
+
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    pending = ""
+
+    async for chunk in chunks:
+        pending += decoder.decode(chunk)
+        *lines, pending = pending.split("\n")
+
+        for line in lines:
+            yield line.rstrip("\r")
+
+    pending += decoder.decode(b"", final=True)
+
+    if pending:
+        yield pending.rstrip("\r")
+
+
+async def iter_records(
+    chunks: AsyncIterator[bytes], format: FileFormat
+) -> AsyncIterator[ImportRecord]:
+    """
+    Parse an uploaded CSV or NDJSON stream into (row, record, error) tuples.
+
+    Rows are numbered from 1, not counting the CSV header; blank lines are
+    skipped. A row that cannot be parsed has no record and an error. CSV
+    records must fit on one line.
+    """
+
+    header: Optional[list[str]] = None
+    row = 0
+
+    async for line in iter_lines(chunks):
+        if not line.strip():
+            continue
+
+        if format == FileFormat.CSV:
+            values = next(csv.reader([line]))
+
+            if header is None:
+                header = [name.strip() for name in values]
+                continue
+
+            row += 1
+
+            if len(values) != len(header):
+                yield row, None, "Wrong number of columns."
+            else:
+                yield row, dict(zip(header, values)), None
+
+            continue
+
+        row += 1
+
+        try:
+            record = json.loads(line)
+        except ValueError:
+            yield row, None, "Invalid JSON."
+            continue
+
+        if isinstance(record, dict):
+            yield row, record, None
+        else:
+            yield row, None, "Each line must be a JSON object."
+
+
+async def batched(
+    records: AsyncIterator[ImportRecord], size: int
+) -> AsyncIterator[list[ImportRecord]]:
+    """
+    Group parsed records into lists of at most size records.
+    """
+
+    batch = []
+
+    async for record in records:
+        batch.append(record)
+
+        if len(batch) >= size:
+            yield batch
+            batch = []
+
+    if batch:
+        yield batch
+
+
+def validation_detail(error: ValidationError) -> str:
+    """
+    Summarize a pydantic validation error on one line.
+    """
+
+    return "; ".join(
+        f"{'.'.join(map(str, item['loc']))}: {item['msg']}"
+        for item in error.errors()
+    )
@@ -0,0 +1,53 @@
+import base64
+import json
+from http import HTTPStatus
+from typing import Any
+
+from fastapi import HTTPException
+
+
+def encode_cursor(sort: str, value: Any, id: int) -> str:
+    """
+    Encode the sort key and id of the last row into an opaque cursor.
+    """
+
+    payload = json.dumps([sort, value, id], separators=(",", ":"))
+
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def is_instance(value: Any, value_type: type) -> bool:
+    """
+    Check a decoded JSON value against a type, rejecting booleans as ints.
+    """
+
+    return isinstance(value, value_type) and not isinstance(value, bool)
+
+
+def decode_cursor(cursor: str, sort: str, value_type: type) -> tuple[Any, int]:
+    """
+    Decode a cursor created by encode_cursor for the given sort key, whose
+    value must be of value_type.
+    """
+
+    invalid_cursor = HTTPException(
+        status_code=HTTPStatus.BAD_REQUEST,
+        detail="Invalid cursor.",
+    )
+
+    try:
+        padding = "=" * (-len(cursor) % 4)
+        cursor_sort, value, id = json.loads(
+            base64.urlsafe_b64decode(cursor + padding)
+        )
+    except (ValueError, TypeError):
+        raise invalid_cursor
+
+    if (
+        cursor_sort != sort
+        or not is_instance(value, value_type)
+        or not is_instance(id, int)
+    ):
+        raise invalid_cursor
+
+    return value, id
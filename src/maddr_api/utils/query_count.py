@@ -0,0 +1,75 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import perf_counter
+from typing import Iterator, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+QUERY_STARTED_AT = "query_started_at"
+
+
+class QueryCounter:
+    """
+    Mutable counter of the SQL statements executed during one request and
+    the time spent running them.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+
+
+query_counter: ContextVar[Optional[QueryCounter]] = ContextVar(
+    "query_counter", default=None
+)
+
+
+@contextmanager
+def counting_queries() -> Iterator[QueryCounter]:
+    """
+    Count the SQL statements executed in the block. Nested blocks share
+    the counter of the outermost one.
+    """
+
+    counter = query_counter.get()
+
+    if counter is not None:
+        yield counter
+        return
+
+    counter = QueryCounter()
+    token = query_counter.set(counter)
+
+    try:
+        yield counter
+    finally:
+        query_counter.reset(token)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def count_query(conn, cursor, statement, parameters, context, executemany):
+    counter = query_counter.get()
+
+    if counter is not None:
+        counter.count += 1
+        conn.info.setdefault(QUERY_STARTED_AT, []).append(perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def time_query(conn, cursor, statement, parameters, context, executemany):
+    stop_query_timer(conn)
+
+
+@event.listens_for(Engine, "handle_error")
+def time_failed_query(exception_context):
+    if exception_context.connection is not None:
+        stop_query_timer(exception_context.connection)
+
+
+def stop_query_timer(conn) -> None:
+    counter = query_counter.get()
+    started_at = conn.info.get(QUERY_STARTED_AT)
+
+    if counter is not None and started_at:
+        counter.seconds += perf_counter() - started_at.pop()
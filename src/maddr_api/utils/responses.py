@@ -0,0 +1,152 @@
+from http import HTTPStatus
+from typing import Any, Awaitable, Callable, Optional, Sequence, Type
+
+from fastapi import Response
+from pydantic import BaseModel
+
+from maddr_api.config.database import DatabaseSession
+from maddr_api.services.cache import (
+    ResponseCache,
+    decode_entry,
+    encode_entry,
+)
+from maddr_api.services.main import BaseCRUD
+from maddr_api.utils.conditional import ConditionalRequest, Validators
+from maddr_api.utils.serialization import encode_model, encode_row
+
+
+def representation_response(
+    validators: Validators,
+    conditions: Optional[ConditionalRequest],
+    encode: Callable[[], bytes],
+    headers: Optional[dict[str, str]] = None,
+) -> Response:
+    """
+    Build a JSON response carrying the validators, or a 304 without body
+    when the client's copy is still current. encode is only called when
+    the body is sent.
+    """
+
+    headers = validators.headers() | (headers or {})
+
+    if validators.not_modified(conditions):
+        return Response(status_code=HTTPStatus.NOT_MODIFIED, headers=headers)
+
+    return Response(
+        content=encode(), media_type="application/json", headers=headers
+    )
+
+
+async def entity_response(
+    crud: BaseCRUD,
+    resource: str,
+    id: Any,
+    schema: Type[BaseModel],
+    read: Callable[[Any], Awaitable[Any]],
+    conditions: Optional[ConditionalRequest] = None,
+    cache: Optional[ResponseCache] = None,
+    fields: Optional[Sequence[str]] = None,
+) -> Response:
+    """
+    Respond with a record serialized with schema, together with its
+    validators.
+
+    With a cache, hits answer without touching the database. Otherwise
+    conditional requests are first checked against updated_at alone, and
+    the record is only loaded with read and serialized when it changed.
+    Only records read from the primary are cached: a lagging replica could
+    otherwise put back a copy older than the last write's invalidation.
+
+    With a sparse fieldset only those fields are selected and returned,
+    bypassing the cache.
+    """
+
+    if fields:
+        return await fields_response(
+            crud, resource, id, fields, read, conditions
+        )
+
+    if cache is not None:
+        entry = await cache.get(resource, id)
+
+        if entry is not None:
+            metadata, body = decode_entry(entry)
+
+            return representation_response(
+                Validators.from_dict(metadata), conditions, lambda: body
+            )
+
+    validators = await current_validators(crud, resource, id, conditions)
+
+    if validators is not None:
+        return representation_response(validators, conditions, bytes)
+
+    record = await read(id)
+    validators = Validators.for_entity(resource, id, record.updated_at)
+    body = encode_model(record, schema)
+
+    if cache is not None and not DatabaseSession.reads_replica(crud.session):
+        await cache.set(resource, id, encode_entry(validators.to_dict(), body))
+
+    return representation_response(validators, conditions, lambda: body)
+
+
+async def fields_response(
+    crud: BaseCRUD,
+    resource: str,
+    id: Any,
+    fields: Sequence[str],
+    read: Callable[[Any], Awaitable[Any]],
+    conditions: Optional[ConditionalRequest] = None,
+) -> Response:
+    """
+    Respond with only the given fields of a record, together with the
+    validators of that representation.
+
+    The SELECT is narrowed to those columns and updated_at, and the result
+    stays a Core row instead of an ORM entity. read is only called to
+    report a missing record.
+    """
+
+    validators = await current_validators(
+        crud, resource, id, conditions, *fields
+    )
+
+    if validators is not None:
+        return representation_response(validators, conditions, bytes)
+
+    row = await crud.read_fields("id", id, [*fields, "updated_at"])
+
+    if row is None:
+        await read(id)
+
+    return representation_response(
+        Validators.for_entity(resource, id, row.updated_at, *fields),
+        conditions,
+        lambda: encode_row(row, fields),
+    )
+
+
+async def current_validators(
+    crud: BaseCRUD,
+    resource: str,
+    id: Any,
+    conditions: Optional[ConditionalRequest],
+    *extra: Any,
+) -> Optional[Validators]:
+    """
+    Validators of a record when the client's copy is still current, read
+    from updated_at alone; None when the record has to be loaded.
+    """
+
+    if conditions is None or not conditions.is_conditional:
+        return None
+
+    updated_at = await crud.read_updated_at("id", id)
+
+    if updated_at is None:
+        return None
+
+    validators = Validators.for_entity(resource, id, updated_at, *extra)
+
+    return validators if validators.not_modified(conditions) else None
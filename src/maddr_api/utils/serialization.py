@@ -0,0 +1,75 @@
+from functools import cache
+from typing import Any, Iterable, Type
+
+import orjson
+from pydantic import BaseModel, TypeAdapter
+
+from maddr_api.utils.timing import timed
+
+
+@cache
+def list_adapter(schema: Type[BaseModel]) -> TypeAdapter:
+    """
+    TypeAdapter of list[schema], built once per schema.
+    """
+
+    return TypeAdapter(list[schema])
+
+
+def encode_model(record: Any, schema: Type[BaseModel]) -> bytes:
+    """
+    Encode a record, or a mapping of its values, as a JSON object of
+    schema, validated from its attributes.
+    """
+
+    with timed("serialize"):
+        return (
+            schema
+            .model_validate(record, from_attributes=True)
+            .model_dump_json()
+            .encode()
+        )
+
+
+def encode_list(records: Iterable[Any], schema: Type[BaseModel]) -> bytes:
+    """
+    Encode ORM records as a JSON list of schema, validated from their
+    attributes and serialized in a single pass. Use it for schemas with
+    nested models.
+    """
+
+    adapter = list_adapter(schema)
+
+    with timed("serialize"):
+        return adapter.dump_json(
+            adapter.validate_python(records, from_attributes=True)
+        )
+
+
+def encode_row(record: Any, fields: Iterable[str]) -> bytes:
+    """
+    Encode a single record as a JSON object with the given fields, read
+    straight from its attributes.
+    """
+
+    with timed("serialize"):
+        return orjson.dumps({
+            field: getattr(record, field) for field in fields
+        })
+
+
+def encode_rows(records: Iterable[Any], fields: Iterable[str]) -> bytes:
+    """
+    Encode records as a JSON list of objects with the given fields, read
+    straight from their attributes without building schema instances.
+
+    Only use it for flat schemas whose fields are plain column values.
+    """
+
+    fields = tuple(fields)
+
+    with timed("serialize"):
+        return orjson.dumps([
+            {field: getattr(record, field) for field in fields}
+            for record in records
+        ])
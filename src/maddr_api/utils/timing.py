@@ -0,0 +1,87 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import perf_counter
+from typing import Any, Iterator, Optional
+
+from maddr_api.utils.query_count import QueryCounter
+
+# Server-Timing metric names and descriptions, in header order. Database
+# time comes from the request's QueryCounter, the rest from timed blocks.
+TIMING_METRICS = {
+    "db": "Database",
+    "auth": "Account lookup",
+    "hash": "Password hashing",
+    "serialize": "Serialization",
+}
+
+
+class RequestTimings:
+    """
+    Time spent per component during one request. The SQL statement count
+    and database time are read from the request's QueryCounter, the one
+    behind the X-Query-Count header.
+    """
+
+    def __init__(self, queries: Optional[QueryCounter] = None):
+        self.started_at = perf_counter()
+        self.queries = queries or QueryCounter()
+        self.seconds = dict.fromkeys(TIMING_METRICS, 0.0)
+
+    def add(self, metric: str, seconds: float) -> None:
+        self.seconds[metric] += seconds
+
+    def elapsed(self) -> float:
+        return perf_counter() - self.started_at
+
+    def durations(self) -> dict[str, float]:
+        return self.seconds | {"db": self.queries.seconds}
+
+    def server_timing(self) -> str:
+        """
+        Value of the Server-Timing header, with durations in milliseconds.
+        """
+
+        durations = self.durations()
+        metrics = [
+            f'{metric};dur={durations[metric] * 1000:.2f};desc="{desc}"'
+            for metric, desc in TIMING_METRICS.items()
+        ]
+        metrics.append(f'queries;desc="{self.queries.count}"')
+        metrics.append(f"total;dur={self.elapsed() * 1000:.2f}")
+
+        return ", ".join(metrics)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "queries": self.queries.count,
+            **{
+                f"{metric}_ms": round(seconds * 1000, 2)
+                for metric, seconds in self.durations().items()
+            },
+            "total_ms": round(self.elapsed() * 1000, 2),
+        }
+
+
+request_timings: ContextVar[Optional[RequestTimings]] = ContextVar(
+    "request_timings", default=None
+)
+
+
+@contextmanager
+def timed(metric: str) -> Iterator[None]:
+    """
+    Add the time spent in the block to a metric of the current request.
+    """
+
+    timings = request_timings.get()
+
+    if timings is None:
+        yield
+        return
+
+    started_at = perf_counter()
+
+    try:
+        yield
+    finally:
+        timings.add(metric, perf_counter() - started_at)
@@ -1,3 +1,4 @@
+from http import HTTPStatus
 from maddr_api.models.author import Author
 import pytest
 from fastapi.testclient import TestClient
@@ -10,11 +11,35 @@ from maddr_api.config.database import DatabaseSession
 from maddr_api.models.account import Account, table_registry
 import pytest_asyncio
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from maddr_api.security.get_current_user import account_cache
 from maddr_api.security.hash_password import get_password_hash
+from maddr_api.services.cache import response_cache
 from maddr_api.models.book import Book
 from maddr_api.utils.sanitization import sanitization_string
 
 
+@pytest.fixture(autouse=True)
+def clear_account_cache():
+    """
+    Reset the authenticated account cache between tests.
+    """
+
+    account_cache.clear()
+    yield
+    account_cache.clear()
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def clear_response_cache():
+    """
+    Reset the response cache between tests.
+    """
+
+    await response_cache.clear()
+    yield
+    await response_cache.clear()
+
+
 @pytest_asyncio.fixture
 async def session():
     """
@@ -36,6 +61,8 @@ async def session():
     async with engine.begin() as conn:
         await conn.run_sync(table_registry.metadata.drop_all)
 
+    await engine.dispose()
+
 
 @pytest.fixture
 def client(session):
@@ -50,6 +77,9 @@ def client(session):
         app.dependency_overrides[DatabaseSession.get_session] = (
             override_get_session
         )
+        app.dependency_overrides[DatabaseSession.get_read_session] = (
+            override_get_session
+        )
         yield client
         app.dependency_overrides.clear()
 
@@ -73,6 +103,25 @@ def _mock_db_time(*, model, time=datetime(2025, 5, 16)):
     event.remove(model, "before_insert", fake_time)
 
 
+@pytest.fixture
+def sql_statements(session):
+    """
+    Record the SQL statements sent through the test database session.
+    """
+
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = session.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", record)
+
+    yield statements
+
+    event.remove(engine, "before_cursor_execute", record)
+
+
 @pytest.fixture
 def mock_db_time():
     """
@@ -166,3 +215,46 @@ def token(client, account):
 
     token_data = response.json()
     return token_data["access_token"]
+
+
+@pytest.fixture
+def refresh_token(client, account):
+    """
+    Create a sample refresh token for testing.
+    """
+
+    response = client.post(
+        "/token",
+        data={
+            "username": account.username,
+            "password": "testpass",
+        },
+    )
+
+    return response.json()["refresh_token"]
+
+
+@pytest.fixture
+def create_books(client, token):
+    """
+    Return a helper that creates books with the given titles for the
+    sample author through POST /book/bulk.
+    """
+
+    def create(titles):
+        response = client.post(
+            "/book/bulk",
+            json=dict(
+                books=[
+                    dict(title=title, author_id=1, publish_year=2000)
+                    for title in titles
+                ]
+            ),
+            headers={"Authorization": f"Bearer {token}"},
+        )
+
+        assert response.status_code == HTTPStatus.OK
+
+        return response.json()
+
+    return create
@@ -179,6 +179,54 @@ def test_update_account_successfully(client, account, token):
     assert response.json() == expected_response
 
 
+def test_update_account_keeping_username(client, account, token):
+    """
+    Test updating an account without changing its username and email.
+    """
+
+    updated_data = dict(
+        username=account.username,
+        email=account.email,
+        password="new_password",
+    )
+
+    response = client.put(
+        f"/account/{account.id}",
+        headers={"Authorization": f"Bearer {token}"},
+        json=updated_data,
+    )
+
+    assert response.status_code == HTTPStatus.OK
+
+
+def test_update_account_with_existing_email(client, account, token):
+    """
+    Test updating an account with an email that belongs to another account.
+    """
+
+    client.post(
+        "/account/",
+        json=dict(
+            username="other_user",
+            email="other_user@example.com",
+            password="testpass",
+        ),
+    )
+
+    response = client.put(
+        f"/account/{account.id}",
+        headers={"Authorization": f"Bearer {token}"},
+        json=dict(
+            username=account.username,
+            email="other_user@example.com",
+            password="testpass",
+        ),
+    )
+
+    assert response.status_code == HTTPStatus.CONFLICT
+    assert response.json() == {"detail": "Email already exists."}
+
+
 def test_update_nonexistent_account(client, token):
     """
     Test updating a non-existent account.
@@ -200,6 +248,36 @@ def test_update_nonexistent_account(client, token):
     assert response.json() == {"detail": "Account not found."}
 
 
+def test_update_other_account_forbidden(client, account, token):
+    """
+    Test updating an account that belongs to another user.
+    """
+
+    other_account = client.post(
+        "/account/",
+        json=dict(
+            username="other_user",
+            email="other_user@example.com",
+            password="testpass",
+        ),
+    ).json()
+
+    response = client.put(
+        f"/account/{other_account['id']}",
+        headers={"Authorization": f"Bearer {token}"},
+        json=dict(
+            username="stolen_username",
+            email="stolen@example.com",
+            password="testpass",
+        ),
+    )
+
+    assert response.status_code == HTTPStatus.FORBIDDEN
+    assert response.json() == {
+        "detail": "Not authorized to modify this account."
+    }
+
+
 def test_delete_account_successfully(client, account, token):
     """
     Test deleting an existing account successfully.
@@ -226,3 +304,74 @@ def test_delete_nonexistent_account(client, token):
 
     assert response.status_code == HTTPStatus.NOT_FOUND
     assert response.json() == {"detail": "Account not found."}
+
+
+def test_deleted_account_token_is_rejected(client, account, token):
+    """
+    Test that a deleted account cannot keep using a cached token.
+    """
+
+    headers = {"Authorization": f"Bearer {token}"}
+
+    client.delete(f"/account/{account.id}", headers=headers)
+
+    response = client.delete(f"/account/{account.id}", headers=headers)
+
+    assert response.status_code == HTTPStatus.UNAUTHORIZED
+    assert response.json() == {"detail": "Could not validate credentials"}
+
+
+def test_update_account_revokes_previous_tokens(client, account, token):
+    """
+    Test that updating an account invalidates tokens issued before it.
+    """
+
+    headers = {"Authorization": f"Bearer {token}"}
+    updated_data = dict(
+        username="renamed_user",
+        email="renamed_user@example.com",
+        password="testpass",
+    )
+
+    client.put(f"/account/{account.id}", headers=headers, json=updated_data)
+
+    response = client.delete(f"/account/{account.id}", headers=headers)
+
+    assert response.status_code == HTTPStatus.UNAUTHORIZED
+
+
+def test_read_account_runs_single_query(client, session, account):
+    """
+    Test that validating and reading an account share one lookup.
+    """
+    session.expunge_all()
+
+    response = client.get(f"/account/{account.id}")
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.headers["X-Query-Count"] == "1"
+
+
+def test_read_account_conditional_get(client, account):
+    """
+    Test that account reads honour If-None-Match.
+    """
+    etag = client.get(f"/account/{account.id}").headers["ETag"]
+
+    response = client.get(
+        f"/account/{account.id}", headers={"If-None-Match": f"W/{etag}"}
+    )
+
+    assert response.status_code == HTTPStatus.NOT_MODIFIED
+
+
+def test_read_account_sparse_fields(client, account, sql_statements):
+    """
+    Test that account reads can skip the email column.
+    """
+    sql_statements.clear()
+
+    response = client.get(f"/account/{account.id}?fields=id,username")
+
+    assert response.json() == {"id": account.id, "username": account.username}
+    assert not any("account.email" in s for s in sql_statements)
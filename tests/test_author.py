@@ -51,6 +51,20 @@ def test_create_author_with_existing_name(client, token, author):
     }
 
 
+def test_create_author_without_pre_insert_lookup(
+    client, token, sql_statements
+):
+    """
+    Test that creating an author relies on the unique constraint instead of
+    a lookup by name.
+    """
+    headers = {"Authorization": f"Bearer {token}"}
+
+    client.post("/author/", json=dict(name="New Author"), headers=headers)
+
+    assert not any("WHERE author.name" in s for s in sql_statements)
+
+
 def test_create_author_missing_fields(client, token):
     """
     Test creating an author with missing required fields.
@@ -110,6 +124,26 @@ def test_update_author_success(client, token, author):
     assert response.json() == expected_response
 
 
+def test_update_author_uses_single_update_statement(
+    client, token, author, sql_statements
+):
+    """
+    Test that updating an author sends one UPDATE ... RETURNING.
+    """
+    headers = {"Authorization": f"Bearer {token}"}
+
+    client.patch(
+        f"/author/{author.id}", json=dict(name="Renamed"), headers=headers
+    )
+
+    updates = [s for s in sql_statements if s.startswith("UPDATE author")]
+    assert len(updates) == 1
+    assert "RETURNING" in updates[0]
+    assert not any(
+        s.startswith("SELECT") and "author.id = ?" in s for s in sql_statements
+    )
+
+
 def test_update_author_not_found(client, token):
     """
     Test updating a non-existing author.
@@ -156,6 +190,36 @@ def test_delete_author_success(client, token, author):
     assert response.json() == {"message": "Author deleted successfully."}
 
 
+def test_delete_author_uses_single_statement(
+    client, token, author, sql_statements
+):
+    """
+    Test that deleting an author does not load the row first.
+    """
+    headers = {"Authorization": f"Bearer {token}"}
+
+    client.delete(f"/author/{author.id}", headers=headers)
+
+    assert not any(s.startswith("SELECT author") for s in sql_statements)
+    assert len([s for s in sql_statements if s.startswith("DELETE")]) == 1
+
+
+def test_delete_author_with_books(client, token, author, book):
+    """
+    Test that an author who still has books is not deleted.
+    """
+    headers = {"Authorization": f"Bearer {token}"}
+
+    response = client.delete(f"/author/{author.id}", headers=headers)
+
+    assert response.status_code == HTTPStatus.CONFLICT
+    assert response.json() == {
+        "detail": "Author still has books and cannot be deleted."
+    }
+    for path in (f"/author/{author.id}", f"/book/{book.id}"):
+        assert client.get(path, headers=headers).status_code == HTTPStatus.OK
+
+
 def test_delete_author_not_found(client, token):
     """
     Test deleting a non-existing author.
@@ -176,3 +240,183 @@ def test_delete_author_unauthorized(client, author):
 
     assert response.status_code == HTTPStatus.UNAUTHORIZED
     assert response.json() == {"detail": "Not authenticated"}
+
+
+def test_bulk_create_authors(client, token, author):
+    """
+    Test creating many authors with per-item results.
+    """
+    headers = {"Authorization": f"Bearer {token}"}
+    bulk_data = dict(
+        authors=[
+            dict(name="New Author!"),
+            dict(name="Sample Author"),
+            dict(name="new   author"),
+            dict(name="???"),
+        ]
+    )
+
+    response = client.post("/author/bulk", json=bulk_data, headers=headers)
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json() == {
+        "created": 1,
+        "duplicates": 2,
+        "invalid": 1,
+        "items": [
+            {
+                "index": 0,
+                "status": "created",
+                "author": {"name": "new author", "id": 2},
+                "detail": None,
+            },
+            {
+                "index": 1,
+                "status": "duplicate",
+                "author": None,
+                "detail": "An author with this name already exists.",
+            },
+            {
+                "index": 2,
+                "status": "duplicate",
+                "author": None,
+                "detail": "An author with this name already exists.",
+            },
+            {
+                "index": 3,
+                "status": "invalid",
+                "author": None,
+                "detail": "Author name is empty after sanitization.",
+            },
+        ],
+    }
+
+
+def test_bulk_create_authors_unauthorized(client):
+    """
+    Test creating many authors without authorization.
+    """
+    response = client.post(
+        "/author/bulk", json=dict(authors=[dict(name="Someone")])
+    )
+
+    assert response.status_code == HTTPStatus.UNAUTHORIZED
+
+
+def test_author_response_cache_invalidation(client, token, author):
+    """
+    Test that author reads are cached until the author changes.
+    """
+    headers = {"Authorization": f"Bearer {token}"}
+
+    client.get(f"/author/{author.id}", headers=headers)
+    cached = client.get(f"/author/{author.id}", headers=headers)
+    client.patch(
+        f"/author/{author.id}", json={"name": "Renamed"}, headers=headers
+    )
+    updated = client.get(f"/author/{author.id}", headers=headers)
+
+    assert cached.headers["X-Query-Count"] == "0"
+    assert updated.json() == {"id": author.id, "name": "renamed"}
+
+
+def test_export_authors(client, token, another_author):
+    """
+    Test exporting every author as NDJSON.
+    """
+    headers = {"Authorization": f"Bearer {token}"}
+
+    response = client.get("/author/export", headers=headers)
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.text.splitlines() == [
+        '{"name": "sample author", "id": 1}',
+        '{"name": "another author", "id": 2}',
+    ]
+
+
+def test_import_authors(client, token, author):
+    """
+    Test importing authors from an NDJSON body.
+    """
+    headers = {"Authorization": f"Bearer {token}"}
+    body = '{"name": "New Author"}\n{"name": "Sample Author"}\n{"nom": "x"}\n'
+
+    response = client.post("/author/import", content=body, headers=headers)
+    summary = response.json()
+
+    assert response.status_code == HTTPStatus.OK
+    assert (summary["created"], summary["duplicates"], summary["invalid"]) == (
+        1,
+        1,
+        1,
+    )
+    assert summary["errors"][0]["row"] == 3
+
+
+def test_read_authors_batch(client, token, another_author):
+    """
+    Test reading many authors by id.
+    """
+    headers = {"Authorization": f"Bearer {token}"}
+
+    response = client.get("/author/batch?ids=2,1,5", headers=headers)
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json() == {
+        "authors": [
+            {"id": 2, "name": "another author"},
+            {"id": 1, "name": "sample author"},
+        ],
+        "missing": [5],
+    }
+
+
+def test_read_author_expand_books(client, session, token, author):
+    """
+    Test paging an author's books in an expanded read.
+    """
+    headers = {"Authorization": f"Bearer {token}"}
+    client.post(
+        "/book/bulk",
+        json=dict(
+            books=[
+                dict(title=f"Book {index}", author_id=1, publish_year=2000)
+                for index in range(5)
+            ]
+        ),
+        headers=headers,
+    )
+    session.expunge_all()
+
+    first = client.get("/author/1?expand=books&books_limit=2", headers=headers)
+    last = client.get(
+        "/author/1?expand=books&books_limit=2&books_skip=4", headers=headers
+    )
+
+    assert first.status_code == HTTPStatus.OK
+    assert first.json() == {
+        "name": "sample author",
+        "id": 1,
+        "books": [
+            {"title": "book 0", "author_id": 1, "publish_year": 2000, "id": 1},
+            {"title": "book 1", "author_id": 1, "publish_year": 2000, "id": 2},
+        ],
+        "books_next_skip": 2,
+    }
+    assert first.headers["X-Query-Count"] == "2"
+    assert [book["id"] for book in last.json()["books"]] == [5]
+    assert last.json()["books_next_skip"] is None
+    assert first.headers["ETag"] != last.headers["ETag"]
+
+
+def test_read_author_sparse_fields(client, token, author):
+    """
+    Test reading only some fields of an author.
+    """
+    headers = {"Authorization": f"Bearer {token}"}
+
+    response = client.get("/author/1?fields=name", headers=headers)
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json() == {"name": "sample author"}
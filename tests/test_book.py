@@ -1,5 +1,12 @@
+import json
 from http import HTTPStatus
 
+import pytest
+
+from maddr_api.services.cache import response_cache
+from maddr_api.services.imports import settings
+from maddr_api.utils.pagination import encode_cursor
+
 
 def test_successful_book_creation(client, token):
     """
@@ -218,3 +225,784 @@ def test_read_all_books_unauthorized(client):
 
     assert response.status_code == HTTPStatus.UNAUTHORIZED
     assert response.json() == {"detail": "Not authenticated"}
+
+
+def test_update_book_success(client, token, book):
+    """
+    Test updating an existing book successfully.
+    """
+    headers = {"Authorization": f"Bearer {token}"}
+    updated_data = dict(
+        title="Updated Book Title",
+        author_id=2,
+        publish_year=2001,
+    )
+
+    response = client.patch(
+        f"/book/{book.id}", json=updated_data, headers=headers
+    )
+
+    expected_response = updated_data.copy()
+    expected_response.update(dict(id=book.id, title="updated book title"))
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json() == expected_response
+
+
+def test_update_book_not_found(client, token):
+    """
+    Test updating a non-existing book.
+    """
+    headers = {"Authorization": f"Bearer {token}"}
+    updated_data = dict(
+        title="Missing Book",
+        author_id=1,
+        publish_year=2001,
+    )
+
+    response = client.patch("/book/9999", json=updated_data, headers=headers)
+
+    assert response.status_code == HTTPStatus.NOT_FOUND
+    assert response.json() == {"detail": "Book not found."}
+
+
+def test_update_book_with_existing_title(client, token, book):
+    """
+    Test updating a book with a title that belongs to another book.
+    """
+    headers = {"Authorization": f"Bearer {token}"}
+    other_book = client.post(
+        "/book/",
+        json=dict(title="Other Book", author_id=1, publish_year=2001),
+        headers=headers,
+    ).json()
+
+    response = client.patch(
+        f"/book/{other_book['id']}",
+        json=dict(title=book.title, author_id=1, publish_year=2001),
+        headers=headers,
+    )
+
+    assert response.status_code == HTTPStatus.CONFLICT
+    assert response.json() == {
+        "detail": "A book with this title already exists."
+    }
+
+
+def test_delete_book_success(client, token, book):
+    """
+    Test deleting an existing book successfully.
+    """
+    headers = {"Authorization": f"Bearer {token}"}
+
+    response = client.delete(f"/book/{book.id}", headers=headers)
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json() == {"message": "Book deleted successfully."}
+    assert (
+        client.get(f"/book/{book.id}", headers=headers).status_code
+        == HTTPStatus.NOT_FOUND
+    )
+
+
+def test_delete_book_not_found(client, token):
+    """
+    Test deleting a non-existing book.
+    """
+    headers = {"Authorization": f"Bearer {token}"}
+
+    response = client.delete("/book/9999", headers=headers)
+
+    assert response.status_code == HTTPStatus.NOT_FOUND
+    assert response.json() == {"detail": "Book not found."}
+
+
+def test_bulk_create_books(client, token, book, sql_statements):
+    """
+    Test creating many books with one lookup and one executemany insert,
+    sent one row per statement on SQLite.
+    """
+    headers = {"Authorization": f"Bearer {token}"}
+    bulk_data = dict(
+        books=[
+            dict(title="First Bulk", author_id=1, publish_year=2001),
+            dict(title="Sample Book", author_id=1, publish_year=2002),
+            dict(title="Second Bulk", author_id=1, publish_year=2003),
+        ]
+    )
+
+    response = client.post("/book/bulk", json=bulk_data, headers=headers)
+    body = response.json()
+
+    assert response.status_code == HTTPStatus.OK
+    assert (body["created"], body["duplicates"], body["invalid"]) == (2, 1, 0)
+    assert [item["status"] for item in body["items"]] == [
+        "created",
+        "duplicate",
+        "created",
+    ]
+    assert body["items"][2]["book"] == dict(
+        id=3, title="second bulk", author_id=1, publish_year=2003
+    )
+    assert len([s for s in sql_statements if s.startswith("INSERT")]) == 2
+    assert len([s for s in sql_statements if "book.title IN" in s]) == 1
+
+
+def test_bulk_create_books_empty_list(client, token):
+    """
+    Test that a bulk creation requires at least one book.
+    """
+    headers = {"Authorization": f"Bearer {token}"}
+
+    response = client.post("/book/bulk", json=dict(books=[]), headers=headers)
+
+    assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+
+
+def test_bulk_upsert_books(client, token, book):
+    """
+    Test creating and updating many books by title in one request, with
+    the cached responses of the updated books invalidated.
+    """
+    headers = {"Authorization": f"Bearer {token}"}
+    client.get(f"/book/{book.id}", headers=headers)
+    bulk_data = dict(
+        books=[
+            dict(title="Sample Book!", author_id=1, publish_year=1999),
+            dict(title="Upserted", author_id=1, publish_year=2005),
+        ]
+    )
+
+    response = client.put("/book/bulk", json=bulk_data, headers=headers)
+    cached = client.get(f"/book/{book.id}", headers=headers)
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json() == [
+        dict(id=book.id, title="sample book", author_id=1, publish_year=1999),
+        dict(id=2, title="upserted", author_id=1, publish_year=2005),
+    ]
+    assert cached.json()["publish_year"] == 1999
+
+
+def test_read_all_books_cursor_pagination(client, token, sql_statements):
+    """
+    Test paging through books with the cursor returned by each page.
+    """
+    headers = {"Authorization": f"Bearer {token}"}
+    client.post(
+        "/book/bulk",
+        json=dict(
+            books=[
+                dict(title=f"Paged {index}", author_id=1, publish_year=2000)
+                for index in range(5)
+            ]
+        ),
+        headers=headers,
+    )
+
+    first_page = client.get("/book/?limit=2", headers=headers)
+    sql_statements.clear()
+    second_page = client.get(
+        f"/book/?limit=2&cursor={first_page.headers['X-Next-Cursor']}",
+        headers=headers,
+    )
+    last_page = client.get(
+        f"/book/?limit=2&cursor={second_page.headers['X-Next-Cursor']}",
+        headers=headers,
+    )
+
+    assert [book["id"] for book in first_page.json()] == [1, 2]
+    assert [book["id"] for book in second_page.json()] == [3, 4]
+    assert [book["id"] for book in last_page.json()] == [5]
+    assert "X-Next-Cursor" not in last_page.headers
+    assert all("WHERE book.id > ?" in s for s in sql_statements)
+
+
+def test_read_all_books_cursor_with_sort_key(client, token):
+    """
+    Test that cursor pagination follows the chosen sort key.
+    """
+    headers = {"Authorization": f"Bearer {token}"}
+    client.post(
+        "/book/bulk",
+        json=dict(
+            books=[
+                dict(title="Beta", author_id=1, publish_year=2001),
+                dict(title="Alpha", author_id=1, publish_year=2002),
+                dict(title="Gamma", author_id=1, publish_year=2001),
+            ]
+        ),
+        headers=headers,
+    )
+
+    first_page = client.get(
+        "/book/?limit=2&sort=publish_year", headers=headers
+    )
+    second_page = client.get(
+        "/book/?limit=2&sort=publish_year"
+        f"&cursor={first_page.headers['X-Next-Cursor']}",
+        headers=headers,
+    )
+
+    assert [book["title"] for book in first_page.json()] == ["beta", "gamma"]
+    assert [book["title"] for book in second_page.json()] == ["alpha"]
+
+
+def test_read_all_books_invalid_cursor(client, token, book):
+    """
+    Test that a malformed or mismatched cursor is rejected.
+    """
+    headers = {"Authorization": f"Bearer {token}"}
+    title_cursor = encode_cursor("title", book.title, book.id)
+
+    response = client.get("/book/?cursor=not-a-cursor", headers=headers)
+    mismatched = client.get(f"/book/?cursor={title_cursor}", headers=headers)
+
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+    assert response.json() == {"detail": "Invalid cursor."}
+    assert mismatched.status_code == HTTPStatus.BAD_REQUEST
+
+
+@pytest.mark.parametrize(
+    ("sort", "value"),
+    [
+        ("title", ["a", "b"]),
+        ("title", {"title": "a"}),
+        ("title", 1),
+        ("publish_year", "2000"),
+        ("publish_year", True),
+        ("id", None),
+    ],
+)
+def test_read_all_books_tampered_cursor_value(client, token, sort, value):
+    """
+    Test that a cursor whose value does not match the sort column is rejected.
+    """
+    cursor = encode_cursor(sort, value, 1)
+
+    response = client.get(
+        f"/book/?sort={sort}&cursor={cursor}",
+        headers={"Authorization": f"Bearer {token}"},
+    )
+
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+    assert response.json() == {"detail": "Invalid cursor."}
+
+
+def test_read_all_books_full_text_search(
+    client, token, sql_statements, create_books
+):
+    """
+    Test that title searches go through the full-text index by word prefix.
+    """
+    headers = {"Authorization": f"Bearer {token}"}
+    create_books(["Harry Potter", "Potter Stories", "Spotted Dog"])
+    sql_statements.clear()
+
+    response = client.get("/book/?title=pott", headers=headers)
+
+    assert response.status_code == HTTPStatus.OK
+    assert [book["title"] for book in response.json()] == [
+        "harry potter",
+        "potter stories",
+    ]
+    assert any("book_fts MATCH" in s for s in sql_statements)
+    assert not any("LIKE" in s for s in sql_statements)
+
+
+def test_read_all_books_full_text_ranks_by_relevance(
+    client, token, create_books
+):
+    """
+    Test that full-text results are ordered by relevance.
+    """
+    headers = {"Authorization": f"Bearer {token}"}
+    create_books([
+        "A very long title that mentions the ring once",
+        "Ring Ring",
+    ])
+
+    response = client.get("/book/?title=ring", headers=headers)
+
+    assert [book["title"] for book in response.json()] == [
+        "ring ring",
+        "a very long title that mentions the ring once",
+    ]
+
+
+def test_full_text_index_follows_updates_and_deletes(client, token, book):
+    """
+    Test that the full-text index stays in sync with book writes.
+    """
+    headers = {"Authorization": f"Bearer {token}"}
+    client.patch(
+        f"/book/{book.id}",
+        json=dict(title="Renamed Book", author_id=1, publish_year=2020),
+        headers=headers,
+    )
+
+    old_title = client.get("/book/?title=sample", headers=headers)
+    new_title = client.get("/book/?title=renamed", headers=headers)
+    client.delete(f"/book/{book.id}", headers=headers)
+    deleted = client.get("/book/?title=renamed", headers=headers)
+
+    assert old_title.status_code == HTTPStatus.NOT_FOUND
+    assert [b["id"] for b in new_title.json()] == [book.id]
+    assert deleted.status_code == HTTPStatus.NOT_FOUND
+
+
+def test_read_all_books_substring_mode(client, token, create_books):
+    """
+    Test that the substring mode keeps matching inside words.
+    """
+    headers = {"Authorization": f"Bearer {token}"}
+    create_books(["Harry Potter", "Spotted Dog"])
+
+    fulltext = client.get("/book/?title=pot", headers=headers)
+    substring = client.get(
+        "/book/?title=pot&title_mode=substring", headers=headers
+    )
+
+    assert [book["title"] for book in fulltext.json()] == ["harry potter"]
+    assert [book["title"] for book in substring.json()] == [
+        "harry potter",
+        "spotted dog",
+    ]
+
+
+def test_read_book_served_from_response_cache(
+    client, token, book, sql_statements
+):
+    """
+    Test that repeated reads of a book skip the database.
+    """
+    headers = {"Authorization": f"Bearer {token}"}
+
+    first = client.get(f"/book/{book.id}", headers=headers)
+    sql_statements.clear()
+    second = client.get(f"/book/{book.id}", headers=headers)
+
+    assert second.json() == first.json()
+    assert sql_statements == []
+    assert second.headers["X-Query-Count"] == "0"
+
+
+def test_update_book_invalidates_response_cache(client, token, book):
+    """
+    Test that updating or deleting a book drops its cached response.
+    """
+    headers = {"Authorization": f"Bearer {token}"}
+    client.get(f"/book/{book.id}", headers=headers)
+
+    client.patch(
+        f"/book/{book.id}",
+        json=dict(title="Changed", author_id=1, publish_year=2020),
+        headers=headers,
+    )
+    updated = client.get(f"/book/{book.id}", headers=headers)
+    client.delete(f"/book/{book.id}", headers=headers)
+    deleted = client.get(f"/book/{book.id}", headers=headers)
+
+    assert updated.json()["title"] == "changed"
+    assert deleted.status_code == HTTPStatus.NOT_FOUND
+
+
+def test_read_book_conditional_get(client, token, book):
+    """
+    Test that a book read returns validators and honours If-None-Match.
+    """
+    headers = {"Authorization": f"Bearer {token}"}
+
+    first = client.get(f"/book/{book.id}", headers=headers)
+    not_modified = client.get(
+        f"/book/{book.id}",
+        headers=headers | {"If-None-Match": first.headers["ETag"]},
+    )
+    client.patch(
+        f"/book/{book.id}",
+        json=dict(title="Changed", author_id=1, publish_year=2020),
+        headers=headers,
+    )
+    modified = client.get(
+        f"/book/{book.id}",
+        headers=headers | {"If-None-Match": first.headers["ETag"]},
+    )
+
+    assert "Last-Modified" in first.headers
+    assert not_modified.status_code == HTTPStatus.NOT_MODIFIED
+    assert not_modified.content == b""
+    assert not_modified.headers["ETag"] == first.headers["ETag"]
+    assert modified.status_code == HTTPStatus.OK
+    assert modified.headers["ETag"] != first.headers["ETag"]
+
+
+@pytest.mark.asyncio
+async def test_read_book_conditional_get_checks_updated_at_only(
+    client, token, book, sql_statements
+):
+    """
+    Test that a 304 on a cold cache only queries updated_at.
+    """
+    headers = {"Authorization": f"Bearer {token}"}
+    etag = client.get(f"/book/{book.id}", headers=headers).headers["ETag"]
+    await response_cache.clear()
+    sql_statements.clear()
+
+    response = client.get(
+        f"/book/{book.id}", headers=headers | {"If-None-Match": etag}
+    )
+
+    assert response.status_code == HTTPStatus.NOT_MODIFIED
+    assert [s.split(" \n")[0] for s in sql_statements] == [
+        "SELECT book.updated_at"
+    ]
+
+
+def test_read_book_if_modified_since(client, token, book):
+    """
+    Test that If-Modified-Since is honoured when no ETag is sent.
+    """
+    headers = {"Authorization": f"Bearer {token}"}
+    last_modified = client.get(f"/book/{book.id}", headers=headers).headers[
+        "Last-Modified"
+    ]
+
+    current = client.get(
+        f"/book/{book.id}",
+        headers=headers | {"If-Modified-Since": last_modified},
+    )
+    stale = client.get(
+        f"/book/{book.id}",
+        headers=headers
+        | {"If-Modified-Since": "Mon, 01 Jan 2001 00:00:00 GMT"},
+    )
+
+    assert current.status_code == HTTPStatus.NOT_MODIFIED
+    assert stale.status_code == HTTPStatus.OK
+
+
+def test_read_all_books_conditional_get(client, token, book):
+    """
+    Test that list pages carry validators and can be revalidated.
+    """
+    headers = {"Authorization": f"Bearer {token}"}
+
+    first = client.get("/book/", headers=headers)
+    not_modified = client.get(
+        "/book/", headers=headers | {"If-None-Match": first.headers["ETag"]}
+    )
+    other_page = client.get(
+        "/book/?publish_year=1900",
+        headers=headers | {"If-None-Match": first.headers["ETag"]},
+    )
+
+    assert first.status_code == HTTPStatus.OK
+    assert not_modified.status_code == HTTPStatus.NOT_MODIFIED
+    assert other_page.status_code == HTTPStatus.NOT_FOUND
+
+
+def test_export_books_ndjson(client, token, create_books):
+    """
+    Test exporting the filtered catalog as NDJSON.
+    """
+    headers = {"Authorization": f"Bearer {token}"}
+    create_books(["Harry Potter", "Dune", "Potter Tales"])
+
+    response = client.get("/book/export?title=potter", headers=headers)
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert [json.loads(line) for line in response.text.splitlines()] == [
+        dict(id=1, title="harry potter", author_id=1, publish_year=2000),
+        dict(id=3, title="potter tales", author_id=1, publish_year=2000),
+    ]
+
+
+def test_export_books_csv(client, token, book):
+    """
+    Test exporting the catalog as CSV.
+    """
+    headers = {"Authorization": f"Bearer {token}"}
+
+    response = client.get("/book/export?format=csv", headers=headers)
+
+    assert response.headers["content-type"].startswith("text/csv")
+    assert "books.csv" in response.headers["content-disposition"]
+    assert response.text.splitlines() == [
+        "title,author_id,publish_year,id",
+        "sample book,1,2020,1",
+    ]
+
+
+def test_export_books_unauthorized(client):
+    """
+    Test exporting books without authorization.
+    """
+    response = client.get("/book/export")
+
+    assert response.status_code == HTTPStatus.UNAUTHORIZED
+
+
+def test_import_books_csv(client, token, book, another_author, sql_statements):
+    """
+    Test importing books from CSV with author names resolved per batch.
+    """
+    headers = {"Authorization": f"Bearer {token}", "Content-Type": "text/csv"}
+    body = (
+        "title,author_name,author_id,publish_year\n"
+        "New Book!,Sample Author,,2001\n"
+        "Sample Book,,1,2002\n"
+        "Other Book,Another Author,,2003\n"
+        "Lost Book,Nobody,,2004\n"
+        "Bad Year,,1,unknown\n"
+        "new book,,1,2005\n"
+    )
+
+    response = client.post(
+        "/book/import?format=csv", content=body, headers=headers
+    )
+    summary = response.json()
+
+    assert response.status_code == HTTPStatus.OK
+    assert (
+        summary["created"],
+        summary["duplicates"],
+        summary["invalid"],
+    ) == (2, 2, 2)
+    assert [error["row"] for error in summary["errors"]] == [4, 5]
+    assert summary["errors"][0]["detail"] == "Unknown author."
+    assert len([s for s in sql_statements if "author.name IN" in s]) == 1
+    assert len([s for s in sql_statements if "book.title IN" in s]) == 1
+    assert len([s for s in sql_statements if s.startswith("INSERT")]) == 2
+
+
+def test_import_books_ndjson_in_batches(client, token, monkeypatch):
+    """
+    Test that NDJSON imports commit one batch at a time.
+    """
+    monkeypatch.setattr(settings, "IMPORT_BATCH_SIZE", 2)
+    headers = {"Authorization": f"Bearer {token}"}
+    lines = [
+        json.dumps(dict(title=f"Book {index}", author_id=1, publish_year=2000))
+        for index in range(3)
+    ]
+
+    response = client.post(
+        "/book/import",
+        content="\n".join([*lines, "not json"]),
+        headers=headers,
+    )
+    summary = response.json()
+
+    assert summary["created"] == 3
+    assert [
+        (batch["first_row"], batch["rows"], batch["created"])
+        for batch in summary["batches"]
+    ] == [(1, 2, 2), (3, 2, 1)]
+    assert summary["errors"] == [{"row": 4, "detail": "Invalid JSON."}]
+
+
+def test_import_books_unauthorized(client):
+    """
+    Test importing books without authorization.
+    """
+    response = client.post("/book/import", content="")
+
+    assert response.status_code == HTTPStatus.UNAUTHORIZED
+
+
+def test_read_books_batch(client, token, sql_statements, create_books):
+    """
+    Test reading many books with one query, in request order.
+    """
+    headers = {"Authorization": f"Bearer {token}"}
+    create_books(["First", "Second", "Third"])
+    sql_statements.clear()
+
+    response = client.get("/book/batch?ids=3,99&ids=1&ids=3", headers=headers)
+
+    assert response.status_code == HTTPStatus.OK
+    assert [book["id"] for book in response.json()["books"]] == [3, 1]
+    assert response.json()["missing"] == [99]
+    assert len(sql_statements) == 1
+    assert "book.id IN" in sql_statements[0]
+
+
+def test_read_books_batch_invalid_ids(client, token):
+    """
+    Test that batch reads reject non-integer or missing ids.
+    """
+    headers = {"Authorization": f"Bearer {token}"}
+
+    invalid = client.get("/book/batch?ids=1,abc", headers=headers)
+    empty = client.get("/book/batch?ids=", headers=headers)
+
+    assert invalid.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+    assert invalid.json() == {"detail": "Ids must be integers."}
+    assert empty.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+
+
+def test_read_all_books_expand_author(client, session, token):
+    """
+    Test that expanded pages embed authors with a constant query count.
+    """
+    headers = {"Authorization": f"Bearer {token}"}
+    client.post(
+        "/author/bulk",
+        json=dict(authors=[dict(name="First"), dict(name="Second")]),
+        headers=headers,
+    )
+    client.post(
+        "/book/bulk",
+        json=dict(
+            books=[
+                dict(
+                    title=f"Book {index}",
+                    author_id=index % 2 + 1,
+                    publish_year=2000,
+                )
+                for index in range(6)
+            ]
+        ),
+        headers=headers,
+    )
+    session.expunge_all()
+
+    small_page = client.get("/book/?expand=author&limit=2", headers=headers)
+    session.expunge_all()
+    full_page = client.get("/book/?expand=author&limit=6", headers=headers)
+
+    assert full_page.status_code == HTTPStatus.OK
+    assert len(full_page.json()) == 6
+    assert full_page.json()[0] == {
+        "title": "book 0",
+        "author_id": 1,
+        "publish_year": 2000,
+        "id": 1,
+        "author": {"name": "first", "id": 1},
+    }
+    assert full_page.json()[1]["author"] == {"name": "second", "id": 2}
+    assert (
+        small_page.headers["X-Query-Count"]
+        == full_page.headers["X-Query-Count"]
+        == "1"
+    )
+    assert small_page.headers["X-Next-Cursor"]
+
+
+def test_read_all_books_expand_author_etag(client, token, create_books):
+    """
+    Test that renaming an author changes the ETag of expanded pages only.
+    """
+    headers = {"Authorization": f"Bearer {token}"}
+    client.post("/author/", json=dict(name="Writer"), headers=headers)
+    create_books(["Expanded"])
+
+    plain = client.get("/book/", headers=headers).headers["ETag"]
+    expanded = client.get("/book/?expand=author", headers=headers)
+    client.patch("/author/1", json=dict(name="Renamed"), headers=headers)
+    renamed = client.get(
+        "/book/?expand=author",
+        headers={**headers, "If-None-Match": expanded.headers["ETag"]},
+    )
+
+    assert expanded.headers["ETag"] != plain
+    assert client.get("/book/", headers=headers).headers["ETag"] == plain
+    assert renamed.status_code == HTTPStatus.OK
+    assert renamed.json()[0]["author"]["name"] == "renamed"
+
+
+def test_read_book_expand_author(client, session, token, create_books):
+    """
+    Test reading a single book with its author in one query.
+    """
+    headers = {"Authorization": f"Bearer {token}"}
+    client.post("/author/", json=dict(name="Writer"), headers=headers)
+    create_books(["Expanded"])
+    session.expunge_all()
+
+    response = client.get("/book/1?expand=author", headers=headers)
+    not_modified = client.get(
+        "/book/1?expand=author",
+        headers={**headers, "If-None-Match": response.headers["ETag"]},
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()["author"] == {"name": "writer", "id": 1}
+    assert response.headers["X-Query-Count"] == "1"
+    assert not_modified.status_code == HTTPStatus.NOT_MODIFIED
+    assert client.get("/book/99?expand=author", headers=headers).json() == {
+        "detail": "Book not found."
+    }
+
+
+def test_read_all_books_sparse_fields(
+    client, token, sql_statements, create_books
+):
+    """
+    Test that fields narrows both the SELECT and the response.
+    """
+    headers = {"Authorization": f"Bearer {token}"}
+    create_books(["First", "Second", "Third"])
+    sql_statements.clear()
+
+    response = client.get(
+        "/book/?fields=title,id&limit=2&sort=title", headers=headers
+    )
+    next_page = client.get(
+        "/book/?fields=title,id&limit=2&sort=title"
+        f"&cursor={response.headers['X-Next-Cursor']}",
+        headers=headers,
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json() == [
+        {"id": 1, "title": "first"},
+        {"id": 2, "title": "second"},
+    ]
+    assert next_page.json() == [{"id": 3, "title": "third"}]
+    assert "book.publish_year" not in sql_statements[0]
+    assert "book.author_id" not in sql_statements[0]
+    assert (
+        response.headers["ETag"]
+        != client.get("/book/?limit=2&sort=title", headers=headers).headers[
+            "ETag"
+        ]
+    )
+
+
+def test_read_book_sparse_fields(client, token, book, sql_statements):
+    """
+    Test reading only some fields of a book.
+    """
+    headers = {"Authorization": f"Bearer {token}"}
+    sql_statements.clear()
+
+    response = client.get("/book/1?fields=title", headers=headers)
+    not_modified = client.get(
+        "/book/1?fields=title",
+        headers={**headers, "If-None-Match": response.headers["ETag"]},
+    )
+
+    assert response.json() == {"title": "sample book"}
+    assert "book.author_id" not in sql_statements[0]
+    assert not_modified.status_code == HTTPStatus.NOT_MODIFIED
+    assert client.get("/book/99?fields=title", headers=headers).json() == {
+        "detail": "Book not found."
+    }
+
+
+def test_read_books_invalid_fields(client, token, book):
+    """
+    Test that unknown fields and fields with expand are rejected.
+    """
+    headers = {"Authorization": f"Bearer {token}"}
+
+    unknown = client.get("/book/?fields=id,secret", headers=headers)
+    expanded = client.get("/book/1?fields=id&expand=author", headers=headers)
+
+    assert unknown.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+    assert unknown.json() == {"detail": "Unknown fields: secret."}
+    assert expanded.json() == {
+        "detail": "Fields cannot be combined with expand."
+    }
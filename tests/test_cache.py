@@ -0,0 +1,123 @@
+import pytest
+
+from maddr_api.services.cache import (
+    KeyValueCacheBackend,
+    LRUCacheBackend,
+    ResponseCache,
+)
+
+
+class LocalKeyValueClient:
+    """
+    In-memory stand-in for an external key-value store.
+    """
+
+    def __init__(self):
+        self.values = {}
+        self.expirations = {}
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    async def set(self, key, value, ex):
+        self.values[key] = value
+        self.expirations[key] = ex
+
+    async def delete(self, *keys):
+        for key in keys:
+            self.values.pop(key, None)
+
+    async def incr(self, key):
+        self.values[key] = int(self.values.get(key, 0)) + 1
+
+        return self.values[key]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "backend",
+    [
+        LRUCacheBackend(max_size=10, ttl_seconds=60),
+        KeyValueCacheBackend(LocalKeyValueClient()),
+    ],
+)
+async def test_response_cache_backends(backend):
+    """
+    Test that every backend stores, invalidates and clears entries while
+    counting hits and misses.
+    """
+    cache = ResponseCache(backend=backend, ttl_seconds=60)
+
+    await cache.set("book", 1, b'{"id":1}')
+
+    assert await cache.get("book", 1) == b'{"id":1}'
+    assert await cache.get("book", 2) is None
+
+    await cache.invalidate("book", 1)
+
+    assert await cache.get("book", 1) is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 2
+
+    await cache.set("book", 3, b"{}")
+    await cache.clear()
+
+    assert await cache.get("book", 3) is None
+
+
+@pytest.mark.asyncio
+async def test_key_value_backend_uses_ttl_and_prefix():
+    """
+    Test that key-value entries are stored under the prefix and current
+    generation with the cache TTL.
+    """
+    client = LocalKeyValueClient()
+    cache = ResponseCache(
+        backend=KeyValueCacheBackend(client, prefix="api"), ttl_seconds=30
+    )
+
+    await cache.set("author", 7, b"{}")
+
+    assert client.expirations == {"api:0:author:7": 30}
+
+
+@pytest.mark.asyncio
+async def test_key_value_backend_clear_is_shared_by_every_worker():
+    """
+    Test that clearing through one worker hides the old entries from the
+    others and from workers started afterwards.
+    """
+    client = LocalKeyValueClient()
+    worker = ResponseCache(
+        backend=KeyValueCacheBackend(client), ttl_seconds=30
+    )
+    other_worker = ResponseCache(
+        backend=KeyValueCacheBackend(client), ttl_seconds=30
+    )
+
+    await worker.set("book", 1, b"{}")
+    await other_worker.clear()
+    restarted_worker = ResponseCache(
+        backend=KeyValueCacheBackend(client), ttl_seconds=30
+    )
+
+    assert await worker.get("book", 1) is None
+    assert await restarted_worker.get("book", 1) is None
+
+    await restarted_worker.set("book", 1, b"[]")
+
+    assert await worker.get("book", 1) == b"[]"
+
+
+@pytest.mark.asyncio
+async def test_response_cache_disabled_with_zero_ttl():
+    """
+    Test that a zero TTL turns the cache off.
+    """
+    cache = ResponseCache(
+        backend=LRUCacheBackend(max_size=10, ttl_seconds=60), ttl_seconds=0
+    )
+
+    await cache.set("book", 1, b"{}")
+
+    assert await cache.get("book", 1) is None
@@ -0,0 +1,149 @@
+import gzip
+from http import HTTPStatus
+
+import pytest
+
+from maddr_api.middleware import compression
+from maddr_api.routers import book as book_router
+from maddr_api.utils.compression import StreamCompressor, negotiate_encoding
+
+
+@pytest.mark.parametrize(
+    ("accept_encoding", "expected"),
+    [
+        (None, None),
+        ("gzip, deflate", "gzip"),
+        ("br;q=1.0, gzip;q=0.5", "gzip"),
+        ("identity", None),
+        ("gzip;q=0", None),
+        ("*", "gzip"),
+    ],
+)
+def test_negotiate_encoding(accept_encoding, expected):
+    """
+    Test choosing a content coding from Accept-Encoding without brotli.
+    """
+
+    assert negotiate_encoding(accept_encoding) == expected
+
+
+def test_stream_compressor_round_trip():
+    """
+    Test that a streamed gzip body decompresses to its chunks.
+    """
+    compressor = StreamCompressor("gzip", 6)
+
+    body = compressor.compress(b"first,") + compressor.compress(b"second")
+    body += compressor.finish()
+
+    assert gzip.decompress(body) == b"first,second"
+
+
+def test_large_page_is_compressed(client, token, create_books):
+    """
+    Test that large JSON pages are gzipped with a weak ETag that still
+    validates conditional requests, and that the 304 carries the same
+    weak ETag.
+    """
+    headers = {"Authorization": f"Bearer {token}"}
+    create_books([f"Compressed Book {index}" for index in range(20)])
+
+    response = client.get("/book/", headers=headers)
+    not_modified = client.get(
+        "/book/",
+        headers={**headers, "If-None-Match": response.headers["ETag"]},
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.headers["Vary"] == "Accept-Encoding"
+    assert response.headers["ETag"].startswith('W/"')
+    assert len(response.json()) == 20
+    assert not_modified.status_code == HTTPStatus.NOT_MODIFIED
+    assert not_modified.headers["ETag"] == response.headers["ETag"]
+
+
+def test_small_or_unaccepted_responses_are_not_compressed(
+    client, token, create_books
+):
+    """
+    Test that the size threshold and Accept-Encoding are honoured.
+    """
+    headers = {"Authorization": f"Bearer {token}"}
+    create_books([f"Compressed Book {index}" for index in range(20)])
+
+    small = client.get("/book/?limit=1", headers=headers)
+    identity = client.get(
+        "/book/", headers={**headers, "Accept-Encoding": "identity"}
+    )
+
+    assert "Content-Encoding" not in small.headers
+    assert "Content-Encoding" not in identity.headers
+    assert len(identity.json()) == 20
+
+
+def test_compressed_bodies_are_cached(
+    client, token, monkeypatch, create_books
+):
+    """
+    Test that repeated responses reuse the cached compressed body.
+    """
+    headers = {"Authorization": f"Bearer {token}"}
+    create_books([f"Compressed Book {index}" for index in range(20)])
+    calls = []
+    original = compression.compress
+
+    def counting_compress(body, encoding, level):
+        calls.append(encoding)
+        return original(body, encoding, level)
+
+    monkeypatch.setattr(compression, "compress", counting_compress)
+
+    first = client.get("/book/", headers=headers)
+    second = client.get("/book/", headers=headers)
+
+    assert first.content == second.content
+    assert second.headers["Content-Encoding"] == "gzip"
+    assert calls == ["gzip"]
+
+
+def test_cached_compressed_body_follows_serialization(
+    client, token, monkeypatch, create_books
+):
+    """
+    Test that a new serialization of an unchanged page is not answered
+    with the compressed body of the old one, although the ETag is the same.
+    """
+    headers = {"Authorization": f"Bearer {token}"}
+    create_books([f"Compressed Book {index}" for index in range(20)])
+    first = client.get("/book/", headers=headers)
+    original = book_router.encode_rows
+
+    monkeypatch.setattr(
+        book_router,
+        "encode_rows",
+        lambda *args: original(*args).replace(b'"id"', b'"id" '),
+    )
+
+    second = client.get("/book/", headers=headers)
+    identity = client.get(
+        "/book/", headers={**headers, "Accept-Encoding": "identity"}
+    )
+
+    assert second.headers["ETag"] == first.headers["ETag"]
+    assert second.content == identity.content
+    assert second.content != first.content
+
+
+def test_export_is_compressed_while_streaming(client, token, create_books):
+    """
+    Test that streamed exports are compressed chunk by chunk.
+    """
+    headers = {"Authorization": f"Bearer {token}"}
+    create_books([f"Compressed Book {index}" for index in range(3)])
+
+    response = client.get("/book/export", headers=headers)
+
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert "Content-Length" not in response.headers
+    assert len(response.text.splitlines()) == 3
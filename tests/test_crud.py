@@ -0,0 +1,220 @@
+import pytest
+from sqlalchemy import select
+
+from maddr_api.models.author import Author
+from maddr_api.models.book import Book
+from maddr_api.schemas.author import AuthorCreate
+from maddr_api.schemas.book import BookCreate
+from maddr_api.schemas.bulk import BulkStatus
+from maddr_api.services import main
+from maddr_api.services.cache import response_cache
+from maddr_api.services.main import BaseCRUD
+
+
+@pytest.mark.asyncio
+async def test_delete_many_removes_rows_in_one_statement(
+    session, sql_statements
+):
+    """
+    Test that delete_many removes every matching row with one DELETE and
+    reports only the ids it deleted.
+    """
+    session.add_all([Author(name="first"), Author(name="second")])
+    await session.commit()
+    sql_statements.clear()
+
+    deleted = await BaseCRUD(Author, session).delete_many(
+        id_column="id", values=[1, 2, 999]
+    )
+
+    remaining = await session.scalars(select(Author))
+
+    assert sorted(deleted) == [1, 2]
+    assert remaining.all() == []
+    assert [s for s in sql_statements if s.startswith("DELETE")] == [
+        "DELETE FROM author WHERE author.id IN (?, ?, ?) RETURNING id"
+    ]
+
+
+@pytest.mark.asyncio
+async def test_delete_returns_false_when_nothing_matched(session):
+    """
+    Test that delete reports a missing row as False.
+    """
+    deleted = await BaseCRUD(Author, session).delete(id_column="id", value=1)
+
+    assert deleted is False
+
+
+@pytest.mark.asyncio
+async def test_create_many_inserts_in_chunks(session, sql_statements):
+    """
+    Test that create_many inserts in chunks without reading back, and
+    returns the records in input order.
+    """
+    data = [AuthorCreate(name=f"author {index}") for index in range(5)]
+
+    authors = await BaseCRUD(Author, session).create_many(data, chunk_size=2)
+
+    assert [author.name for author in authors] == [
+        f"author {index}" for index in range(5)
+    ]
+    # SQLite cannot order the RETURNING rows of a multi-row INSERT, so each
+    # row goes in its own statement; PostgreSQL sends one per chunk.
+    assert len([s for s in sql_statements if s.startswith("INSERT")]) == 5
+    assert not any(s.startswith("SELECT") for s in sql_statements)
+
+
+@pytest.mark.asyncio
+async def test_create_many_unique_reports_duplicates(session, author):
+    """
+    Test that create_many_unique reports stored and repeated values as
+    duplicates and empty values as invalid.
+    """
+    data = [
+        AuthorCreate(name="new author"),
+        AuthorCreate(name=author.name),
+        AuthorCreate(name="new author"),
+        AuthorCreate(name=""),
+    ]
+
+    results = await BaseCRUD(Author, session).create_many_unique(data, "name")
+
+    assert [status for status, _ in results] == [
+        BulkStatus.CREATED,
+        BulkStatus.DUPLICATE,
+        BulkStatus.DUPLICATE,
+        BulkStatus.INVALID,
+    ]
+    assert results[0][1].name == "new author"
+
+
+@pytest.mark.asyncio
+async def test_upsert_many_updates_existing_rows(session, book):
+    """
+    Test that upsert_many updates the rows matching the conflict fields,
+    inserts the others and returns them in input order.
+    """
+    data = [
+        BookCreate(title="fresh title", author_id=1, publish_year=2001),
+        BookCreate(title=book.title, author_id=2, publish_year=1999),
+    ]
+
+    books = await BaseCRUD(Book, session).upsert_many(data, ["title"])
+
+    assert [(b.id, b.title, b.author_id) for b in books] == [
+        (2, "fresh title", 1),
+        (book.id, book.title, 2),
+    ]
+    assert book.publish_year == 1999
+
+
+@pytest.mark.asyncio
+async def test_upsert_many_invalidates_response_cache(session, book):
+    """
+    Test that upsert_many drops the cached responses of the rows it wrote.
+    """
+    await response_cache.set("book", book.id, b"{}")
+    data = [BookCreate(title=book.title, author_id=1, publish_year=1999)]
+
+    await BaseCRUD(Book, session).upsert_many(data, ["title"])
+
+    assert await response_cache.get("book", book.id) is None
+
+
+@pytest.mark.asyncio
+async def test_upsert_many_rejects_unsupported_dialects(session, monkeypatch):
+    """
+    Test that upsert_many fails clearly on dialects without ON CONFLICT.
+    """
+    monkeypatch.setattr(main, "UPSERT_INSERTS", {})
+    data = [AuthorCreate(name="new author")]
+
+    with pytest.raises(RuntimeError, match="not supported on sqlite"):
+        await BaseCRUD(Author, session).upsert_many(data, ["name"])
+
+
+@pytest.mark.asyncio
+async def test_read_reuses_lookups_until_commit(
+    session, author, sql_statements
+):
+    """
+    Test that read answers repeated lookups, including misses, from the
+    session until the transaction ends.
+    """
+    crud = BaseCRUD(Author, session)
+    session.expunge_all()
+    sql_statements.clear()
+
+    first = await crud.read("name", author.name)
+    again = await crud.read("name", author.name)
+    by_id = await crud.read("id", author.id)
+    missing = await crud.read("name", "missing")
+    await crud.read("name", "missing")
+
+    assert first is again is by_id
+    assert missing is None
+    assert len(sql_statements) == 2
+
+    await session.commit()
+    await crud.read("name", author.name)
+
+    assert len(sql_statements) == 3
+
+
+@pytest.mark.asyncio
+async def test_stream_rows_yields_batches(session):
+    """
+    Test that stream_rows yields the result in batches of chunk_size.
+    """
+    session.add_all([Author(name=f"author {index}") for index in range(5)])
+    await session.commit()
+
+    crud = BaseCRUD(Author, session)
+    batches = [
+        [tuple(row) for row in batch]
+        async for batch in crud.stream_rows(
+            select(Author.id).order_by(Author.id), chunk_size=2
+        )
+    ]
+
+    assert batches == [[(1,), (2,)], [(3,), (4,)], [(5,)]]
+
+
+@pytest.mark.asyncio
+async def test_read_many_warms_read_cache(session, sql_statements):
+    """
+    Test that read_many loads every value with one query and leaves the
+    records for later reads.
+    """
+    session.add_all([Author(name="first"), Author(name="second")])
+    await session.commit()
+    sql_statements.clear()
+
+    crud = BaseCRUD(Author, session)
+    authors = await crud.read_many("name", ["first", "second", "third"])
+    first = await crud.read("name", "first")
+
+    assert sorted(authors) == ["first", "second"]
+    assert first is authors["first"]
+    assert len(sql_statements) == 1
+
+
+@pytest.mark.asyncio
+async def test_read_rows_returns_core_rows(session, sql_statements):
+    """
+    Test that read_rows selects only the requested columns and returns
+    Core rows without loading ORM entities.
+    """
+    session.add(Author(name="first"))
+    await session.commit()
+    session.expunge_all()
+    sql_statements.clear()
+
+    crud = BaseCRUD(Author, session)
+    rows = await crud.read_rows(crud.select_fields(["id", "name", "id"]))
+
+    assert [row._asdict() for row in rows] == [{"id": 1, "name": "first"}]
+    assert not isinstance(rows[0], Author)
+    assert len(session.identity_map) == 0
+    assert sql_statements == ["SELECT author.id, author.name \nFROM author"]
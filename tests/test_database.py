@@ -1,9 +1,46 @@
+from time import time
+
 import pytest
-from maddr_api.models.account import Account
-from sqlalchemy import select
+import pytest_asyncio
+from starlette.requests import Request
+
+from maddr_api.app import app
+from maddr_api.config.database import DatabaseSession
+from maddr_api.models.account import Account, table_registry
+from maddr_api.models.author import Author
+from maddr_api.models.book import Book
+from sqlalchemy import insert, select, text
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import StaticPool
 from dataclasses import asdict
 
 
+@pytest_asyncio.fixture
+async def stale_replica(book):
+    """
+    Replica engine that still holds the sample book as it was created.
+    """
+
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:", poolclass=StaticPool
+    )
+
+    async with engine.begin() as conn:
+        await conn.run_sync(table_registry.metadata.create_all)
+        await conn.execute(
+            insert(Book).values(
+                id=book.id,
+                author_id=book.author_id,
+                title=book.title,
+                publish_year=book.publish_year,
+            )
+        )
+
+    yield engine
+
+    await engine.dispose()
+
+
 @pytest.mark.asyncio
 async def test_create_account_in_database(session, mock_db_time):
     with mock_db_time(model=Account) as time:
@@ -25,8 +62,136 @@ async def test_create_account_in_database(session, mock_db_time):
         username="test_criando_account_in_db",
         password="test_criando_account_in_db",
         email="test_criando_account_in_db@gmail.com",
+        token_version=0,
         created_at=time,
         updated_at=time,
     )
 
     assert asdict(account) == data_expect
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("statement", "index"),
+    [
+        (
+            select(Book).where(Book.publish_year == 2020).order_by(Book.id),
+            "ix_book_publish_year_id",
+        ),
+        (select(Book).where(Book.author_id == 1), "ix_book_author_id"),
+        (select(Book).where(Book.title == "title"), "sqlite_autoindex_book"),
+        (
+            select(Author).where(Author.name == "name"),
+            "sqlite_autoindex_author",
+        ),
+    ],
+)
+async def test_lookups_use_indexes(session, statement, index):
+    compiled = statement.compile(
+        session.bind, compile_kwargs={"literal_binds": True}
+    )
+
+    result = await session.execute(text(f"EXPLAIN QUERY PLAN {compiled}"))
+    plan = " ".join(row.detail for row in result)
+
+    assert (
+        f"USING INDEX {index}" in plan
+        or f"USING COVERING INDEX {index}" in plan
+    )
+    assert "SCAN book" not in plan
+    assert "SCAN author" not in plan
+
+
+def make_request(headers=None):
+    return Request({
+        "type": "http",
+        "method": "GET",
+        "path": "/book/",
+        "headers": [
+            (name.lower().encode(), value.encode())
+            for name, value in (headers or {}).items()
+        ],
+    })
+
+
+def test_read_engine_uses_primary_without_replicas(monkeypatch):
+    monkeypatch.setattr(DatabaseSession, "replica_engines", [])
+
+    assert DatabaseSession.read_engine(make_request()) is (
+        DatabaseSession.engine
+    )
+
+
+def test_read_engine_round_robins_replicas(monkeypatch):
+    replicas = [object(), object()]
+    monkeypatch.setattr(DatabaseSession, "replica_engines", replicas)
+
+    engines = [DatabaseSession.read_engine(make_request()) for _ in range(4)]
+
+    assert set(map(id, engines)) == set(map(id, replicas))
+    assert engines[0] is not engines[1]
+
+
+def test_read_engine_honours_read_your_writes_window(monkeypatch):
+    monkeypatch.setattr(DatabaseSession, "replica_engines", [object()])
+    recent_write = make_request({"X-Read-Your-Writes": str(time() + 5)})
+    recent_cookie = make_request({"Cookie": f"read_your_writes={time() + 5}"})
+    expired = make_request({"X-Read-Your-Writes": str(time() - 1)})
+    forged = make_request({"X-Read-Your-Writes": "99999999999"})
+    invalid = make_request({"X-Read-Your-Writes": "nan"})
+
+    assert DatabaseSession.read_engine(recent_write) is DatabaseSession.engine
+    assert DatabaseSession.read_engine(recent_cookie) is DatabaseSession.engine
+    assert DatabaseSession.read_engine(expired) is not DatabaseSession.engine
+    assert DatabaseSession.read_engine(forged) is not DatabaseSession.engine
+    assert DatabaseSession.read_engine(invalid) is not DatabaseSession.engine
+
+
+def test_writes_open_read_your_writes_window(client, token, monkeypatch):
+    monkeypatch.setattr(DatabaseSession, "replica_engines", [object()])
+    headers = {"Authorization": f"Bearer {token}"}
+
+    write = client.post("/author/", json={"name": "Writer"}, headers=headers)
+    failed_write = client.post(
+        "/author/", json={"name": "Writer"}, headers=headers
+    )
+
+    assert float(write.headers["X-Read-Your-Writes"]) > time()
+    assert "read_your_writes" in write.cookies
+    assert "X-Read-Your-Writes" not in failed_write.headers
+
+
+def test_writes_without_replicas_do_not_set_window(client, token):
+    headers = {"Authorization": f"Bearer {token}"}
+
+    response = client.post(
+        "/author/", json={"name": "Writer"}, headers=headers
+    )
+
+    assert "X-Read-Your-Writes" not in response.headers
+
+
+def test_replica_reads_do_not_fill_response_cache(
+    client, session, token, book, stale_replica, monkeypatch
+):
+    monkeypatch.setattr(DatabaseSession, "engine", session.bind)
+    monkeypatch.setattr(DatabaseSession, "replica_engines", [stale_replica])
+    del app.dependency_overrides[DatabaseSession.get_read_session]
+    headers = {"Authorization": f"Bearer {token}"}
+    title = book.title
+
+    write = client.patch(
+        f"/book/{book.id}",
+        json={"title": "Updated Book", "author_id": 1, "publish_year": 2020},
+        headers=headers,
+    )
+    client.cookies.clear()
+    stale = client.get(f"/book/{book.id}", headers=headers)
+    fresh = client.get(
+        f"/book/{book.id}",
+        headers=headers
+        | {"X-Read-Your-Writes": write.headers["X-Read-Your-Writes"]},
+    )
+
+    assert stale.json()["title"] == title
+    assert fresh.json()["title"] == write.json()["title"] != title
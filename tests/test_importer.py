@@ -0,0 +1,36 @@
+import pytest
+
+from maddr_api.schemas.export import FileFormat
+from maddr_api.utils.importer import iter_lines, iter_records
+
+
+async def chunks(*parts):
+    for part in parts:
+        yield part
+
+
+@pytest.mark.asyncio
+async def test_iter_lines_handles_split_chunks():
+    lines = [
+        line
+        async for line in iter_lines(
+            chunks(b"\xef\xbb\xbfname\r\nJos", b"\xc3", b"\xa9\nlast")
+        )
+    ]
+
+    assert lines == ["name", "José", "last"]
+
+
+@pytest.mark.asyncio
+async def test_iter_records_parses_csv():
+    records = [
+        record
+        async for record in iter_records(
+            chunks(b'name,year\n"Smith, J",1990\n\nshort\n'), FileFormat.CSV
+        )
+    ]
+
+    assert records == [
+        (1, {"name": "Smith, J", "year": "1990"}, None),
+        (2, None, "Wrong number of columns."),
+    ]
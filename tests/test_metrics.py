@@ -0,0 +1,142 @@
+from http import HTTPStatus
+
+import pytest
+from sqlalchemy import exc, text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from maddr_api.config.database import DatabaseSession
+from maddr_api.config.pool import (
+    InstrumentedQueuePool,
+    engine_options,
+    pool_stats,
+)
+from maddr_api.config.settings import Settings
+from maddr_api.security import metrics_token
+
+
+@pytest.fixture
+def metrics_headers(monkeypatch):
+    """
+    Configure a metrics token and return the headers that carry it.
+    """
+
+    monkeypatch.setattr(metrics_token.settings, "METRICS_TOKEN", "scrape")
+
+    return {"X-Metrics-Token": "scrape"}
+
+
+def test_read_metrics(client, metrics_headers, monkeypatch):
+    """
+    Test that the metrics endpoint reports every runtime component, with
+    one database pool entry per engine.
+    """
+    monkeypatch.setattr(
+        DatabaseSession, "replica_engines", [DatabaseSession.engine]
+    )
+
+    response = client.get("/metrics/", headers=metrics_headers)
+    body = response.json()
+
+    assert response.status_code == HTTPStatus.OK
+    assert set(body) == {
+        "database_pools",
+        "account_cache",
+        "password_hash_pool",
+        "response_cache",
+    }
+    assert set(body["database_pools"]) == {"primary", "replica_1"}
+    assert {"in_use", "overflow", "timeouts", "avg_wait_ms"} <= set(
+        body["database_pools"]["primary"]
+    )
+
+
+def test_read_metrics_requires_metrics_token(client, token, metrics_headers):
+    """
+    Test that an account token alone, or a wrong metrics token, does not
+    give access to the metrics.
+    """
+    responses = [
+        client.get("/metrics/"),
+        client.get("/metrics/", headers={"Authorization": f"Bearer {token}"}),
+        client.get("/metrics/", headers={"X-Metrics-Token": "guess"}),
+    ]
+
+    assert [response.status_code for response in responses] == [
+        HTTPStatus.FORBIDDEN
+    ] * 3
+
+
+def test_read_metrics_disabled_without_token_setting(client, token):
+    """
+    Test that the metrics endpoint is hidden when METRICS_TOKEN is unset.
+    """
+    response = client.get(
+        "/metrics/", headers={"Authorization": f"Bearer {token}"}
+    )
+
+    assert response.status_code == HTTPStatus.NOT_FOUND
+
+
+def test_engine_options_use_settings_for_file_databases():
+    """
+    Test that file databases get the instrumented pool sized by the
+    settings.
+    """
+    settings = Settings(
+        DATABASE_URL="sqlite+aiosqlite:///./maddr.db",
+        DATABASE_POOL_SIZE=3,
+        DATABASE_MAX_OVERFLOW=1,
+        DATABASE_POOL_TIMEOUT=2,
+        DATABASE_POOL_PRE_PING=True,
+    )
+
+    options = engine_options(settings)
+
+    assert options["poolclass"] is InstrumentedQueuePool
+    assert (options["pool_size"], options["max_overflow"]) == (3, 1)
+    assert options["pool_timeout"] == 2
+    assert options["pool_pre_ping"] is True
+
+
+def test_engine_options_keep_default_pool_for_memory_databases():
+    """
+    Test that in-memory SQLite keeps the default SQLAlchemy pool.
+    """
+    settings = Settings(DATABASE_URL="sqlite+aiosqlite:///:memory:")
+
+    assert "poolclass" not in engine_options(settings)
+
+
+@pytest.mark.asyncio
+async def test_instrumented_pool_records_checkouts_and_timeouts(tmp_path):
+    """
+    Test that each pool records its own checkouts and timeouts.
+    """
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}",
+        poolclass=InstrumentedQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.05,
+    )
+
+    other_engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}",
+        poolclass=InstrumentedQueuePool,
+    )
+
+    async with engine.connect() as connection:
+        await connection.execute(text("SELECT 1"))
+        stats = pool_stats(engine.sync_engine.pool)
+
+        with pytest.raises(exc.TimeoutError):
+            async with engine.connect():
+                pass
+
+    await engine.dispose()
+    await other_engine.dispose()
+
+    assert stats["in_use"] == 1
+    assert engine.sync_engine.pool.metrics.checkouts == 1
+    assert engine.sync_engine.pool.metrics.timeouts == 1
+    assert other_engine.sync_engine.pool.metrics.checkouts == 0
@@ -1,9 +1,25 @@
+import asyncio
+import threading
+from http import HTTPStatus
+
+import pytest
+from fastapi import HTTPException
 from jwt import decode
 
 from maddr_api.security.access_token import (
     create_access_token,
 )
 from maddr_api.config.settings import Settings
+from maddr_api.models.account import Account
+from maddr_api.security.get_current_user import account_cache
+from maddr_api.security.hash_password import (
+    PasswordHashPool,
+    get_password_hash,
+    get_password_hash_async,
+    password_hash_pool,
+    verify_password_async,
+)
+from maddr_api.utils.cache import LRUCache
 
 settings = Settings()
 
@@ -19,3 +35,155 @@ def test_create_access_token():
 
     assert decoded_data["test"] == "test"
     assert "exp" in decoded_data
+
+
+def test_account_cache_evicts_least_recently_used():
+    cache = LRUCache(max_size=2, ttl_seconds=60)
+
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats()["hits"] == 3
+    assert cache.stats()["misses"] == 1
+
+
+def test_account_cache_expires_entries(monkeypatch):
+    cache = LRUCache(max_size=2, ttl_seconds=60)
+    now = 1000.0
+    monkeypatch.setattr("maddr_api.utils.cache.monotonic", lambda: now)
+
+    cache.set("a", 1)
+    now += 61
+
+    assert cache.get("a") is None
+    assert cache.stats()["size"] == 0
+
+
+def test_get_current_user_uses_account_cache(client, token):
+    headers = {"Authorization": f"Bearer {token}"}
+
+    client.post("/author/", json=dict(name="first"), headers=headers)
+    client.post("/author/", json=dict(name="second"), headers=headers)
+
+    assert account_cache.stats()["misses"] == 1
+    assert account_cache.stats()["hits"] == 1
+
+
+def test_get_current_principal_skips_account_lookup(client, token, book):
+    headers = {"Authorization": f"Bearer {token}"}
+
+    response = client.get(f"/book/{book.id}", headers=headers)
+
+    assert response.status_code == HTTPStatus.OK
+    assert account_cache.stats()["misses"] == 0
+
+
+def test_access_token_embeds_account_id_and_version(client, account, token):
+    decoded_data = decode(
+        token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
+    )
+
+    assert decoded_data["sub"] == account.username
+    assert decoded_data["uid"] == account.id
+    assert decoded_data["ver"] == 0
+
+
+def test_get_current_principal_rejects_token_without_claims(client, book):
+    token = create_access_token(dict(sub="testuser"))
+
+    response = client.get(
+        f"/book/{book.id}", headers={"Authorization": f"Bearer {token}"}
+    )
+
+    assert response.status_code == HTTPStatus.UNAUTHORIZED
+
+
+@pytest.mark.asyncio
+async def test_get_current_user_loads_account_by_id(client, session, account):
+    other_account = Account(
+        username="otheruser",
+        email="other@gmail.com",
+        password=get_password_hash("otherpass"),
+    )
+    session.add(other_account)
+    await session.commit()
+
+    # A token naming one account's username with another account's id must
+    # not authenticate as either of them.
+    token = create_access_token(dict(sub="otheruser", uid=account.id, ver=0))
+    missing_token = create_access_token(
+        dict(sub="testuser", uid=other_account.id + 1, ver=0)
+    )
+
+    response = client.post(
+        "/author/",
+        json=dict(name="author"),
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    missing = client.post(
+        "/author/",
+        json=dict(name="author"),
+        headers={"Authorization": f"Bearer {missing_token}"},
+    )
+
+    assert response.status_code == HTTPStatus.UNAUTHORIZED
+    assert missing.status_code == HTTPStatus.UNAUTHORIZED
+
+
+@pytest.mark.asyncio
+async def test_password_hash_pool_runs_hashing_off_the_event_loop():
+    hashed = await get_password_hash_async("secret")
+
+    assert await verify_password_async("secret", hashed)
+    assert not await verify_password_async("wrong", hashed)
+
+    stats = password_hash_pool.stats()
+    assert stats["in_flight"] == 0
+    assert stats["completed"] >= 3
+
+
+@pytest.mark.asyncio
+async def test_password_hash_pool_reports_queue_depth():
+    pool = PasswordHashPool(
+        executor_type="thread", max_workers=1, max_pending=3
+    )
+
+    hashes = await asyncio.gather(
+        pool.run(get_password_hash, "a"),
+        pool.run(get_password_hash, "b"),
+        pool.run(get_password_hash, "c"),
+    )
+    pool.shutdown()
+
+    assert len(hashes) == 3
+    assert pool.stats()["max_queue_depth"] == 2
+    assert pool.stats()["completed"] == 3
+
+
+@pytest.mark.asyncio
+async def test_password_hash_pool_rejects_work_beyond_max_pending():
+    pool = PasswordHashPool(
+        executor_type="thread", max_workers=1, max_pending=1
+    )
+    release = threading.Event()
+
+    running = asyncio.create_task(pool.run(release.wait))
+    await asyncio.sleep(0)
+
+    with pytest.raises(HTTPException) as exc_info:
+        await pool.run(get_password_hash, "b")
+
+    release.set()
+    await running
+    hashed = await pool.run(get_password_hash, "c")
+    pool.shutdown()
+
+    assert exc_info.value.status_code == HTTPStatus.SERVICE_UNAVAILABLE
+    assert hashed
+    assert pool.stats()["rejected"] == 1
+    assert pool.stats()["completed"] == 2
@@ -0,0 +1,54 @@
+import json
+
+from maddr_api.models.author import Author
+from maddr_api.models.book import Book
+from maddr_api.schemas.book import BookPublic
+from maddr_api.schemas.expand import BookWithAuthor
+from maddr_api.utils.serialization import (
+    encode_list,
+    encode_rows,
+    list_adapter,
+)
+
+
+def build_book(id, author=None):
+    book = Book(author_id=1, title=f"book {id}", publish_year=2000)
+    book.id = id
+    book.author = author
+
+    return book
+
+
+def test_encode_rows_matches_schema():
+    """
+    Test that direct row encoding produces the BookPublic representation.
+    """
+    books = [build_book(1), build_book(2)]
+
+    encoded = encode_rows(books, BookPublic.model_fields)
+
+    assert json.loads(encoded) == [
+        BookPublic.model_validate(book, from_attributes=True).model_dump()
+        for book in books
+    ]
+
+
+def test_encode_list_nested_schema():
+    """
+    Test that nested schemas are encoded through a cached TypeAdapter.
+    """
+    author = Author(name="writer")
+    author.id = 1
+
+    encoded = encode_list([build_book(1, author)], BookWithAuthor)
+
+    assert json.loads(encoded) == [
+        {
+            "title": "book 1",
+            "author_id": 1,
+            "publish_year": 2000,
+            "id": 1,
+            "author": {"name": "writer", "id": 1},
+        }
+    ]
+    assert list_adapter(BookWithAuthor) is list_adapter(BookWithAuthor)
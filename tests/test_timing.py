@@ -0,0 +1,102 @@
+import json
+import logging
+import re
+
+from maddr_api.utils.timing import RequestTimings, request_timings, timed
+
+
+def parse_server_timing(header):
+    metrics = {}
+
+    for item in header.split(","):
+        name, *params = item.strip().split(";")
+        metrics[name] = dict(param.split("=", 1) for param in params)
+
+    return metrics
+
+
+def test_timed_is_a_no_op_outside_requests():
+    """
+    Test that timing blocks outside a request record nothing.
+    """
+
+    with timed("db"):
+        pass
+
+    assert request_timings.get() is None
+
+
+def test_timed_adds_to_the_current_request():
+    """
+    Test that timing blocks add up per metric.
+    """
+    timings = RequestTimings()
+    token = request_timings.set(timings)
+
+    try:
+        with timed("serialize"):
+            pass
+        with timed("serialize"):
+            pass
+    finally:
+        request_timings.reset(token)
+
+    assert timings.seconds["serialize"] > 0
+    assert timings.seconds["db"] == 0
+
+
+def test_server_timing_header(client, token, book):
+    """
+    Test that responses report database and serialization time, with the
+    same statement count as X-Query-Count.
+    """
+
+    response = client.get(
+        "/book/", headers={"Authorization": f"Bearer {token}"}
+    )
+    metrics = parse_server_timing(response.headers["Server-Timing"])
+
+    assert set(metrics) == {
+        "db",
+        "auth",
+        "hash",
+        "serialize",
+        "queries",
+        "total",
+    }
+    assert metrics["queries"]["desc"] == '"1"'
+    assert response.headers["X-Query-Count"] == "1"
+    assert float(metrics["db"]["dur"]) > 0
+    assert float(metrics["serialize"]["dur"]) > 0
+    assert float(metrics["hash"]["dur"]) == 0
+
+
+def test_password_hashing_time(client, account):
+    """
+    Test that login reports the argon2 verification time.
+    """
+
+    response = client.post(
+        "/token/", data=dict(username=account.username, password="testpass")
+    )
+    metrics = parse_server_timing(response.headers["Server-Timing"])
+
+    assert float(metrics["hash"]["dur"]) > 0
+
+
+def test_access_log_line(client, caplog):
+    """
+    Test that every request writes a structured access log line.
+    """
+
+    with caplog.at_level(logging.INFO, logger="maddr_api.access"):
+        client.get("/account/99")
+
+    line = json.loads(caplog.records[-1].getMessage())
+
+    assert line["method"] == "GET"
+    assert line["path"] == "/account/99"
+    assert line["status"] == 404
+    assert line["queries"] >= 1
+    assert set(line) >= {"db_ms", "auth_ms", "hash_ms", "serialize_ms"}
+    assert re.fullmatch(r"\d+(\.\d+)?", str(line["total_ms"]))
@@ -1,5 +1,11 @@
 from http import HTTPStatus
 
+import pytest
+from sqlalchemy import select, update
+
+from maddr_api.models.account import Account
+from maddr_api.models.refresh_token import RefreshToken
+
 
 def test_create_token_successful(client, account):
     """
@@ -56,38 +62,184 @@ def test_create_token_nonexistent_user(client):
     assert response_data["detail"] == "Incorrect username or password."
 
 
-def test_refresh_token_successful(client, account):
+def test_create_token_returns_refresh_token(client, account):
     """
-    Test refreshing an access token successfully.
+    Test that generating an access token also issues a refresh token.
     """
 
     form_data = dict(username=account.username, password="testpass")
 
+    response = client.post("/token/", data=form_data)
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()["refresh_token"]
+
+
+def test_refresh_token_successful(client, refresh_token):
+    """
+    Test refreshing an access token successfully.
+    """
+
     response = client.post(
-        "/token/refresh-token",
-        data=form_data,
-        headers={"Content-Type": "application/x-www-form-urlencoded"},
+        "/token/refresh-token", json=dict(refresh_token=refresh_token)
     )
 
     assert response.status_code == HTTPStatus.OK
     response_data = response.json()
     assert "access_token" in response_data
     assert response_data["token_type"] == "bearer"
+    assert response_data["refresh_token"] != refresh_token
 
 
-def test_refresh_token_nonexistent_user(client):
+def test_refresh_token_does_not_verify_password(
+    client, refresh_token, monkeypatch
+):
     """
-    Test refreshing an access token for a nonexistent user.
+    Test that exchanging a refresh token never runs the password hasher.
     """
 
-    form_data = dict(username="nonexistent", password="somepass")
+    def fail(*args):
+        raise AssertionError("password hasher called")
+
+    monkeypatch.setattr("maddr_api.services.token.verify_password_async", fail)
 
     response = client.post(
-        "/token/refresh-token",
-        data=form_data,
-        headers={"Content-Type": "application/x-www-form-urlencoded"},
+        "/token/refresh-token", json=dict(refresh_token=refresh_token)
+    )
+
+    assert response.status_code == HTTPStatus.OK
+
+
+def test_refresh_token_rotation_rejects_reuse(client, refresh_token):
+    """
+    Test that a rotated refresh token cannot be reused and that reusing it
+    revokes the token that replaced it.
+    """
+
+    rotated = client.post(
+        "/token/refresh-token", json=dict(refresh_token=refresh_token)
+    ).json()["refresh_token"]
+
+    reused = client.post(
+        "/token/refresh-token", json=dict(refresh_token=refresh_token)
+    )
+    after_reuse = client.post(
+        "/token/refresh-token", json=dict(refresh_token=rotated)
+    )
+
+    assert reused.status_code == HTTPStatus.UNAUTHORIZED
+    assert reused.json() == {"detail": "Invalid refresh token."}
+    assert after_reuse.status_code == HTTPStatus.UNAUTHORIZED
+
+
+def test_refresh_token_invalid(client):
+    """
+    Test refreshing an access token with an unknown refresh token.
+    """
+
+    response = client.post(
+        "/token/refresh-token", json=dict(refresh_token="unknown")
     )
 
     assert response.status_code == HTTPStatus.UNAUTHORIZED
-    response_data = response.json()
-    assert response_data["detail"] == "Incorrect username or password."
+    assert response.json() == {"detail": "Invalid refresh token."}
+
+
+def test_revoke_refresh_token(client, refresh_token):
+    """
+    Test that a revoked refresh token can no longer be exchanged.
+    """
+
+    response = client.post(
+        "/token/revoke", json=dict(refresh_token=refresh_token)
+    )
+    refreshed = client.post(
+        "/token/refresh-token", json=dict(refresh_token=refresh_token)
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json() == {"message": "Refresh token revoked."}
+    assert refreshed.status_code == HTTPStatus.UNAUTHORIZED
+
+
+def test_refresh_token_of_deleted_account_is_rejected(
+    client, account, token, refresh_token
+):
+    """
+    Test that deleting an account drops its refresh tokens, so they cannot
+    sign in a new account that reuses the freed id.
+    """
+
+    client.delete(
+        f"/account/{account.id}",
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    newcomer = client.post(
+        "/account/",
+        json=dict(
+            username="newcomer",
+            email="newcomer@gmail.com",
+            password="newpass",
+        ),
+    )
+
+    response = client.post(
+        "/token/refresh-token", json=dict(refresh_token=refresh_token)
+    )
+
+    assert newcomer.json()["id"] == account.id
+    assert response.status_code == HTTPStatus.UNAUTHORIZED
+    assert response.json() == {"detail": "Invalid refresh token."}
+
+
+@pytest.mark.asyncio
+async def test_refresh_token_is_revoked_by_password_change(
+    client, session, account, token, refresh_token
+):
+    """
+    Test that changing the password revokes the refresh tokens issued
+    with the old one.
+    """
+
+    client.put(
+        f"/account/{account.id}",
+        headers={"Authorization": f"Bearer {token}"},
+        json=dict(
+            username=account.username,
+            email=account.email,
+            password="changed",
+        ),
+    )
+
+    response = client.post(
+        "/token/refresh-token", json=dict(refresh_token=refresh_token)
+    )
+    revoked = await session.scalars(select(RefreshToken.revoked))
+
+    assert response.status_code == HTTPStatus.UNAUTHORIZED
+    assert response.json() == {"detail": "Invalid refresh token."}
+    assert set(revoked.all()) == {True}
+
+
+@pytest.mark.asyncio
+async def test_refresh_token_rejects_outdated_token_version(
+    client, session, account, refresh_token
+):
+    """
+    Test that a refresh token issued for an older token_version is rejected
+    even when it was never revoked.
+    """
+
+    await session.execute(
+        update(Account)
+        .where(Account.id == account.id)
+        .values(token_version=Account.token_version + 1)
+    )
+    await session.commit()
+
+    response = client.post(
+        "/token/refresh-token", json=dict(refresh_token=refresh_token)
+    )
+
+    assert response.status_code == HTTPStatus.UNAUTHORIZED
+    assert response.json() == {"detail": "Invalid refresh token."}